@@ -0,0 +1,258 @@
+from __future__ import absolute_import, unicode_literals
+
+import json
+from multiprocessing.pool import ThreadPool
+
+from flask import request, current_app
+from flask.ext.restful import Resource, abort
+from werkzeug.wsgi import get_current_url
+
+from .resources import MongoEngineResource
+
+
+class BatchResource(Resource):
+    """
+    Executes multiple requests on the resources of the API in one HTTP
+    request.
+
+    Mount it on the API like any other resource:
+
+        api.add_resource(BatchResource, '/batch/')
+
+    The body of a POST request should be an array of sub-requests, each
+    an object with a `method`, a `path` (which can include a query
+    string) and optionally a `body` (any JSON value) and `headers`. The
+    sub-requests inherit the headers of the batch request, so they are
+    authenticated the same way. They are dispatched internally through
+    the `MongoEngineResource` that is registered for the path, without
+    going through the network stack.
+
+    The response is an array with a `{status, headers, body}` object
+    for every sub-request, in the same order. Consecutive GET requests
+    don't depend on each other, so they are executed concurrently. Other
+    requests are executed one by one, in order.
+    """
+
+    # The maximum number of sub-requests in one batch request
+    max_requests = 50
+
+    # The number of GET requests that are executed concurrently
+    max_workers = 4
+
+    # The methods that can be used in sub-requests
+    allowed_methods = ['GET', 'POST', 'PUT', 'PATCH', 'DELETE']
+
+    # The headers of the batch request that aren't inherited by the
+    # sub-requests.
+    excluded_headers = [
+        'Content-Type', 'Content-Length', 'Content-Encoding',
+        'Accept-Encoding'
+    ]
+
+    def post(self):
+
+        sub_requests = self._get_sub_requests()
+        results = []
+        concurrent = []
+
+        for sub_request in sub_requests:
+
+            if sub_request['method'] == 'GET':
+                concurrent.append(sub_request)
+            else:
+                results.extend(self._execute_concurrently(concurrent))
+                concurrent = []
+                results.append(self.execute(sub_request))
+
+        results.extend(self._execute_concurrently(concurrent))
+
+        return results
+
+    def _get_sub_requests(self):
+        """
+        Returns the validated sub-requests from the request data. Aborts
+        with a 400 if they are invalid.
+        """
+
+        data = request.get_json(force=True, silent=True)
+
+        if type(data) is not list:
+            abort(400, message="The request data should be an array.")
+
+        if len(data) > self.max_requests:
+            abort(400, message=(
+                "Too many requests, the maximum is {}".format(
+                    self.max_requests
+                )
+            ))
+
+        for i, sub_request in enumerate(data):
+
+            if (
+                type(sub_request) is not dict or
+                not isinstance(sub_request.get('path'), basestring) or
+                not sub_request['path'].startswith('/') or
+                sub_request.get('method') not in self.allowed_methods or
+                type(sub_request.get('headers', {})) is not dict
+            ):
+                abort(400, message=(
+                    "Request {} should be an object with a 'method' ({}), "
+                    "an absolute 'path' and optionally a 'body' and "
+                    "'headers'.".format(i, ', '.join(self.allowed_methods))
+                ))
+
+        return data
+
+    def _execute_concurrently(self, sub_requests):
+        """
+        Executes the `sub_requests` concurrently and returns their
+        results in the same order.
+        """
+
+        if len(sub_requests) < 2 or self.max_workers < 2:
+            return [self.execute(sub_request) for sub_request in sub_requests]
+
+        app = current_app._get_current_object()
+        environ = request.environ
+
+        pool = ThreadPool(min(self.max_workers, len(sub_requests)))
+
+        try:
+            return pool.map(
+                lambda sub_request: self.execute(sub_request, app, environ),
+                sub_requests
+            )
+        finally:
+            pool.close()
+            pool.join()
+
+    def execute(self, sub_request, app=None, environ=None):
+        """
+        Executes `sub_request` and returns its result.
+
+        The `app` and the `environ` of the batch request should be given
+        when it's executed outside the context of the batch request, in
+        another thread. An exception in the sub-request gives a result
+        with a 500 status, instead of failing the whole batch.
+        """
+
+        app = app or current_app._get_current_object()
+        environ = environ or request.environ
+
+        try:
+            return self._execute(sub_request, app, environ)
+        except Exception:
+            app.logger.exception(
+                "Exception in batch request {} {}".format(
+                    sub_request['method'], sub_request['path']
+                )
+            )
+            return {
+                'status': 500,
+                'headers': {},
+                'body': {'message': "Internal Server Error"}
+            }
+
+    def _execute(self, sub_request, app, environ):
+        """
+        Executes `sub_request` in a request context of `app`, based on
+        the `environ` of the batch request, and returns its result.
+        """
+
+        headers = self._get_headers(sub_request, environ)
+
+        if 'body' in sub_request:
+            data = json.dumps(sub_request['body'])
+        else:
+            data = None
+
+        with app.test_request_context(
+            sub_request['path'],
+            base_url=get_current_url(environ, root_only=True),
+            environ_base={'REMOTE_ADDR': environ.get('REMOTE_ADDR')},
+            method=sub_request['method'],
+            headers=headers,
+            data=data
+        ):
+
+            if not self._is_resource_request(app):
+                return {
+                    'status': 400,
+                    'headers': {},
+                    'body': {
+                        'message': (
+                            "The path '{}' is not a resource of this API."
+                            .format(sub_request['path'])
+                        )
+                    }
+                }
+
+            response = app.full_dispatch_request()
+
+            # Read the data within the request context, streamed
+            # responses need it.
+            body = response.get_data()
+
+        return {
+            'status': response.status_code,
+            'headers': dict(response.headers),
+            'body': self._get_body(response, body)
+        }
+
+    def _get_headers(self, sub_request, environ):
+        """
+        Returns the headers for `sub_request`, which are the headers of
+        the batch request updated with the headers of the sub-request.
+        """
+
+        excluded = [
+            'HTTP_' + header.upper().replace('-', '_')
+            for header in self.excluded_headers
+        ]
+
+        headers = {
+            key[5:].replace('_', '-').title(): value
+            for key, value in environ.items()
+            if key.startswith('HTTP_') and key not in excluded
+        }
+
+        headers['Content-Type'] = 'application/json'
+        headers.update(sub_request.get('headers', {}))
+
+        return headers
+
+    def _is_resource_request(self, app):
+        """
+        Returns `True` if the current request is routed to a
+        `MongoEngineResource`.
+        """
+
+        if request.routing_exception is not None:
+            return False
+
+        view_class = getattr(
+            app.view_functions.get(request.url_rule.endpoint),
+            'view_class',
+            None
+        )
+
+        return bool(
+            view_class and issubclass(view_class, MongoEngineResource)
+        )
+
+    def _get_body(self, response, body):
+        """
+        Returns the `body` of `response` as a JSON value, or as a string
+        if it's not JSON.
+        """
+
+        if not body:
+            return None
+
+        if response.mimetype == 'application/json':
+            try:
+                return json.loads(body)
+            except ValueError:
+                pass
+
+        return body.decode('utf-8', 'replace')
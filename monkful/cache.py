@@ -0,0 +1,202 @@
+from __future__ import absolute_import, unicode_literals
+
+import time
+import threading
+import cPickle as pickle
+from collections import OrderedDict
+
+
+class BaseCache(object):
+    """
+    Base class for the caches that can be used on a resource.
+
+    Subclasses should implement `_get()`, `set()`, `delete()`,
+    `counter()` and `incr()`. The number of hits and misses are counted
+    in `self.hits` and `self.misses`, by all threads of the process.
+    """
+
+    def __init__(self, timeout=None):
+        """
+        Initiates the cache. The `timeout` is the default number of
+        seconds an entry is valid. If it's `None` entries don't expire.
+        """
+
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self.stats_lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Returns the value for `key`, or `None` if there's no (valid)
+        entry for `key`.
+        """
+
+        value = self._get(key)
+
+        with self.stats_lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        return value
+
+    def stats(self):
+        """
+        Returns a dict with the number of hits and misses of the cache.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+    def _get(self, key):
+        raise NotImplementedError
+
+    def set(self, key, value, timeout=None):
+        """
+        Sets the entry for `key` to `value`. If `timeout` is not given,
+        the default timeout of the cache is used.
+        """
+        raise NotImplementedError
+
+    def delete(self, key):
+        """
+        Deletes the entry for `key`.
+        """
+        raise NotImplementedError
+
+    def counter(self, key):
+        """
+        Returns the value of the counter `key`, 0 if it doesn't exist.
+        """
+        raise NotImplementedError
+
+    def incr(self, key):
+        """
+        Increments the counter `key`, starting at 0, and returns the new
+        value. Counters never expire.
+        """
+        raise NotImplementedError
+
+
+class LRUCache(BaseCache):
+    """
+    An in-process cache that holds at most `max_size` entries. When it's
+    full, the least recently used entry is evicted. Counters are kept
+    separately and are never evicted.
+
+    The cache is shared by the threads of a process, but not by
+    multiple processes. Use a shared cache like `RedisCache` for that.
+    """
+
+    def __init__(self, max_size=1000, timeout=None):
+
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.counters = {}
+        self.lock = threading.Lock()
+
+        super(LRUCache, self).__init__(timeout)
+
+    def _get(self, key):
+
+        with self.lock:
+
+            try:
+                value, expires = self.entries.pop(key)
+            except KeyError:
+                return None
+
+            if expires is not None and expires < time.time():
+                return None
+
+            # Re-insert the entry so it's the most recently used one
+            self.entries[key] = (value, expires)
+
+            return value
+
+    def set(self, key, value, timeout=None):
+
+        if timeout is None:
+            timeout = self.timeout
+
+        if timeout is None:
+            expires = None
+        else:
+            expires = time.time() + timeout
+
+        with self.lock:
+
+            self.entries.pop(key, None)
+            self.entries[key] = (value, expires)
+
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def delete(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def counter(self, key):
+        return self.counters.get(key, 0)
+
+    def incr(self, key):
+
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + 1
+            return self.counters[key]
+
+    def clear(self):
+        """
+        Deletes all entries.
+        """
+        with self.lock:
+            self.entries.clear()
+
+
+class RedisCache(BaseCache):
+    """
+    A cache that is shared by multiple processes, backed by Redis.
+
+    Expects a `redis.StrictRedis` (or compatible) `client`. The values
+    are pickled, so only use a Redis server you trust. All keys are
+    prefixed with `prefix`.
+    """
+
+    def __init__(self, client, prefix='monkful:', timeout=None):
+
+        self.client = client
+        self.prefix = prefix
+
+        super(RedisCache, self).__init__(timeout)
+
+    def _get(self, key):
+
+        value = self.client.get(self.prefix + key)
+
+        if value is None:
+            return None
+        else:
+            return pickle.loads(value)
+
+    def set(self, key, value, timeout=None):
+
+        if timeout is None:
+            timeout = self.timeout
+
+        self.client.set(
+            self.prefix + key,
+            pickle.dumps(value, pickle.HIGHEST_PROTOCOL),
+            ex=timeout
+        )
+
+    def delete(self, key):
+        self.client.delete(self.prefix + key)
+
+    def counter(self, key):
+        return int(self.client.get(self.prefix + key) or 0)
+
+    def incr(self, key):
+        return self.client.incr(self.prefix + key)
@@ -0,0 +1,245 @@
+from __future__ import absolute_import, unicode_literals
+
+import json
+import struct
+import calendar
+from datetime import datetime, date, timedelta
+from bson import BSON, decode_all
+from bson.errors import BSONError
+from bson.objectid import ObjectId
+
+try:
+    import simplejson
+except ImportError:
+    simplejson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class Codec(object):
+    """
+    Base class for the codecs that encode the data of responses and
+    decode the data of requests.
+
+    Subclasses should set `mimetype` and implement `dumps()` and
+    `loads()`.
+    """
+
+    # The mimetype of the encoded data
+    mimetype = None
+
+    # The name of the format, used in error messages
+    name = None
+
+    # If `True`, the format supports ObjectIds and datetimes, so the
+    # serializers don't have to convert them to strings.
+    native = False
+
+    def dumps(self, data, **kwargs):
+        """
+        Returns `data` encoded.
+        """
+        raise NotImplementedError
+
+    def loads(self, data):
+        """
+        Returns the encoded `data` decoded. Raises a `ValueError` if the
+        data is invalid.
+        """
+        raise NotImplementedError
+
+
+class JSONCodec(Codec):
+    """
+    Encodes and decodes JSON.
+
+    Uses the `module` to do this, which defaults to the `json` module
+    of the standard library. Any module with a compatible `dumps()`
+    (that supports the `default` argument) and `loads()` can be used,
+    like `simplejson`, which is faster when its C speedups are
+    installed.
+
+    ObjectIds are encoded as strings and datetimes in ISO 8601 format,
+    the same way the serializer fields do. The serializers leave them
+    to the codec, so they aren't converted twice.
+    """
+
+    mimetype = 'application/json'
+    name = 'JSON'
+    native = True
+
+    def __init__(self, module=None):
+        self.module = module or json
+
+    def default(self, value):
+        """
+        Returns a JSON serializable version of `value`, which the JSON
+        module can't encode by itself.
+        """
+
+        if isinstance(value, ObjectId):
+            return unicode(value)
+        elif isinstance(value, (datetime, date)):
+            return value.isoformat()
+        else:
+            raise TypeError("{!r} is not JSON serializable".format(value))
+
+    def dumps(self, data, **kwargs):
+        return self.module.dumps(data, default=self.default, **kwargs)
+
+    def loads(self, data):
+        return self.module.loads(data)
+
+
+def fast_json_codec():
+    """
+    Returns a `JSONCodec` that uses `simplejson` if it's installed, and
+    the `json` module of the standard library otherwise.
+    """
+    return JSONCodec(simplejson)
+
+
+class BSONCodec(Codec):
+    """
+    Encodes and decodes BSON, with native ObjectIds and datetimes.
+
+    A document is encoded as a BSON document and a list of documents as
+    the concatenation of the BSON documents, like `mongodump` does.
+    Other values are wrapped in a document with a `value` key, because
+    BSON only supports documents at the top level.
+
+    The data of a request should be one BSON document. A single document
+    and a list of one document can't be told apart when they're
+    concatenated, so a list (like the documents of a POST or a JSON
+    Patch) should be wrapped in a document with only the `list_key`:
+    `{"items": [...]}`. It's decoded as the list.
+    """
+
+    mimetype = 'application/bson'
+    name = 'BSON'
+    native = True
+
+    # The key of the document that wraps a list in the data of requests
+    list_key = 'items'
+
+    def dumps(self, data, **kwargs):
+
+        if data is None:
+            return b''
+        elif isinstance(data, dict):
+            return BSON.encode(data)
+        elif isinstance(data, list) and all(
+            isinstance(item, dict) for item in data
+        ):
+            return b''.join(BSON.encode(item) for item in data)
+        else:
+            return BSON.encode({'value': data})
+
+    def loads(self, data):
+
+        try:
+            documents = decode_all(data, dict, False)
+        except BSONError, error:
+            raise ValueError(unicode(error))
+
+        if not documents:
+            return None
+
+        if len(documents) > 1:
+            raise ValueError(
+                "The data should be one document. Wrap a list in a document "
+                "with the key '{}'.".format(self.list_key)
+            )
+
+        document = documents[0]
+
+        if document.keys() == [self.list_key] and isinstance(
+            document[self.list_key], list
+        ):
+            return document[self.list_key]
+
+        return document
+
+
+class MsgPackCodec(Codec):
+    """
+    Encodes and decodes MessagePack. Requires the `msgpack` package.
+
+    ObjectIds are encoded as extension type 1, with the 12 bytes of the
+    ObjectId as data, and datetimes as extension type 2, with the
+    milliseconds since the epoch (UTC) as a big-endian signed 64-bit
+    integer, the same precision as MongoDB.
+    """
+
+    mimetype = 'application/msgpack'
+    name = 'MessagePack'
+    native = True
+
+    OBJECT_ID_TYPE = 1
+    DATETIME_TYPE = 2
+
+    EPOCH = datetime(1970, 1, 1)
+
+    def default(self, value):
+
+        if isinstance(value, ObjectId):
+            return msgpack.ExtType(self.OBJECT_ID_TYPE, value.binary)
+
+        elif isinstance(value, datetime):
+
+            if value.utcoffset() is not None:
+                value = value.replace(tzinfo=None) - value.utcoffset()
+
+            milliseconds = (
+                calendar.timegm(value.timetuple()) * 1000 +
+                value.microsecond // 1000
+            )
+
+            return msgpack.ExtType(
+                self.DATETIME_TYPE, struct.pack(b'>q', milliseconds)
+            )
+
+        else:
+            raise TypeError(
+                "{!r} is not MessagePack serializable".format(value)
+            )
+
+    def ext_hook(self, code, data):
+
+        if code == self.OBJECT_ID_TYPE:
+            return ObjectId(data)
+        elif code == self.DATETIME_TYPE:
+            return self.EPOCH + timedelta(
+                milliseconds=struct.unpack(b'>q', data)[0]
+            )
+        else:
+            return msgpack.ExtType(code, data)
+
+    def dumps(self, data, **kwargs):
+        return msgpack.packb(data, default=self.default, use_bin_type=True)
+
+    def loads(self, data):
+
+        try:
+            return msgpack.unpackb(data, ext_hook=self.ext_hook, raw=False)
+        except ValueError:
+            raise
+        except Exception, error:
+            raise ValueError(unicode(error))
+
+
+def available_binary_codecs():
+    """
+    Returns instances of the binary codecs whose dependencies are
+    installed.
+    """
+
+    codecs = [BSONCodec()]
+
+    if msgpack:
+        codecs.append(MsgPackCodec())
+
+    return codecs
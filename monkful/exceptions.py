@@ -20,6 +20,17 @@ class InvalidPageParamFormat(MonkfulError):
         super(InvalidPageParamFormat, self).__init__(*args, **kwargs)
 
 
+class InvalidPerPageParam(MonkfulError):
+
+    def __init__(self, param, *args, **kwargs):
+        self.param = param
+        self.message = (
+            "The param '{}' is an invalid number of items per page"
+            .format(param)
+        )
+        super(InvalidPerPageParam, self).__init__(*args, **kwargs)
+
+
 class PageOutOfRange(MonkfulError):
 
     def __init__(self, param, *args, **kwargs):
@@ -28,3 +39,20 @@ class PageOutOfRange(MonkfulError):
             "The page '{}' is out of range".format(param)
         )
         super(PageOutOfRange, self).__init__(*args, **kwargs)
+
+
+class PageBeyondMaxOffset(MonkfulError):
+
+    def __init__(self, param, *args, **kwargs):
+        self.param = param
+        self.message = (
+            "The page '{}' is beyond the maximum offset".format(param)
+        )
+        super(PageBeyondMaxOffset, self).__init__(*args, **kwargs)
+
+
+class InvalidPatch(MonkfulError):
+
+    def __init__(self, message, *args, **kwargs):
+        self.message = message
+        super(InvalidPatch, self).__init__(*args, **kwargs)
@@ -1,3 +1,12 @@
+import copy
+
+from mongoengine.queryset.field_list import QueryFieldList
+
+
+# The key of the text search score in the raw MongoDB documents
+TEXT_SCORE_KEY = '_text_score'
+
+
 def json_type(var):
     """
     Returns the JSON type for the given `var` where `var` is a variable or
@@ -32,3 +41,26 @@ def json_type(var):
         return 'null'
     else:
         return 'unknown'
+
+
+class TextScoreFieldList(QueryFieldList):
+    """
+    A MongoEngine field list (the projection of a queryset) that also
+    projects the score of a `$text` query, as `TEXT_SCORE_KEY`.
+
+    MongoDB requires the score to be projected to sort on it. The score
+    ends up in the `_data` of the documents, because it's not a field.
+    """
+
+    def __init__(self, field_list):
+        super(TextScoreFieldList, self).__init__()
+        self.__dict__.update(copy.deepcopy(field_list.__dict__))
+
+    def __nonzero__(self):
+        # Always project, even if all fields are loaded
+        return True
+
+    def as_dict(self):
+        field_list = super(TextScoreFieldList, self).as_dict()
+        field_list[TEXT_SCORE_KEY] = {'$meta': 'textScore'}
+        return field_list
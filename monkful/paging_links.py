@@ -16,9 +16,13 @@ class PagingLinks(object):
         params = copy(self.default_params)
         params.update({'page': page})
 
+        # Sort the params so the URLs are the same for every request,
+        # with the params (like the page size) in a predictable order.
         self.links.append({
             'rel': rel,
-            'url': '{}?{}'.format(self.base_url, urlencode(params))
+            'url': '{}?{}'.format(
+                self.base_url, urlencode(sorted(params.items()))
+            )
         })
 
     def get_links(self):
@@ -0,0 +1,646 @@
+from __future__ import absolute_import, unicode_literals
+
+from mongoengine import fields
+from mongoengine.errors import ValidationError
+
+from .serializers import fields as serializer_fields
+from .exceptions import InvalidPatch
+
+
+class PatchTarget(object):
+    """
+    The location in a document a patch operation points to.
+    """
+
+    def __init__(self, path):
+
+        # The path to the location in the patch document, used in error
+        # messages.
+        self.path = path
+
+        # The MongoDB (dot notation) path to the location
+        self.mongo_path = None
+
+        # The serializer field for the value at the location
+        self.serializer_field = None
+
+        # The MongoEngine field for the value at the location
+        self.document_field = None
+
+        # The MongoDB path of the list if the location is an item in a
+        # list.
+        self.list_path = None
+
+        # The list index if the location is an item in a list addressed
+        # by its index.
+        self.list_index = None
+
+        # The identifier condition (as a dict) if the location is an
+        # item in a list addressed by its identifier.
+        self.list_item_condition = None
+
+        # If the location is the end of a list (the `-` token)
+        self.list_append = False
+
+
+class PatchCompiler(object):
+    """
+    Compiles patch documents into one atomic MongoDB update.
+
+    Both JSON Patch (RFC 6902) and JSON Merge Patch (RFC 7396) documents
+    are supported. The paths in the patch documents are validated
+    against the serializer, the same way the URL of a resource is, and
+    the values are deserialized by the serializer fields.
+
+    The result of the compilation is available in `self.conditions` and
+    `self.update`, which can be used as the query and the update
+    document for a MongoDB update respectively.
+    """
+
+    def __init__(self, serializer, document):
+        """
+        Initiates the compiler with the `serializer` and the MongoEngine
+        `document` class that the patches will be applied on.
+        """
+
+        self.serializer = serializer
+        self.document = document
+
+        # Extra query conditions, generated by `test` operations
+        self.conditions = {}
+
+        # The MongoDB update document
+        self.update = {}
+
+        # The paths in the patch document of the MongoDB paths in the
+        # update document, used in error messages.
+        self.paths = {}
+
+        # The MongoDB path of the list that is used by the positional
+        # operator, and the `$elemMatch` conditions for it.
+        self.positional_list_path = None
+        self.positional_conditions = {}
+
+    def compile_json_patch(self, operations):
+        """
+        Compiles the JSON Patch `operations` (a list of dicts).
+
+        Will raise an `InvalidPatch` exception if an operation is
+        invalid or can't be executed atomically.
+        """
+
+        if type(operations) is not list:
+            raise InvalidPatch("A JSON Patch document should be an array.")
+
+        for operation in operations:
+
+            if type(operation) is not dict:
+                raise InvalidPatch(
+                    "A JSON Patch operation should be an object."
+                )
+
+            op = operation.get('op')
+            path = operation.get('path')
+
+            if path is None:
+                raise InvalidPatch(
+                    "The JSON Patch operation '{}' has no path.".format(op)
+                )
+
+            if op == 'add':
+                self._add(self._target(path), self._value(operation))
+            elif op == 'replace':
+                self._replace(self._target(path), self._value(operation))
+            elif op == 'remove':
+                self._remove(self._target(path))
+            elif op == 'test':
+                self._test(self._target(path), self._value(operation))
+            elif op in ('move', 'copy'):
+                raise InvalidPatch(
+                    "The JSON Patch operation '{}' is not supported.".format(op)
+                )
+            else:
+                raise InvalidPatch(
+                    "Invalid JSON Patch operation '{}'.".format(op)
+                )
+
+        self._finish()
+
+    def compile_merge_patch(self, data):
+        """
+        Compiles the JSON Merge Patch `data` (a dict).
+
+        Embedded documents are merged field by field, `null` values
+        remove the field and all other values replace the current value
+        of the field. Readonly and identifier fields are ignored.
+        """
+
+        if type(data) is not dict:
+            raise InvalidPatch("A JSON Merge Patch document should be an object.")
+
+        def merge(data, serializer, document, path, path_names):
+
+            for fieldname, value in data.items():
+
+                serializer_field = serializer._field(fieldname)
+
+                if serializer_field.readonly or serializer_field.identifier:
+                    # Ignore readonly and identifier fields, like a PUT
+                    # does.
+                    continue
+
+                document_field = self._document_field(document, fieldname)
+                mongo_path = path + [document_field.db_field]
+
+                if (
+                    isinstance(serializer_field, serializer_fields.DocumentField)
+                    and type(value) is dict
+                ):
+                    merge(
+                        value,
+                        serializer_field.sub_serializer,
+                        document_field.document_type,
+                        mongo_path,
+                        path_names + [fieldname]
+                    )
+                else:
+
+                    target = PatchTarget(
+                        '/' + '/'.join(path_names + [fieldname])
+                    )
+                    target.mongo_path = '.'.join(mongo_path)
+                    target.serializer_field = serializer_field
+                    target.document_field = document_field
+
+                    if value is None:
+                        self._remove(target)
+                    else:
+                        self._replace(target, value)
+
+        merge(data, self.serializer, self.document, [], [])
+        self._finish()
+
+    def _target(self, path):
+        """
+        Returns a `PatchTarget` for the JSON Pointer `path`.
+        """
+
+        if not isinstance(path, basestring) or not path.startswith('/'):
+            raise InvalidPatch("Invalid path '{}'.".format(path))
+
+        tokens = [
+            token.replace('~1', '/').replace('~0', '~')
+            for token in path.split('/')[1:]
+        ]
+
+        target = PatchTarget(path)
+        serializer = self.serializer
+        document = self.document
+        mongo_path = []
+
+        while tokens:
+
+            fieldname = tokens.pop(0)
+            serializer_field = serializer._field(fieldname)
+            document_field = self._document_field(document, fieldname)
+            mongo_path.append(document_field.db_field)
+
+            if isinstance(serializer_field, serializer_fields.ListField) and tokens:
+
+                target.list_path = '.'.join(mongo_path)
+                mongo_path.append(
+                    self._list_item_token(
+                        target, serializer_field, document_field, tokens
+                    )
+                )
+                serializer_field = serializer_field.sub_field
+                document_field = document_field.field
+
+            if tokens:
+
+                if not isinstance(
+                    serializer_field, serializer_fields.DocumentField
+                ):
+                    raise InvalidPatch("Invalid path '{}'.".format(path))
+
+                serializer = serializer_field.sub_serializer
+                document = document_field.document_type
+
+                # From here on the path points inside a list item, not
+                # to the item itself.
+                target.list_index = None
+                target.list_append = False
+
+            target.serializer_field = serializer_field
+            target.document_field = document_field
+
+        if target.serializer_field is None:
+            raise InvalidPatch("Invalid path '{}'.".format(path))
+
+        target.mongo_path = '.'.join(mongo_path)
+
+        return target
+
+    def _list_item_token(self, target, list_field, document_field, tokens):
+        """
+        Pops the token that points to an item in the list `list_field`
+        (with `document_field` as its MongoEngine field) from `tokens`
+        and returns the MongoDB path part for it.
+
+        Items in a list of documents with an identifier field are
+        addressed by their identifier, other items by their index. The
+        `-` token addresses the end of the list.
+        """
+
+        token = tokens.pop(0)
+
+        if token == '-':
+
+            if tokens:
+                raise InvalidPatch(
+                    "The '-' token can only be used at the end of a path."
+                )
+
+            target.list_append = True
+            return token
+
+        identifier_field = None
+
+        if isinstance(list_field.sub_field, serializer_fields.DocumentField):
+            for field in list_field.sub_field.sub_serializer._fields().values():
+                if field.identifier:
+                    identifier_field = field
+
+        if identifier_field:
+
+            if (
+                self.positional_list_path and
+                self.positional_list_path != target.list_path
+            ):
+                raise InvalidPatch(
+                    "Only items of one list can be addressed by their "
+                    "identifier in a single patch."
+                )
+
+            identifier_document_field = self._document_field(
+                document_field.field.document_type,
+                identifier_field.name
+            )
+            db_field = identifier_document_field.db_field
+            condition = {
+                db_field: identifier_document_field.to_mongo(
+                    identifier_field.deserialize(token, allow_readonly=True)
+                )
+            }
+
+            if (
+                self.positional_list_path and
+                self.positional_conditions.get(db_field) != condition[db_field]
+            ):
+                raise InvalidPatch(
+                    "Only one item of a list can be addressed by its "
+                    "identifier in a single patch."
+                )
+
+            self.positional_list_path = target.list_path
+            self.positional_conditions.update(condition)
+            target.list_item_condition = condition
+
+            return '$'
+
+        if not token.isdigit():
+            raise InvalidPatch("Invalid list index '{}'.".format(token))
+
+        target.list_index = int(token)
+
+        return token
+
+    def _document_field(self, document, fieldname):
+        """
+        Returns the MongoEngine field `fieldname` of `document`.
+        """
+
+        try:
+            return document._fields[fieldname]
+        except KeyError:
+            raise InvalidPatch(
+                "The field '{}' can't be patched.".format(fieldname)
+            )
+
+    def _value(self, operation):
+        """
+        Returns the value of the JSON Patch `operation`.
+        """
+
+        if 'value' not in operation:
+            raise InvalidPatch(
+                "The JSON Patch operation '{}' has no value."
+                .format(operation['op'])
+            )
+
+        return operation['value']
+
+    def _mongo_value(self, target, value, allow_readonly=False):
+        """
+        Deserializes `value` with the serializer field of `target` and
+        returns it in the format MongoDB expects.
+
+        Raises an `InvalidPatch` exception if the field is readonly,
+        unless `allow_readonly` is `True`.
+        """
+
+        if not allow_readonly and (
+            target.serializer_field.readonly or
+            target.serializer_field.identifier
+        ):
+            raise InvalidPatch(
+                "The field '{}' is readonly."
+                .format(target.serializer_field.master_field().name)
+            )
+
+        value = target.serializer_field.deserialize(
+            value, allow_readonly=allow_readonly
+        )
+
+        def to_mongo(document_field, value):
+
+            if value is None:
+                return None
+
+            if isinstance(document_field, fields.EmbeddedDocumentField):
+                document = document_field.document_type(**value)
+                document.validate()
+                return document.to_mongo()
+
+            elif isinstance(document_field, fields.ListField):
+                return [to_mongo(document_field.field, item) for item in value]
+
+            else:
+                document_field.validate(value)
+                return document_field.to_mongo(value)
+
+        try:
+            return to_mongo(target.document_field, value)
+        except ValidationError, error:
+            raise InvalidPatch(
+                "The value for '{}' did not validate: {}"
+                .format(target.mongo_path, error.message)
+            )
+
+    def _operator(self, operator, mongo_path, path):
+        """
+        Returns the dict for `operator` in the update document, to
+        change the value at `mongo_path` (`path` in the patch document)
+        with.
+
+        MongoDB can't change the same or overlapping paths with
+        different operators in one update, so this raises an
+        `InvalidPatch` exception if another operation in the patch
+        already does. Only a `$set` and an `$unset` of the same path
+        replace each other, because the last one wins anyway.
+        """
+
+        for other_operator, values in self.update.items():
+
+            for other_path in values.keys():
+
+                if other_path == mongo_path:
+
+                    if other_operator == operator:
+                        continue
+
+                    if set([operator, other_operator]) == set(
+                        ['$set', '$unset']
+                    ):
+                        del values[other_path]
+                        continue
+
+                elif not (
+                    other_path.startswith(mongo_path + '.') or
+                    mongo_path.startswith(other_path + '.')
+                ):
+                    continue
+
+                raise InvalidPatch(
+                    "The changes to '{}' and '{}' conflict, they can't be "
+                    "made in a single patch."
+                    .format(self.paths[other_path], path)
+                )
+
+            if not values:
+                del self.update[other_operator]
+
+        self.paths[mongo_path] = path
+
+        return self.update.setdefault(operator, {})
+
+    def _add(self, target, value):
+
+        value = self._mongo_value(target, value)
+
+        if target.list_append or target.list_index is not None:
+
+            pushes = self._operator('$push', target.list_path, target.path)
+            push = pushes.get(target.list_path)
+
+            if push is None:
+
+                push = pushes[target.list_path] = {'$each': []}
+
+                if target.list_index is not None:
+                    push['$position'] = target.list_index
+
+            if target.list_append and '$position' not in push:
+                push['$each'].append(value)
+
+            elif (
+                target.list_index is not None and '$position' in push and
+                push['$position'] <= target.list_index <=
+                push['$position'] + len(push['$each'])
+            ):
+                # The added items form one run in the list, starting at
+                # the `$position`, so an item added inside or right
+                # after that run is added to it.
+                push['$each'].insert(
+                    target.list_index - push['$position'], value
+                )
+
+            else:
+                raise InvalidPatch(
+                    "Items can only be added to one position of a list in "
+                    "a single patch, '{}' is at another position."
+                    .format(target.path)
+                )
+
+        else:
+            self._check_list_replace(target)
+            self._operator('$set', target.mongo_path, target.path)[
+                target.mongo_path
+            ] = value
+
+    def _replace(self, target, value):
+
+        if target.list_append:
+            raise InvalidPatch(
+                "The '-' token can only be used with the 'add' operation."
+            )
+
+        value = self._mongo_value(target, value)
+
+        if self._is_embedded_list_item(target):
+            self._replace_item_fields(target, value)
+        else:
+            self._check_list_replace(target)
+            self._operator('$set', target.mongo_path, target.path)[
+                target.mongo_path
+            ] = value
+
+    def _is_embedded_list_item(self, target):
+        """
+        Returns `True` if `target` is an (existing) embedded document in
+        a list.
+        """
+        return (
+            isinstance(
+                target.serializer_field, serializer_fields.DocumentField
+            ) and
+            target.list_path is not None and
+            not target.list_append and
+            target.mongo_path.rsplit('.', 1)[0] == target.list_path
+        )
+
+    def _replace_item_fields(self, target, value):
+        """
+        Replaces the embedded document in a list at `target` with the
+        MongoDB `value` field by field.
+
+        Only the writable fields are replaced, the identifier and
+        readonly fields keep their values, so the item keeps its
+        identity. Writable fields that aren't in `value` are removed.
+        """
+
+        document = target.document_field.document_type
+
+        for fieldname, field in (
+            target.serializer_field.sub_serializer._fields().items()
+        ):
+
+            if field.readonly or field.identifier:
+                continue
+
+            db_field = self._document_field(document, fieldname).db_field
+            mongo_path = '{}.{}'.format(target.mongo_path, db_field)
+            path = '{}/{}'.format(target.path, fieldname)
+
+            if db_field in value:
+                self._operator('$set', mongo_path, path)[mongo_path] = (
+                    value[db_field]
+                )
+            else:
+                self._operator('$unset', mongo_path, path)[mongo_path] = ''
+
+    def _check_list_replace(self, target):
+        """
+        Raises an `InvalidPatch` exception if `target` is a list of
+        embedded documents with identifier or readonly fields.
+
+        Replacing the whole list would give the items new identifiers
+        and default readonly values, so they should be changed one by
+        one instead.
+        """
+
+        if not isinstance(
+            target.serializer_field, serializer_fields.ListField
+        ) or not isinstance(
+            target.serializer_field.sub_field, serializer_fields.DocumentField
+        ):
+            return
+
+        if any(
+            field.identifier or field.readonly
+            for field in (
+                target.serializer_field.sub_field.sub_serializer
+                ._fields().values()
+            )
+        ):
+            raise InvalidPatch(
+                "The list '{}' can't be replaced as a whole, because that "
+                "would reset the identifiers and readonly fields of its "
+                "items. Add, replace or remove its items one by one "
+                "instead.".format(target.path)
+            )
+
+    def _remove(self, target):
+
+        if target.list_append:
+            raise InvalidPatch(
+                "The '-' token can only be used with the 'add' operation."
+            )
+
+        if target.list_index is not None:
+            raise InvalidPatch(
+                "List items can't be removed by index. Address the item by "
+                "its identifier instead."
+            )
+
+        if target.mongo_path.endswith('.$'):
+            # Pull the item out of the list instead of unsetting it,
+            # which would leave a `null` value in the list.
+            self._operator('$pull', target.list_path, target.path)[
+                target.list_path
+            ] = target.list_item_condition
+        else:
+            self._operator('$unset', target.mongo_path, target.path)[
+                target.mongo_path
+            ] = ''
+
+    def _test(self, target, value):
+
+        if target.list_append:
+            raise InvalidPatch(
+                "The '-' token can only be used with the 'add' operation."
+            )
+
+        value = self._mongo_value(target, value, allow_readonly=True)
+
+        if '$' in target.mongo_path.split('.'):
+            # Test inside the item matched by the positional operator,
+            # add it to the `$elemMatch` conditions of that item.
+            path = target.mongo_path.split('.$')[-1].lstrip('.')
+            if path:
+                self.positional_conditions[path] = value
+            else:
+                raise InvalidPatch(
+                    "List items addressed by identifier can only be "
+                    "tested field by field."
+                )
+        else:
+            self.conditions[target.mongo_path] = value
+
+    def _finish(self):
+        """
+        Adds the positional conditions to the query conditions and
+        validates the resulting update.
+        """
+
+        if self.positional_list_path:
+
+            if self.positional_list_path in self.update.get('$pull', {}):
+                # The `$pull` uses the identifier itself, so the list
+                # doesn't need to be matched.
+                if len(self.positional_conditions) > 1 or any(
+                    '.$' in path
+                    for operator in self.update.values()
+                    for path in operator
+                ):
+                    raise InvalidPatch(
+                        "A list item can't be removed and changed in a "
+                        "single patch."
+                    )
+            else:
+                self.conditions[self.positional_list_path] = {
+                    '$elemMatch': self.positional_conditions
+                }
+
+        if not self.update:
+            raise InvalidPatch("The patch doesn't contain any changes.")
@@ -2,26 +2,53 @@ from __future__ import absolute_import, unicode_literals, division
 
 import os
 import json
+import zlib
 from math import ceil
+from hashlib import md5
 
-from flask import request, make_response, render_template_string
+from flask import (
+    request, make_response, render_template_string, Response,
+    stream_with_context, current_app
+)
 from flask.ext.restful import Resource, abort
-from werkzeug.exceptions import BadRequest
+from werkzeug.exceptions import HTTPException
+from werkzeug.http import unquote_etag
+from bson import BSON
+from bson.errors import InvalidId
+from pymongo.errors import (
+    DuplicateKeyError, OperationFailure, BulkWriteError, ExecutionTimeout
+)
 from mongoengine import Document, fields
 from mongoengine.errors import NotUniqueError, DoesNotExist, ValidationError
 
+try:
+    from bson.raw_bson import RawBSONDocument
+    from bson.codec_options import CodecOptions
+except ImportError:
+    # PyMongo < 3.2
+    RawBSONDocument = None
+
 from .paging_links import PagingLinks
+from .patch import PatchCompiler
+from .codecs import JSONCodec, BSONCodec, available_binary_codecs
 from .serializers import fields as serializer_fields
 from .serializers.exceptions import (
-    UnknownField, ValueInvalidType, ValueInvalidFormat, DataInvalidType
+    SerializerError, UnknownField, ValueInvalidType, ValueInvalidFormat,
+    DataInvalidType
 )
 from .htmldoc import HtmlDoc
-from .helpers import json_type
+from .helpers import json_type, TextScoreFieldList, TEXT_SCORE_KEY
 from .exceptions import (
-    InvalidQueryField, InvalidPageParamFormat, PageOutOfRange
+    InvalidQueryField, InvalidPageParamFormat, InvalidPerPageParam,
+    PageOutOfRange, PageBeyondMaxOffset, InvalidPatch
 )
 
 
+# The content-codings responses can be compressed with, in order of
+# preference.
+COMPRESS_ENCODINGS = ['gzip', 'deflate']
+
+
 class MongoEngineResource(Resource):
 
     # The name of this resource
@@ -33,15 +60,203 @@ class MongoEngineResource(Resource):
     # Information about the URL params on this resource
     params_info = None
 
+    # An optional, lighter serializer for the documents in the listview.
+    # The `serializer` is still used for single documents, filters and
+    # changes. For the listview, only the fields of the list serializer
+    # are fetched from MongoDB.
+    list_serializer = None
+
+    # The maximum number of milliseconds MongoDB may spend on a query of
+    # the resource. If a query takes longer, MongoDB aborts it and the
+    # request gets a 503 response. If `None`, queries are not limited.
+    max_time_ms = None
+
+    # The maximum number of milliseconds for the queries that find
+    # documents and for the queries that count the documents of the
+    # listview (for paging). If `None`, `max_time_ms` is used.
+    find_max_time_ms = None
+    count_max_time_ms = None
+
     # The amount of items on one page of the listview of a document
     items_per_page = 100
 
+    # The maximum amount of items on one page that the client can
+    # request with the `per_page_query_param`.
+    max_items_per_page = 1000
+
+    # The maximum number of documents MongoDB skips to get a page of the
+    # listview. Skipping is slow for deep pages, so pages beyond it are
+    # refused. If `None`, all pages can be requested.
+    max_offset = None
+
+    # The maximum number of comma separated identifiers in a GET request
+    # for multiple documents, like `/articles/<id1>,<id2>,<id3>/`.
+    max_identifiers = 100
+
     # The query param used for paging
     page_number_query_param = 'page'
 
+    # The query param with which the client can choose the amount of
+    # items on one page, instead of `items_per_page`.
+    per_page_query_param = 'per_page'
+
+    # The query param that confirms a DELETE or PATCH request on the
+    # listview, which deletes or updates all documents that match the
+    # filters. Its value should be `true`.
+    confirm_query_param = 'confirm'
+
+    # The cache for the serialized pages of the listview, an instance of
+    # one of the caches in `monkful.cache`. If `None`, the pages are not
+    # cached. Cached pages are invalidated when this or another resource
+    # with the same cache changes a document of the same collection.
+    list_cache = None
+
+    # The number of seconds a cached page of the listview is valid
+    list_cache_timeout = 60
+
+    # The cache for the base documents that are fetched by identifier,
+    # an instance of one of the caches in `monkful.cache`. The raw
+    # MongoDB data of the documents is cached, so subsequent requests on
+    # the same document don't have to query MongoDB. If `None`, the
+    # documents are not cached. Cached documents are invalidated when
+    # this or another resource with the same cache changes them.
+    document_cache = None
+
+    # The number of seconds a cached document is valid
+    document_cache_timeout = 60
+
+    # The number of generation counters the cached documents of a
+    # collection are spread over. A change of a document invalidates
+    # the cached documents that share its counter.
+    document_cache_generations = 64
+
+    # If `True`, ETags are added to the responses of GET requests, and
+    # requests with a matching `If-None-Match` header get a 304 response
+    # without the data being serialized. Documents get strong ETags and
+    # pages of the listview weak ETags.
+    etags = False
+
+    # The numeric version field the ETags of the documents are based on.
+    # It's incremented atomically on every change of a document through
+    # the resource. A GET request on a document with `If-None-Match`
+    # only queries this field to check if the document was modified, and
+    # the `If-Match` header of PUT, PATCH and DELETE requests is checked
+    # in the same atomic operation that changes the document. If `None`,
+    # the ETag is a hash of the raw MongoDB data of the document.
+    etag_field = None
+
+    # If `True`, pages of the listview are streamed to the client in a
+    # chunked response, document by document, instead of being built in
+    # memory first. Pages that are cached or get an ETag based on their
+    # data are not streamed, because these need the whole page.
+    stream_lists = False
+
+    # The number of documents that are fetched from MongoDB per batch
+    # when a page of the listview is streamed.
+    stream_batch_size = 100
+
+    # If `True`, all documents of the listview that match the filters
+    # can be exported as newline-delimited JSON (NDJSON), on the
+    # `!!export` path or with an `Accept: application/x-ndjson` header.
+    allow_export = False
+
+    # The number of documents that are fetched from MongoDB per batch
+    # during an export.
+    export_batch_size = 1000
+
+    # If `True`, documents can be imported by POSTing newline-delimited
+    # JSON (NDJSON, one document per line) to the listview, with the
+    # `application/x-ndjson` content type. The request body is parsed
+    # line by line and the result of each line is streamed back.
+    allow_import = False
+
+    # The number of documents that are inserted in MongoDB per batch
+    # during an import.
+    import_batch_size = 500
+
+    # The maximum size in bytes of a line of an import. Longer lines
+    # are skipped without reading them into memory, and get a 413
+    # result.
+    max_import_line_size = 1024 * 1024
+
+    # If `True`, the documents of the listview that match the filters
+    # can be aggregated on the `!!aggregate` path: counted per value of
+    # a field (`group_by`) with numeric `metrics` like the average of a
+    # field.
+    allow_aggregate = False
+
+    # The maximum number of milliseconds MongoDB may spend on an
+    # aggregation. If `None`, `max_time_ms` is used.
+    aggregate_max_time_ms = 5000
+
+    # The maximum number of groups an aggregation returns, the groups
+    # with the most documents first.
+    aggregate_max_groups = 100
+
+    # If `True`, the listview can be searched with the `q` query param
+    # (see `text_search_query_param`), with a MongoDB `$text` query, which
+    # requires a text index on the collection. The results are sorted by
+    # their relevance. The search also limits the documents of exports,
+    # distinct values and aggregations.
+    allow_text_search = False
+
+    # The query param with the text to search for
+    text_search_query_param = 'q'
+
+    # If set, the text search score of the documents is added to the
+    # documents in the listview with this name.
+    text_score_field = None
+
+    # The codec that decodes the JSON data of requests and encodes the
+    # JSON data of responses. Use `JSONCodec(simplejson)` (or
+    # `fast_json_codec()`) for faster encoding and decoding.
+    json_codec = JSONCodec()
+
+    # The codecs for binary formats that clients can use instead of
+    # JSON, with the `Accept` and `Content-Type` headers. By default
+    # BSON, and MessagePack if the `msgpack` package is installed.
+    binary_codecs = available_binary_codecs()
+
+    # If `True`, pages of the listview that are requested as BSON are
+    # sent as the raw BSON documents from MongoDB, without decoding and
+    # serializing them, if the serializer outputs the fields of the
+    # documents unchanged. The documents are sent as they are stored,
+    # so with the `_id` field instead of `id`. With PyMongo 3.2 or
+    # newer the bytes from MongoDB are copied straight into the
+    # response, with older versions the documents are decoded and
+    # encoded by the C extension of PyMongo.
+    raw_bson_passthrough = False
+
+    # If `True`, responses are compressed with gzip or deflate if the
+    # client accepts it (with the `Accept-Encoding` header). Request
+    # bodies compressed with gzip or deflate (indicated with the
+    # `Content-Encoding` header) are always accepted.
+    compress = False
+
+    # The minimum size in bytes of a response body to compress it.
+    # Streamed responses are always compressed, chunk by chunk.
+    compress_min_size = 1024
+
+    # The compression level, from 1 (fastest) to 9 (smallest)
+    compress_level = 6
+
+    # The maximum size in bytes of a compressed request body after
+    # decompression, except for NDJSON imports, which are decompressed
+    # line by line.
+    max_decompressed_size = 64 * 1024 * 1024
+
     # The content type this resource accepts
     accepted_content_type = 'application/json'
 
+    # The content types this resource accepts for PATCH requests. A
+    # JSON array is treated as a JSON Patch (RFC 6902) and a JSON object
+    # as a JSON Merge Patch (RFC 7396).
+    accepted_patch_content_types = [
+        'application/json-patch+json',
+        'application/merge-patch+json',
+        'application/json'
+    ]
+
     # The charset this resource accepts
     accepted_charset = 'charset=utf-8'
 
@@ -57,12 +272,29 @@ class MongoEngineResource(Resource):
         # Instantiate the serializer
         self.serializer = self.serializer()
 
+        # Instantiate the list serializer if there is one
+        if self.list_serializer:
+            self.list_serializer = self.list_serializer()
+
         if not self.name:
             self.name = self.__class__.__name__
 
+        # Copy the headers, so headers that are added during a request
+        # don't end up in the responses of other requests.
+        self.headers = dict(self.headers)
+
+        # The codec for the data of the response
+        self.response_codec = self.json_codec
+
         # A list of reserved query params. These params can't be used
         # for filters.
-        self.reserved_query_params = [self.page_number_query_param]
+        self.reserved_query_params = [
+            self.page_number_query_param, self.per_page_query_param,
+            self.confirm_query_param
+        ]
+
+        if self.allow_text_search:
+            self.reserved_query_params.append(self.text_search_query_param)
 
         super(MongoEngineResource, self).__init__(*args, **kwargs)
 
@@ -87,7 +319,7 @@ class MongoEngineResource(Resource):
         context = {
             'name': self.name,
             'docs_url': '{}!!'.format(self.get_base_url()),
-            'data': json.dumps(data, indent=4)
+            'data': self.json_codec.dumps(data, indent=4)
         }
 
         return render_template_string(template, **context)
@@ -97,20 +329,225 @@ class MongoEngineResource(Resource):
         self.init_target_path(*args, **kwargs)
 
         if len(self.target_path) == 1 and self.target_path[0] == '!!':
-            return self.html_doc()
+            response = self.html_doc()
         else:
 
             self.authenticate()
             self.check_request_content_type_header()
+            self.response_codec = self.get_response_codec()
+
+            try:
+
+                if self._export_requested():
+                    response = self.export()
+                elif self._distinct_requested():
+                    response = self.distinct(self.target_path[1:])
+                elif self._aggregate_requested():
+                    response = self.aggregate()
+                else:
+
+                    self._init_target()
+
+                    response = super(
+                        MongoEngineResource, self
+                    ).dispatch_request(
+                        *args, **kwargs
+                    )
+
+            except ExecutionTimeout:
+                abort(503, message=(
+                    "The query took too long. Try to narrow it down with "
+                    "(other) filters."
+                ))
+
+        return self.compress_response(response)
+
+    def compress_response(self, response):
+        """
+        Compresses the body of `response` with the encoding the client
+        prefers, if `compress` is `True` and the body is not smaller
+        than `compress_min_size`. Streamed bodies are compressed while
+        they are streamed, every chunk is flushed so the client gets it
+        right away. The encoding is added to the ETag of the response,
+        because the compressed body is another representation.
+
+        Returns the response.
+        """
+
+        if (
+            not self.compress or not isinstance(response, Response) or
+            response.status_code in (204, 304) or
+            'Content-Encoding' in response.headers
+        ):
+            return response
+
+        response.vary.add('Accept-Encoding')
+
+        if not request.accept_encodings:
+            return response
+
+        encoding = request.accept_encodings.best_match(COMPRESS_ENCODINGS)
+
+        if not encoding:
+            return response
+
+        if encoding == 'gzip':
+            # Add 16 to the window size to write a gzip header
+            compressor = zlib.compressobj(
+                self.compress_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+            )
+        else:
+            compressor = zlib.compressobj(self.compress_level)
+
+        if response.is_streamed:
+
+            def compress_chunks(chunks):
+
+                for chunk in chunks:
+
+                    if isinstance(chunk, unicode):
+                        chunk = chunk.encode('utf-8')
+
+                    yield (
+                        compressor.compress(chunk) +
+                        compressor.flush(zlib.Z_SYNC_FLUSH)
+                    )
+
+                yield compressor.flush()
+
+            response.response = compress_chunks(response.response)
 
-            self._init_target()
+        else:
+
+            data = response.get_data()
+
+            if len(data) < self.compress_min_size:
+                return response
+
+            response.set_data(compressor.compress(data) + compressor.flush())
 
-            return super(
-                MongoEngineResource, self
-            ).dispatch_request(
-                *args, **kwargs
+        response.headers['Content-Encoding'] = encoding
+
+        if 'ETag' in response.headers:
+            etag, weak = unquote_etag(response.headers['ETag'])
+            response.headers['ETag'] = '{}"{}-{}"'.format(
+                'W/' if weak else '', etag, encoding
             )
 
+        return response
+
+    def _join_chunks(self, chunks, size):
+        """
+        Returns an iterator over the `chunks` of a streamed body joined
+        per `size` chunks, so a batch of documents is sent (and
+        compressed and flushed) at once.
+        """
+
+        batch = []
+
+        for chunk in chunks:
+
+            if isinstance(chunk, unicode):
+                chunk = chunk.encode('utf-8')
+
+            batch.append(chunk)
+
+            if len(batch) >= size:
+                yield b''.join(batch)
+                batch = []
+
+        if batch:
+            yield b''.join(batch)
+
+    def _etag_matches(self, etags, etag, weak=False):
+        """
+        Returns `True` if the `etags` of an `If-Match` or `If-None-Match`
+        header contain `etag`, also with the encoding suffix that
+        `compress_response()` adds to it. Uses the weak comparison if
+        `weak` is `True`.
+        """
+
+        for candidate in [etag] + [
+            '{}-{}'.format(etag, encoding) for encoding in COMPRESS_ENCODINGS
+        ]:
+            if (
+                etags.contains_weak(candidate) if weak else
+                etags.contains(candidate)
+            ):
+                return True
+
+        return False
+
+    def _strip_etag_encoding(self, etag):
+        """
+        Returns `etag` without the encoding suffix that
+        `compress_response()` adds to the ETags of compressed responses.
+        """
+
+        for encoding in COMPRESS_ENCODINGS:
+            if etag.endswith('-' + encoding):
+                return etag[:-len(encoding) - 1]
+
+        return etag
+
+    def _export_requested(self):
+        """
+        Returns `True` if the request is for an export of the listview.
+
+        Calls `abort(404)` if the `!!export` path is requested while
+        exports aren't allowed.
+        """
+
+        if self.target_path == ['!!export']:
+
+            if not self.allow_export or self.get_base_document():
+                abort(404, message="This resource can't be exported.")
+
+            if request.method != 'GET':
+                abort(405, message="Exports are only available with GET.")
+
+            return True
+
+        return (
+            self.allow_export and request.method == 'GET' and
+            not self.target_path and not self.get_base_document() and
+            request.accept_mimetypes.best == 'application/x-ndjson'
+        )
+
+    def _distinct_requested(self):
+        """
+        Returns `True` if the request is for the distinct values of a
+        field, on the `!!distinct/<field>` path.
+        """
+
+        if self.target_path[:1] != ['!!distinct']:
+            return False
+
+        if self.get_base_document():
+            abort(404, message="This resource has no distinct values.")
+
+        if request.method != 'GET':
+            abort(405, message="Distinct values are only available with GET.")
+
+        return True
+
+    def _aggregate_requested(self):
+        """
+        Returns `True` if the request is for an aggregation of the
+        listview, on the `!!aggregate` path.
+        """
+
+        if self.target_path != ['!!aggregate']:
+            return False
+
+        if not self.allow_aggregate or self.get_base_document():
+            abort(404, message="This resource can't be aggregated.")
+
+        if request.method != 'GET':
+            abort(405, message="Aggregations are only available with GET.")
+
+        return True
+
     def init_target_path(self, *args, **kwargs):
 
         self.target_path = []
@@ -133,10 +570,68 @@ class MongoEngineResource(Resource):
 
         self.headers.update(extra_headers)
 
-        if 'text/html' in dict(request.accept_mimetypes).keys():
+        if self._html_requested():
             return make_response(self.html_output(data))
         else:
-            return data, status_code, self.headers
+            return self.output(data, status_code, self.headers)
+
+    def output(self, data, status_code, headers):
+        """
+        Returns a response with `data` encoded by the `response_codec`.
+
+        In debug mode JSON is indented and the keys are sorted, like
+        Flask-RESTful does.
+        """
+
+        codec = self.response_codec
+
+        if codec is self.json_codec and current_app.debug:
+            dumped = codec.dumps(data, indent=4, sort_keys=True) + '\n'
+        else:
+            dumped = codec.dumps(data)
+
+        response = make_response(dumped, status_code)
+        response.headers.extend(headers)
+        response.headers['Content-Type'] = codec.mimetype
+
+        return response
+
+    def get_response_codec(self):
+        """
+        Returns the codec for the format the client prefers according
+        to the `Accept` header of the request. Defaults to the
+        `json_codec`.
+        """
+
+        codecs = [self.json_codec] + self.binary_codecs
+        mimetype = request.accept_mimetypes.best_match(
+            [codec.mimetype for codec in codecs],
+            default=self.json_codec.mimetype
+        )
+
+        for codec in codecs:
+            if codec.mimetype == mimetype:
+                return codec
+
+    def get_request_codec(self):
+        """
+        Returns the codec for the format of the data of the request,
+        based on the `Content-Type` header. Defaults to the
+        `json_codec`, which also handles the JSON based content types of
+        PATCH.
+        """
+
+        for codec in self.binary_codecs:
+            if codec.mimetype == request.mimetype:
+                return codec
+
+        return self.json_codec
+
+    def _html_requested(self):
+        """
+        Returns `True` if the client requested an HTML page.
+        """
+        return 'text/html' in dict(request.accept_mimetypes).keys()
 
     def authenticate(self):
         """
@@ -165,15 +660,32 @@ class MongoEngineResource(Resource):
         is correct.
         """
 
-        if (
-            request.method in ('POST', 'PUT') and
-            content_type != self.accepted_content_type
-        ):
+        if request.method in ('POST', 'PUT'):
+
+            accepted_content_types = [self.accepted_content_type] + [
+                codec.mimetype for codec in self.binary_codecs
+            ]
+
+            if request.method == 'POST' and self.allow_import:
+                accepted_content_types.append('application/x-ndjson')
+
+        elif request.method == 'PATCH':
+            accepted_content_types = self.accepted_patch_content_types
+        else:
+            return
+
+        if content_type not in accepted_content_types:
 
             abort(415, message=(
                 "Invalid Content-Type header '{}'. This resource "
-                "only supports 'application/json'."
-                .format(content_type)
+                "only supports {}."
+                .format(
+                    content_type,
+                    ', '.join(
+                        "'{}'".format(accepted_content_type)
+                        for accepted_content_type in accepted_content_types
+                    )
+                )
             ))
 
     def check_request_charset(self, charset):
@@ -235,6 +747,10 @@ class MongoEngineResource(Resource):
         self.target_document = None
         self.is_base_document = True
         self.target_serializer = self.serializer
+        self.target_identifier = None
+        self.target_documents = None
+        self.target_identifiers = None
+        self.not_modified = False
         self.base_document = self.get_base_document()
 
         if self.base_document:
@@ -253,8 +769,49 @@ class MongoEngineResource(Resource):
 
                 identifier = target_path[0]
 
+                if self._is_multiple_identifiers(target_path):
+                    # Get all requested documents in one query
+                    self.target_documents = (
+                        self._get_base_documents_by_identifiers(
+                            self._split_identifiers(identifier)
+                        )
+                    )
+                    self.target_list = None
+                    return
+
+                if (
+                    request.method == 'DELETE' and len(target_path) == 1 and
+                    ',' in identifier
+                ):
+                    # Delete the documents without loading them
+                    self.target_identifiers = self._get_identifier_keys(
+                        self._split_identifiers(identifier)
+                    )
+                    self.target_list = self.get_base_list_by_identifiers(
+                        self.target_identifiers
+                    )
+                    return
+
+                self.target_identifier = identifier
+
+                if request.method == 'PATCH' and len(target_path) == 1:
+                    # A PATCH on a base document is executed as an
+                    # atomic update, so there's no need to load the
+                    # document.
+                    self.target_list = None
+                    return
+
+                if (
+                    request.method == 'GET' and len(target_path) == 1 and
+                    self._is_not_modified_version(identifier)
+                ):
+                    # The document wasn't modified, so there's no need
+                    # to load it.
+                    self.not_modified = True
+                    return
+
                 try:
-                    self.base_document = self.get_base_document_by_identifier(
+                    self.base_document = self._get_base_document_by_identifier(
                         identifier
                     )
                 except DoesNotExist:
@@ -302,9 +859,24 @@ class MongoEngineResource(Resource):
                         ):
                             if field.identifier:
                                 identifier_field = fieldname
-                                identifier = field.deserialize(identifier)
 
-                        if identifier_field:
+                                if not self._is_multiple_identifiers(
+                                    target_path
+                                ):
+                                    identifier = field.deserialize(identifier)
+
+                        if identifier_field and self._is_multiple_identifiers(
+                            target_path
+                        ):
+
+                            self.target_documents = self._get_list_items(
+                                self.target_list,
+                                identifier_field,
+                                self._split_identifiers(target_path[0])
+                            )
+                            self.target_list = None
+
+                        elif identifier_field:
 
                             for i, document in enumerate(self.target_list):
                                 if getattr(document, identifier_field) == identifier:
@@ -369,6 +941,112 @@ class MongoEngineResource(Resource):
 
                 init_deep_target(target_path, 0)
 
+    def _is_multiple_identifiers(self, target_path):
+        """
+        Returns `True` if the first item of `target_path` contains
+        multiple comma separated identifiers, which is supported for the
+        last item of the path of a GET request.
+        """
+        return (
+            request.method == 'GET' and len(target_path) == 1 and
+            ',' in target_path[0]
+        )
+
+    def _split_identifiers(self, identifiers):
+        """
+        Returns a list of the comma separated `identifiers`. Aborts with
+        a 400 if there are more than `max_identifiers`.
+        """
+
+        identifiers = identifiers.split(',')
+
+        if len(identifiers) > self.max_identifiers:
+            abort(400, message=(
+                "Too many identifiers, the maximum is {}".format(
+                    self.max_identifiers
+                )
+            ))
+
+        return identifiers
+
+    def _get_base_documents_by_identifiers(self, identifiers):
+        """
+        Returns a list of `(identifier, document)` tuples for the base
+        documents with `identifiers`, in the requested order. The
+        document is `None` if there's no document with the identifier.
+
+        The documents are fetched with one query, from the queryset
+        returned by `get_base_list_by_identifiers()`.
+        """
+
+        keys = self._get_identifier_keys(identifiers)
+        documents = {
+            document.pk: document
+            for document in self.get_base_list_by_identifiers(keys)
+        }
+
+        return [
+            (identifier, documents.get(key))
+            for identifier, key in zip(identifiers, keys)
+        ]
+
+    def _get_identifier_keys(self, identifiers):
+        """
+        Returns the primary key values for the base document
+        `identifiers`. Aborts with a 400 if an identifier is invalid.
+        """
+
+        id_field = self.document._fields[self.document._meta['id_field']]
+        keys = []
+
+        for identifier in identifiers:
+
+            try:
+                key = id_field.to_python(identifier)
+                id_field.validate(key)
+            except (ValidationError, InvalidId):
+                abort(400, message=(
+                    "The formatting for the identifier '{}' is invalid".format(
+                        identifier
+                    )
+                ))
+
+            keys.append(key)
+
+        return keys
+
+    def _get_list_items(self, items, identifier_field, identifiers):
+        """
+        Returns a list of `(identifier, item)` tuples for the items in
+        the list of embedded documents `items` with `identifiers`, in
+        the requested order. The item is `None` if there's no item with
+        the identifier.
+        """
+
+        field = self.target_serializer._field(identifier_field)
+        result = []
+
+        for identifier in identifiers:
+
+            try:
+                value = field.deserialize(identifier)
+            except SerializerError:
+                abort(400, message=(
+                    "The formatting for the identifier '{}' is invalid".format(
+                        identifier
+                    )
+                ))
+
+            result.append((identifier, next(
+                (
+                    item for item in items
+                    if getattr(item, identifier_field) == value
+                ),
+                None
+            )))
+
+        return result
+
     def get_base_document(self):
         """
         Returns the base document.
@@ -385,15 +1063,119 @@ class MongoEngineResource(Resource):
         Returns the base document that matches the provided
         `identifier`.
 
-        By default matches on the `id` field of the document. You can
-        overwrite this method if you want to alter this behavior.
+        By default gets the document from the queryset returned by
+        `get_base_list_by_identifier()`. You can overwrite this method
+        if you want to alter this behavior.
 
         This method is allowed to throw these MongoEngine exceptions:
             - DoesNotExist
             - ValidationError
         These will be catched and handled correctly.
         """
-        return self.target_document_obj.objects.get(id=identifier)
+        document = self._limit_time(
+            self.get_base_list_by_identifier(identifier)
+        ).first()
+
+        if document is None:
+            raise DoesNotExist(
+                "The document with identifier '{}' does not exist.".format(
+                    identifier
+                )
+            )
+
+        return document
+
+    def _get_base_document_by_identifier(self, identifier):
+        """
+        Returns the base document that matches the provided
+        `identifier` from `document_cache`, or from
+        `get_base_document_by_identifier()` if it's not cached yet.
+        """
+
+        if not self.document_cache:
+            return self.get_base_document_by_identifier(identifier)
+
+        # Get the key before the document is fetched, so a document that
+        # is changed in the meantime is stored under a generation that
+        # is already invalidated.
+        key = self._document_cache_key(identifier)
+        son = self.document_cache.get(key)
+
+        if son is None:
+            document = self.get_base_document_by_identifier(identifier)
+            self.document_cache.set(
+                key, document.to_mongo(), self.document_cache_timeout
+            )
+        else:
+            document = self.document._from_son(son)
+
+        return document
+
+    def _document_cache_key(self, identifier):
+        """
+        Returns the key for the document with `identifier` in
+        `document_cache`.
+        """
+        return 'document:{}:{}.{}:{}'.format(
+            self.document._get_collection_name(),
+            self.document_cache.counter(self._document_cache_generation_key()),
+            self.document_cache.counter(
+                self._document_cache_generation_key(identifier)
+            ),
+            identifier
+        )
+
+    def _document_cache_generation_key(self, identifier=None):
+        """
+        Returns the key of a counter in `document_cache` that is part of
+        the keys of the cached documents.
+
+        Without an `identifier` this is the counter of the collection,
+        incrementing it invalidates all cached documents of the
+        collection. With an `identifier` it's the one of the
+        `document_cache_generations` counters of the collection the
+        document with `identifier` belongs to, incrementing it
+        invalidates the document (and the ones that share the counter).
+        A counter per document would never be removed from the cache.
+        """
+
+        key = 'generation:document:{}'.format(
+            self.document._get_collection_name()
+        )
+
+        if identifier is None:
+            return key
+
+        return '{}:{}'.format(
+            key,
+            int(md5(unicode(identifier).encode('utf-8')).hexdigest(), 16) %
+            self.document_cache_generations
+        )
+
+    def get_base_list_by_identifier(self, identifier):
+        """
+        Returns a queryset that matches the base document with the
+        provided `identifier`.
+
+        This queryset is used for operations that don't need to load the
+        document, like the atomic updates of a PATCH request.
+
+        By default matches on the `id` field of the document. You can
+        overwrite this method if you want to alter this behavior.
+        """
+        return self.document.objects(id=identifier)
+
+    def get_base_list_by_identifiers(self, identifiers):
+        """
+        Returns a queryset that matches the base documents with the
+        provided `identifiers`, which are used in a GET request for
+        multiple documents.
+
+        By default matches on the `id` field of the documents with one
+        `$in` query. If you overwrite this method, the documents should
+        still be identified by their primary key.
+        """
+        return self.document.objects(id__in=identifiers)
 
     def get_base_list(self):
         """
@@ -414,18 +1196,34 @@ class MongoEngineResource(Resource):
 
         Paging is based on the value of the param of the name
         `self.page_number_query_param` if it is given, else defaults to
-        the first page.
+        the first page. The size of the pages is based on the param of
+        the name `self.per_page_query_param` if it is given, else
+        defaults to `self.items_per_page`.
 
-        If this param contains an invalid or an out of range value, will
-        abort with a 400 or a 404 respectively.
+        If these params contain an invalid or an out of range value,
+        will abort with a 400 or a 404 respectively. A page beyond
+        `self.max_offset` is refused with a 400.
         """
 
+        try:
+            items_per_page = self._get_items_per_page()
+        except InvalidPerPageParam, error:
+            abort(400, message=(
+                "Invalid number of items per page '{}', it should be "
+                "between 1 and {}".format(
+                    error.param, self.max_items_per_page
+                )
+            ))
+
         def get_total_pages(documents):
             """
             Returns the total amount of pages.
             """
 
-            total_pages = int(ceil(documents.count() / self.items_per_page))
+            total_pages = int(ceil(
+                self._limit_time(documents.clone(), 'count').count() /
+                items_per_page
+            ))
 
             # Even if there are no documents, there should be at least one page
             if total_pages == 0:
@@ -436,48 +1234,188 @@ class MongoEngineResource(Resource):
         total_pages = get_total_pages(documents)
 
         try:
-            page = self._get_page(total_pages)
+            page = self._get_page(total_pages, items_per_page)
         except InvalidPageParamFormat, error:
             abort(400, message="Invalid page '{}'".format(error.param))
         except PageOutOfRange, error:
             abort(404, message="Page '{}' is out of range".format(error.param))
+        except PageBeyondMaxOffset, error:
+            abort(400, message=self._get_max_offset_message(error.param))
 
-        end = page * self.items_per_page
-        start = end - self.items_per_page
+        end = page * items_per_page
+        start = end - items_per_page
 
-        self._add_paging_header(page, self.items_per_page, total_pages)
+        self._add_paging_header(page, items_per_page, total_pages)
 
-        return documents[start:end]
+        return self._limit_time(documents[start:end])
 
-    def _get_page(self, total_pages):
+    def _project(self, documents, *fieldnames):
         """
-        Returns the page of the listview that the client is requesting.
+        Returns a copy of the (paged) `documents` queryset that only
+        fetches the fields with `fieldnames`, with the same filters,
+        ordering, skip and limit. Set the time limit on it last.
 
-        This is read from the query param with the name of
-        `self.page_number_query_param`. If this is in invalid format or
-        out of range, will raise an `InvalidPageParamFormat` or a
-        `PageOutOfRange` error respectively.
+        The paged queryset can't be projected itself: slicing a queryset
+        creates its PyMongo cursor, which the other queryset methods
+        copy as is, so a new projection would be ignored.
         """
 
-        page = request.args.get(self.page_number_query_param, '1')
+        text_search = isinstance(documents._loaded_fields, TextScoreFieldList)
 
-        # If the page param is empty just default to page 1
-        if not page:
-            page = '1'
+        queryset = documents.clone()
+        queryset._cursor_obj = None
+        queryset = queryset.all_fields().only(*fieldnames)
 
-        if not page.isdigit():
-            raise InvalidPageParamFormat(page)
+        if text_search:
+            # MongoDB needs the score to sort on it
+            queryset._loaded_fields = TextScoreFieldList(
+                queryset._loaded_fields
+            )
 
-        page = int(page)
+        return queryset
 
-        if page < 1:
-            raise InvalidPageParamFormat(page)
+    def _get_max_time_ms(self, operation):
+        """
+        Returns the maximum number of milliseconds for a query of the
+        `operation` ('find', 'count' or 'aggregate'), or `None` if it's
+        not limited.
+        """
+
+        max_time_ms = getattr(self, '{}_max_time_ms'.format(operation))
+
+        if max_time_ms is None:
+            return self.max_time_ms
+        else:
+            return max_time_ms
+
+    def _limit_time(self, queryset, operation='find'):
+        """
+        Returns `queryset` with the maximum time for its queries of the
+        `operation` set on its cursor.
+
+        The time limit is lost when the queryset is filtered, so set it
+        last.
+        """
+
+        max_time_ms = self._get_max_time_ms(operation)
+
+        if max_time_ms is not None:
+            queryset._cursor.max_time_ms(max_time_ms)
+
+        return queryset
+
+    def _get_max_time_option(self, operation):
+        """
+        Returns the keyword arguments for a MongoDB command of the
+        `operation` to limit its time, if it should be limited.
+        """
+
+        max_time_ms = self._get_max_time_ms(operation)
+
+        if max_time_ms is None:
+            return {}
+        else:
+            return {'maxTimeMS': max_time_ms}
+
+    def _get_items_per_page(self):
+        """
+        Returns the amount of items on one page of the listview that the
+        client is requesting.
+
+        This is read from the query param with the name of
+        `self.per_page_query_param`, and defaults to
+        `self.items_per_page`. If it's not a number between 1 and
+        `self.max_items_per_page`, will raise an `InvalidPerPageParam`
+        error.
+        """
+
+        per_page = request.args.get(self.per_page_query_param)
+
+        if not per_page:
+            return self.items_per_page
+
+        if not per_page.isdigit():
+            raise InvalidPerPageParam(per_page)
+
+        items_per_page = int(per_page)
+
+        if items_per_page < 1 or items_per_page > self.max_items_per_page:
+            raise InvalidPerPageParam(per_page)
+
+        return items_per_page
+
+    def _get_page(self, total_pages, items_per_page):
+        """
+        Returns the page of the listview that the client is requesting,
+        with `items_per_page` items on a page.
+
+        This is read from the query param with the name of
+        `self.page_number_query_param`. If this is in invalid format or
+        out of range, will raise an `InvalidPageParamFormat` or a
+        `PageOutOfRange` error respectively. If the page is beyond
+        `self.max_offset`, will raise a `PageBeyondMaxOffset` error.
+        """
+
+        page = request.args.get(self.page_number_query_param, '1')
+
+        # If the page param is empty just default to page 1
+        if not page:
+            page = '1'
+
+        if not page.isdigit():
+            raise InvalidPageParamFormat(page)
+
+        page = int(page)
+
+        if page < 1:
+            raise InvalidPageParamFormat(page)
 
         if page > total_pages:
             raise PageOutOfRange(page)
 
+        max_page = self._get_max_page(items_per_page)
+
+        if max_page is not None and page > max_page:
+            raise PageBeyondMaxOffset(page)
+
         return page
 
+    def _get_max_page(self, items_per_page):
+        """
+        Returns the last page of the listview, with `items_per_page`
+        items on a page, that is within `self.max_offset`, or `None` if
+        there's no maximum offset.
+        """
+
+        if self.max_offset is None:
+            return None
+        else:
+            return self.max_offset // items_per_page + 1
+
+    def _get_max_offset_message(self, page):
+        """
+        Returns the error message for a request for `page`, which is
+        beyond `self.max_offset`.
+
+        Points the client to the ways to get the documents without
+        skipping: narrowing down the listview with filters, or exporting
+        all documents from one cursor if the resource allows it.
+        """
+
+        message = (
+            "Page '{}' is beyond the maximum offset of {} documents. "
+            "Narrow the list down with filters".format(page, self.max_offset)
+        )
+
+        if self.allow_export and self.is_base_document:
+            message += (
+                ", or fetch all documents from one cursor on the "
+                "'{}!!export' path, with the same filters"
+                .format(self.get_base_url())
+            )
+
+        return message + "."
+
     def _add_paging_header(self, current_page, items_per_page, total_pages):
         """
         Adds the HTTP header related to paging of the listview of the
@@ -505,7 +1443,12 @@ class MongoEngineResource(Resource):
             paging_links.add_link('next', current_page + 1)
 
         paging_links.add_link('first', 1)
-        paging_links.add_link('last', total_pages)
+
+        # Don't link to a last page that can't be requested
+        max_page = self._get_max_page(items_per_page)
+
+        if max_page is None or total_pages <= max_page:
+            paging_links.add_link('last', total_pages)
 
         self.headers.update({
             'Link': ', '.join(paging_links.get_links())
@@ -523,27 +1466,270 @@ class MongoEngineResource(Resource):
 
         If `get_data()` returns something that evaluates to `False` it
         will raise a 404.
+
+        If `etags` is `True` and the `If-None-Match` header of the
+        request matches the ETag of the data, returns a 304 response
+        before the data is serialized.
         """
 
-        if self.target_list is None:
+        if self.not_modified:
+            return self._not_modified_response()
 
-            data = self.get_document_serialized(
-                self.get_document(*args, **kwargs)
-            )
+        if self.target_documents is not None:
+            data = self.get_documents_serialized(self.target_documents)
+
+        elif self.target_list is None:
+
+            document = self.get_document(*args, **kwargs)
+
+            if self.etags and self.is_base_document:
+
+                self.headers['ETag'] = '"{}"'.format(
+                    self.get_document_etag(document)
+                )
+
+                if self._is_not_modified():
+                    return self._not_modified_response()
+
+            data = self.get_document_serialized(document)
 
         else:
 
             if self.is_base_document:
-                data = self.get_list_serialized(
-                    self.get_list(*args, **kwargs)
-                )
+
+                data = self._get_cached_list_page()
+
+                if data is None:
+
+                    documents = self.get_list(*args, **kwargs)
+
+                    if self.etags and self.etag_field:
+
+                        self.headers['ETag'] = 'W/"{}"'.format(
+                            self._get_list_etag(documents)
+                        )
+
+                        if self._is_not_modified():
+                            return self._not_modified_response()
+
+                    if self._raw_bson_page():
+                        return self._raw_bson_response(documents)
+
+                    if self._stream_list_page():
+                        return self._stream_list_response(documents)
+
+                    data = self.get_list_serialized(documents)
+
+                    if self.etags and not self.etag_field:
+                        dumped = self.json_codec.dumps(data, sort_keys=True)
+                        self.headers['ETag'] = 'W/"{}"'.format(
+                            md5(dumped).hexdigest()
+                        )
+
+                    self._cache_list_page(data)
+
+                if self.etags and self._is_not_modified():
+                    return self._not_modified_response()
+
             else:
-                data = self.target_serializer.serialize(
-                    self.get_list(*args, **kwargs)
+                data = self._serialize(
+                    self.target_serializer, self.get_list(*args, **kwargs)
                 )
 
         return self.make_response(data)
 
+    def get_document_etag(self, document):
+        """
+        Returns the (unquoted) ETag for `document`.
+
+        If `etag_field` is set this is the value of that field, otherwise
+        a hash of the raw MongoDB data of the document.
+        """
+
+        if self.etag_field:
+            return unicode(getattr(document, self.etag_field))
+        else:
+            return md5(BSON.encode(document.to_mongo())).hexdigest()
+
+    def _get_list_etag(self, documents):
+        """
+        Returns the (unquoted) ETag for the page of the listview with
+        `documents`, based on the ids and the `etag_field` values of the
+        documents, which are fetched with a projection-only query, and
+        the paging headers.
+        """
+
+        versions = [
+            (unicode(document_id), unicode(version))
+            for document_id, version in self._limit_time(
+                self._project(documents, 'id', self.etag_field)
+                .scalar('id', self.etag_field)
+            )
+        ]
+
+        return md5(
+            json.dumps([versions, self.headers.get('Link')])
+        ).hexdigest()
+
+    def _is_not_modified_version(self, identifier):
+        """
+        Returns `True` if the `If-None-Match` header of the request
+        matches the ETag of the base document with `identifier`.
+
+        Only queries the `etag_field` of the document, so this is only
+        done if `etag_field` is set and the document is not cached.
+        """
+
+        if (
+            not self.etags or not self.etag_field or self.document_cache or
+            not request.if_none_match
+        ):
+            return False
+
+        try:
+            versions = list(self._limit_time(
+                self.get_base_list_by_identifier(identifier)
+                .scalar(self.etag_field)
+            ))
+        except ValidationError:
+            # Let `_init_target()` handle the invalid identifier
+            return False
+
+        if not versions:
+            return False
+
+        self.headers['ETag'] = '"{}"'.format(unicode(versions[0]))
+
+        return self._is_not_modified()
+
+    def _is_not_modified(self):
+        """
+        Returns `True` if the `If-None-Match` header of the request
+        matches the ETag in the response headers.
+        """
+
+        if 'ETag' not in self.headers or not request.if_none_match:
+            return False
+
+        etag, weak = unquote_etag(self.headers['ETag'])
+
+        return self._etag_matches(request.if_none_match, etag, weak=True)
+
+    def _not_modified_response(self):
+        """
+        Returns a 304 (Not Modified) response, without a body.
+        """
+        return make_response(('', 304, self.headers))
+
+    def get_list_cache_key(self):
+        """
+        Returns the key for the requested page of the listview in
+        `list_cache`.
+
+        The key is based on the resource, the URL and the normalized
+        query params (which contain the filters and the page). If the
+        result of `get_base_list()` depends on something else, like the
+        authenticated user, you should overwrite this method and add
+        that to the key.
+        """
+
+        params = sorted(
+            (key, value)
+            for key, value in request.args.items(multi=True)
+            # Empty params are ignored by the filters
+            if value
+        )
+
+        return 'list:{}:{}:{}.{}:{}'.format(
+            self.document._get_collection_name(),
+            self.list_cache.counter(self._list_cache_generation_key()),
+            self.__class__.__module__,
+            self.__class__.__name__,
+            md5(json.dumps([
+                request.base_url, params, self.response_codec.native
+            ])).hexdigest()
+        )
+
+    def _list_cache_generation_key(self):
+        """
+        Returns the key of the counter in `list_cache` that is part of
+        the keys of the cached pages. Incrementing it invalidates all
+        cached pages of the collection.
+        """
+        return 'generation:{}'.format(self.document._get_collection_name())
+
+    def _get_cached_list_page(self):
+        """
+        Returns the cached serialized data for the requested page of the
+        listview and restores its headers, or returns `None` if the page
+        is not cached.
+        """
+
+        if not self.list_cache:
+            return None
+
+        # Remember the key so `_cache_list_page()` will store the page
+        # under the generation that was current before it was fetched.
+        self.list_cache_key = self.get_list_cache_key()
+        cached_page = self.list_cache.get(self.list_cache_key)
+
+        if cached_page is None:
+            return None
+
+        self.headers.update(cached_page['headers'])
+
+        return cached_page['data']
+
+    def _cache_list_page(self, data):
+        """
+        Stores the serialized `data` of the requested page of the
+        listview and its paging headers in `list_cache`.
+        """
+
+        if not self.list_cache:
+            return
+
+        self.list_cache.set(
+            self.list_cache_key,
+            {
+                'data': data,
+                'headers': {
+                    header: self.headers[header]
+                    for header in ('Link', 'ETag')
+                    if header in self.headers
+                }
+            },
+            self.list_cache_timeout
+        )
+
+    def _invalidate_caches(self, multi=False):
+        """
+        Invalidates the cached data after a document of the collection
+        of this resource was changed.
+
+        If `multi` is `True`, multiple (unknown) documents were changed,
+        so all cached documents are invalidated. Otherwise only the
+        target document of the request is invalidated.
+        """
+
+        if self.list_cache:
+            self.list_cache.incr(self._list_cache_generation_key())
+
+        if self.document_cache:
+            if multi:
+                self.document_cache.incr(
+                    self._document_cache_generation_key()
+                )
+            elif self.target_identifier is not None:
+                # Increment the generation instead of deleting the
+                # document, so a request that fetched the document before
+                # it was changed can't cache it again.
+                self.document_cache.incr(
+                    self._document_cache_generation_key(
+                        self.target_identifier
+                    )
+                )
+
     def is_document(self, data):
         """
         Returns `True` if `data` represents a single document and not a
@@ -559,14 +1745,604 @@ class MongoEngineResource(Resource):
         """
         Returns the provided MongoEngine document serialized.
         """
-        return self.target_serializer.serialize(document)
+        return self._serialize(self.target_serializer, document)
+
+    def _serialize(self, serializer, value, codec=None):
+        """
+        Returns `value` serialized by `serializer` (a serializer or a
+        serializer field) for `codec`, the `response_codec` by default.
+        Values the codec supports natively (like ObjectIds in BSON) are
+        not converted.
+        """
+
+        if (codec or self.response_codec).native:
+            return serializer.serialize_native(value)
+        else:
+            return serializer.serialize(value)
+
+    def get_documents_serialized(self, documents):
+        """
+        Returns the serialized data for the `(identifier, document)`
+        tuples in `documents`, of a GET request for multiple documents.
+
+        Missing documents are reported in their place in the list, with
+        their identifier and a 404 status.
+        """
+
+        data = []
+
+        for identifier, document in documents:
+
+            if document is None:
+                data.append({
+                    'identifier': identifier,
+                    'status': 404,
+                    'message': (
+                        "The resource specified with identifier '{}' "
+                        "could not be found".format(identifier)
+                    )
+                })
+            else:
+                data.append(self._serialize(self.target_serializer, document))
+
+        return data
 
     def get_list_serialized(self, queryset):
         """
-        Returns a list of serialized documents from the provided
-        MongoEngine queryset.
+        Returns a list of serialized documents from the provided
+        MongoEngine queryset.
+        """
+        serializer = self.get_list_serializer()
+        data = []
+
+        for document in queryset:
+            item = self._serialize(serializer, document)
+            self._add_text_score(item, document)
+            data.append(item)
+
+        if self._get_sliced_list_fields(serializer):
+
+            counts = self._get_list_counts([d.pk for d in queryset])
+
+            for document, item in zip(queryset, data):
+                item.update(counts.get(document.pk, {}))
+
+        return data
+
+    def _get_sliced_list_fields(self, serializer):
+        """
+        Returns a dict with the list fields of `serializer` that have a
+        `max_items_in_list`, by their names.
+        """
+        return {
+            fieldname: field
+            for fieldname, field in serializer._fields().items()
+            if isinstance(field, serializer_fields.ListField) and
+            field.max_items_in_list is not None and
+            fieldname in self.document._fields
+        }
+
+    def _slice_lists(self, documents, serializer):
+        """
+        Returns the `documents` queryset with a `$slice` projection for
+        the list fields of `serializer` that have a `max_items_in_list`.
+        """
+
+        slices = {}
+
+        for fieldname, field in (
+            self._get_sliced_list_fields(serializer).items()
+        ):
+            if field.max_items_direction == 'last':
+                slices['slice__' + fieldname] = -field.max_items_in_list
+            else:
+                slices['slice__' + fieldname] = field.max_items_in_list
+
+        if slices:
+            documents = documents.fields(**slices)
+
+        return documents
+
+    def _get_list_counts(self, document_ids):
+        """
+        Returns the total number of items in the sliced lists of the
+        documents with `document_ids`, as a dict with a dict per
+        document id, which has the counts as `<fieldname>_count`.
+
+        The counts are calculated by MongoDB in one aggregation.
+        """
+
+        document_fields = self.document._fields
+        projection = {
+            '{}_count'.format(fieldname): {'$size': {'$ifNull': [
+                '$' + document_fields[fieldname].db_field, []
+            ]}}
+            for fieldname in self._get_sliced_list_fields(
+                self.get_list_serializer()
+            )
+        }
+
+        result = self.document._get_collection().aggregate(
+            [
+                {'$match': {'_id': {'$in': document_ids}}},
+                {'$project': projection}
+            ],
+            **self._get_max_time_option('aggregate')
+        )
+
+        if isinstance(result, dict):
+            # PyMongo 2 returns the result of the command
+            result = result['result']
+
+        return {row.pop('_id'): row for row in result}
+
+    def get_list_serializer(self):
+        """
+        Returns the serializer for the documents in the listview: the
+        `list_serializer` if it's set, otherwise the `serializer`.
+        """
+        return self.list_serializer or self.serializer
+
+    def _raw_bson_page(self):
+        """
+        Returns `True` if the requested page of the listview should be
+        sent as raw BSON.
+        """
+        return (
+            self.raw_bson_passthrough and not self.list_cache and
+            not (self.etags and not self.etag_field) and
+            isinstance(self.response_codec, BSONCodec) and
+            not self._html_requested() and
+            self._is_identity_serializer(
+                self.get_list_serializer(), self.document
+            ) and
+            # The raw documents can't include the counts of sliced lists
+            not self._get_sliced_list_fields(self.get_list_serializer()) and
+            not self._text_search_requested()
+        )
+
+    def _raw_bson_response(self, documents):
+        """
+        Returns a response with the raw BSON `documents`, concatenated.
+
+        Only the fields of the serializer are fetched from MongoDB.
+        """
+
+        queryset = self._project(
+            documents, *self._get_projection(self.get_list_serializer())
+        )
+
+        if RawBSONDocument:
+
+            # Let the cursor of the queryset return the raw documents,
+            # with the filters, ordering and paging of the queryset. The
+            # cursor doesn't exist yet, so it's created on the new
+            # collection.
+            queryset._collection_obj = queryset._collection.with_options(
+                codec_options=CodecOptions(document_class=RawBSONDocument)
+            )
+            chunks = (
+                document.raw for document in self._limit_time(queryset)._cursor
+            )
+
+        else:
+            chunks = (
+                BSON.encode(son) for son in self._limit_time(queryset)._cursor
+            )
+
+        return Response(
+            self._join_chunks(chunks, self.stream_batch_size),
+            headers=self.headers,
+            mimetype=self.response_codec.mimetype
+        )
+
+    def _is_identity_serializer(self, serializer, document):
+        """
+        Returns `True` if `serializer` outputs the fields of the
+        MongoEngine `document` class unchanged, apart from converting
+        ObjectIds and datetimes, so the raw MongoDB data of the
+        documents can be sent instead.
+
+        Fields of embedded documents should all be on the serializer,
+        because embedded documents can't be projected.
+        """
+
+        identity_fields = (
+            serializer_fields.StringField, serializer_fields.IntField,
+            serializer_fields.LongField, serializer_fields.FloatField,
+            serializer_fields.BooleanField, serializer_fields.DateTimeField,
+            serializer_fields.ObjectIdField, serializer_fields.DynamicField
+        )
+
+        def is_identity_field(field, document_field):
+
+            if isinstance(document_field, fields.ListField):
+                return (
+                    type(field) is serializer_fields.ListField and
+                    is_identity_field(field.sub_field, document_field.field)
+                )
+
+            if isinstance(document_field, fields.EmbeddedDocumentField):
+
+                if type(field) is not serializer_fields.DocumentField:
+                    return False
+
+                sub_fields = field.sub_serializer._fields()
+                document_fields = document_field.document_type._fields
+
+                return (
+                    set(sub_fields) == set(document_fields) - {'_cls'} and
+                    all(
+                        not sub_field.writeonly and
+                        document_fields[fieldname].db_field == fieldname and
+                        is_identity_field(
+                            sub_field, document_fields[fieldname]
+                        )
+                        for fieldname, sub_field in sub_fields.items()
+                    )
+                )
+
+            return type(field) in identity_fields
+
+        for fieldname, field in serializer._fields().items():
+
+            if field.writeonly:
+                continue
+
+            document_field = document._fields.get(fieldname)
+
+            if document_field is None or (
+                document_field.db_field != fieldname and
+                fieldname != document._meta['id_field']
+            ):
+                return False
+
+            if not is_identity_field(field, document_field):
+                return False
+
+        return True
+
+    def _stream_list_page(self):
+        """
+        Returns `True` if the requested page of the listview should be
+        streamed.
+        """
+        return (
+            self.stream_lists and not self.list_cache and
+            not (self.etags and not self.etag_field) and
+            self.response_codec is self.json_codec and
+            not self._html_requested()
+        )
+
+    def _stream_list_response(self, documents):
+        """
+        Returns a chunked response that streams the serialized
+        `documents` as a JSON array.
+
+        The documents are fetched from MongoDB in batches of
+        `stream_batch_size` and are serialized one by one, so only one
+        batch is held in memory at a time.
+        """
+
+        serializer = self.get_list_serializer()
+
+        if self._get_sliced_list_fields(serializer):
+            counts = self._get_list_counts(list(self._limit_time(
+                self._project(documents, 'id').scalar('id')
+            )))
+        else:
+            counts = {}
+
+        def generate():
+
+            separator = '['
+
+            for document in self._iter_documents(
+                documents, self.stream_batch_size
+            ):
+                data = self._serialize(
+                    serializer, document, codec=self.json_codec
+                )
+                data.update(counts.get(document.pk, {}))
+                self._add_text_score(data, document)
+                yield separator + self.json_codec.dumps(data)
+                separator = ','
+
+            if separator == '[':
+                yield '['
+
+            yield ']'
+
+        return Response(
+            stream_with_context(
+                self._join_chunks(generate(), self.stream_batch_size)
+            ),
+            headers=self.headers,
+            mimetype='application/json'
+        )
+
+    def _iter_documents(self, queryset, batch_size):
+        """
+        Returns an iterator over the documents in `queryset` that
+        doesn't cache the documents, and fetches them from MongoDB in
+        batches of `batch_size`.
+        """
+
+        queryset = queryset.no_cache()
+        queryset._cursor.batch_size(batch_size)
+
+        return queryset
+
+    def export(self):
+        """
+        Returns a response that streams all documents of the listview
+        that match the filters (and the text search) in the query string
+        as newline-delimited JSON (one serialized document per line).
+
+        The documents are read from one cursor, in batches of
+        `export_batch_size`, without paging. Only the fields of the
+        serializer are fetched from MongoDB.
+        """
+
+        self.target_serializer = self.serializer
+        self.is_base_document = True
+        documents = self.get_base_list()
+
+        if request.args:
+            documents = documents.filter(
+                **self._get_filters(request.args.to_dict())
+            )
+
+        projection = self._get_projection(self.serializer)
+
+        if projection:
+            documents = documents.only(*projection)
+
+        if self._text_search_requested():
+            documents = self._apply_text_search(documents)
+
+        def generate():
+            for document in self._iter_documents(
+                documents, self.export_batch_size
+            ):
+                yield self.json_codec.dumps(self._serialize(
+                    self.serializer, document, codec=self.json_codec
+                )) + '\n'
+
+        return Response(
+            stream_with_context(
+                self._join_chunks(generate(), self.export_batch_size)
+            ),
+            headers=self.headers,
+            mimetype='application/x-ndjson'
+        )
+
+    def distinct(self, field_path):
+        """
+        Returns a response with the distinct values of the field at
+        `field_path` (a list of field names, for fields in embedded
+        documents) in the documents of the listview that match the
+        filters (and the text search) in the query string.
+
+        The values are determined by MongoDB with one `distinct`
+        command, which can use an index on the field. The values of a
+        list field are the distinct items of the lists.
+        """
+
+        self.target_serializer = self.serializer
+        self.is_base_document = True
+        documents = self.get_base_list()
+
+        if request.args:
+            documents = self._filter_text_search(documents.filter(
+                **self._get_filters(request.args.to_dict())
+            ))
+
+        db_path, serializer_field, document_field, list_paths = (
+            self._get_field_path(field_path)
+        )
+
+        return self.make_response([
+            self._serialize(serializer_field, document_field.to_python(value))
+            for value in self._limit_time(documents)._cursor.distinct(db_path)
+        ])
+
+    def _get_field_path(self, field_path):
+        """
+        Returns a `(db_path, serializer_field, document_field,
+        list_paths)` tuple for the field at `field_path`, walking
+        through the serializer and the MongoEngine document the same way
+        filters do. For a list field, the fields are the fields of the
+        items. The `list_paths` are the MongoDB paths of the lists on
+        the way to the field.
+
+        Calls `abort(404)` if the field doesn't exist or is writeonly.
+        """
+
+        if not field_path:
+            abort(404, message="No field provided.")
+
+        serializer = self.serializer
+        document = self.document
+        db_path = []
+        list_paths = []
+
+        for fieldname in field_path:
+
+            if (
+                serializer is None or
+                fieldname not in serializer._fields() or
+                fieldname not in document._fields or
+                serializer._field(fieldname).writeonly
+            ):
+                abort(404, message=(
+                    "The field '{}' doesn't exist.".format(
+                        '/'.join(field_path)
+                    )
+                ))
+
+            serializer_field = serializer._field(fieldname)
+            document_field = document._fields[fieldname]
+            db_path.append(document_field.db_field)
+
+            if isinstance(serializer_field, serializer_fields.ListField):
+                list_paths.append('.'.join(db_path))
+                serializer_field = serializer_field.sub_field
+                document_field = document_field.field
+
+            if isinstance(serializer_field, serializer_fields.DocumentField):
+                serializer = serializer_field.sub_serializer
+                document = document_field.document_type
+            else:
+                serializer = None
+
+        return '.'.join(db_path), serializer_field, document_field, list_paths
+
+    def aggregate(self):
+        """
+        Returns a response with an aggregation of the documents of the
+        listview that match the filters (and the text search) in the
+        query string.
+
+        The `group_by` query param is the field (in filter notation,
+        like `comments__text`) to count the documents per value of, the
+        `metrics` query param a comma separated list of `<operator>:
+        <field>` items, where the operator is `min`, `max`, `avg` or
+        `sum` and the field a numeric field. Lists on the way to the
+        `group_by` field are unwound, so the items of lists are counted.
+
+        The aggregation is compiled into one `$match`/`$unwind`/`$group`
+        pipeline that may run for `aggregate_max_time_ms`. Returns a
+        list of groups, ordered by their `count`, with their `value`
+        and metrics (like `avg_version`), or a single object with the
+        `count` and metrics of all documents if there's no `group_by`.
+        """
+
+        self.target_serializer = self.serializer
+        self.is_base_document = True
+
+        query = request.args.to_dict()
+        group_by = query.pop('group_by', None)
+        metrics = query.pop('metrics', None)
+
+        documents = self._filter_text_search(
+            self.get_base_list().filter(**self._get_filters(query))
+        )
+        pipeline = [{'$match': documents._query}]
+        group = {'_id': None, 'count': {'$sum': 1}}
+
+        if group_by:
+
+            db_path, serializer_field, document_field, list_paths = (
+                self._get_field_path(group_by.split('__'))
+            )
+
+            for list_path in list_paths:
+                pipeline.append({'$unwind': '$' + list_path})
+
+            group['_id'] = '$' + db_path
+
+        if metrics:
+            for metric in metrics.split(','):
+                operator, db_path = self._get_metric(metric)
+                group['{}_{}'.format(operator, metric.split(':')[1])] = {
+                    '$' + operator: '$' + db_path
+                }
+
+        pipeline.append({'$group': group})
+
+        if group_by:
+            pipeline.extend([
+                {'$sort': {'count': -1}},
+                {'$limit': self.aggregate_max_groups}
+            ])
+
+        result = documents._collection.aggregate(
+            pipeline, **self._get_max_time_option('aggregate')
+        )
+
+        if isinstance(result, dict):
+            # PyMongo 2 returns the result of the command
+            result = result['result']
+
+        groups = []
+
+        for row in result:
+
+            value = row.pop('_id')
+
+            if group_by:
+                row['value'] = (
+                    None if value is None else self._serialize(
+                        serializer_field, document_field.to_python(value)
+                    )
+                )
+
+            groups.append(row)
+
+        if group_by:
+            return self.make_response(groups)
+        elif groups:
+            return self.make_response(groups[0])
+        else:
+            return self.make_response({'count': 0})
+
+    def _get_metric(self, metric):
+        """
+        Returns the `(operator, db_path)` tuple for the `metric` of an
+        aggregation, in the `<operator>:<field>` format. Calls
+        `abort(400)` if the metric is invalid.
+        """
+
+        numeric_fields = (
+            serializer_fields.IntField, serializer_fields.LongField,
+            serializer_fields.FloatField
+        )
+
+        try:
+            operator, fieldname = metric.split(':')
+        except ValueError:
+            operator = fieldname = None
+
+        if operator not in ('min', 'max', 'avg', 'sum') or not fieldname:
+            abort(400, message=(
+                "Invalid metric '{}', use '<min|max|avg|sum>:<field>'."
+                .format(metric)
+            ))
+
+        db_path, serializer_field, document_field, list_paths = (
+            self._get_field_path(fieldname.split('__'))
+        )
+
+        if list_paths or not isinstance(serializer_field, numeric_fields):
+            abort(400, message=(
+                "The field '{}' of metric '{}' is not a numeric field."
+                .format(fieldname, metric)
+            ))
+
+        return operator, db_path
+
+    def _get_projection(self, serializer):
+        """
+        Returns the names of the document fields that are needed to
+        serialize documents with `serializer`, or `None` if the
+        serializer uses attributes of the document that are no fields,
+        in which case the whole documents should be fetched.
         """
-        return [self.target_serializer.serialize(d) for d in queryset]
+
+        projection = []
+
+        for fieldname, field in serializer._fields().items():
+
+            if field.writeonly:
+                continue
+
+            if fieldname not in self.document._fields:
+                return None
+
+            projection.append(fieldname)
+
+        return projection
 
     def get_document(self, *args, **kwargs):
         """
@@ -594,10 +2370,75 @@ class MongoEngineResource(Resource):
             documents = self._all_target_documents()
 
         if self.is_base_document:
+
+            if self.list_serializer:
+
+                # Only fetch the fields the list serializer needs
+                projection = self._get_projection(self.list_serializer)
+
+                if projection:
+                    documents = documents.only(*projection)
+
+            documents = self._slice_lists(
+                documents, self.get_list_serializer()
+            )
+
+            if self._text_search_requested():
+                documents = self._apply_text_search(documents)
+
             return self._apply_paging(documents)
+
         else:
             return documents
 
+    def _text_search_requested(self):
+        """
+        Returns `True` if the listview should be searched with the text
+        in the `text_search_query_param`.
+        """
+        return bool(
+            self.allow_text_search and
+            request.args.get(self.text_search_query_param)
+        )
+
+    def _apply_text_search(self, documents):
+        """
+        Returns the `documents` queryset limited to the documents that
+        match the text in the `text_search_query_param`, sorted by their
+        text search score.
+        """
+
+        documents = self._filter_text_search(documents)
+        documents._loaded_fields = TextScoreFieldList(
+            documents._loaded_fields
+        )
+        documents._ordering = [(TEXT_SCORE_KEY, {'$meta': 'textScore'})]
+
+        return documents
+
+    def _filter_text_search(self, documents):
+        """
+        Returns the `documents` queryset limited to the documents that
+        match the text in the `text_search_query_param`, if the listview
+        should be searched.
+        """
+
+        if not self._text_search_requested():
+            return documents
+
+        return documents.filter(__raw__={
+            '$text': {'$search': request.args[self.text_search_query_param]}
+        })
+
+    def _add_text_score(self, data, document):
+        """
+        Adds the text search score of `document` to its serialized
+        `data` as `text_score_field`, if it's set and the listview is
+        searched.
+        """
+        if self.text_score_field and self._text_search_requested():
+            data[self.text_score_field] = document._data.get(TEXT_SCORE_KEY)
+
     def _all_target_documents(self):
         """
         Returns all documents that are exposed in this request.
@@ -635,12 +2476,33 @@ class MongoEngineResource(Resource):
             ):
                 continue
 
+            field_trace = key.split('__')
+
             try:
-                filters[key] = self._get_filter_value(
-                    key.split('__'), value
-                )
+
+                if len(field_trace) > 1 and field_trace[-1] == 'in':
+
+                    # Match any of the comma separated values
+                    filters[key] = []
+
+                    for item in value.split(','):
+
+                        item = self._get_filter_value(field_trace[:-1], item)
+
+                        # The values of a list field are deserialized
+                        # as lists.
+                        if type(item) is list:
+                            filters[key].extend(item)
+                        else:
+                            filters[key].append(item)
+
+                else:
+                    filters[key] = self._get_filter_value(field_trace, value)
+
             except InvalidQueryField:
                 abort(400, message="Invalid query '{}'".format(key))
+            except SerializerError, error:
+                abort(400, message=self._deserialize_error_message(error))
 
         return filters
 
@@ -657,7 +2519,8 @@ class MongoEngineResource(Resource):
         ['parent_fieldname', 'child_fieldname']
 
         If the field doesn't exist on the serializer, it will raise an
-        `InvalidQueryField` exception.
+        `InvalidQueryField` exception. If the value can't be deserialized
+        by the field, it will raise a `SerializerError` exception.
         """
 
         def url_decode_value(serializer_field, value):
@@ -672,7 +2535,10 @@ class MongoEngineResource(Resource):
             deserialize_type = serializer_field.deserialize_type
 
             if deserialize_type:
-                return deserialize_type(value)
+                try:
+                    return deserialize_type(value)
+                except ValueError:
+                    raise ValueInvalidType(serializer_field, value)
             else:
                 return value
 
@@ -774,6 +2640,16 @@ class MongoEngineResource(Resource):
                 "Can't update an item with POST, use PUT instead."
             ))
 
+        if request.mimetype == 'application/x-ndjson':
+
+            if not self.is_base_document:
+                abort(415, message=(
+                    "NDJSON imports are only supported on the listview at "
+                    "the base of this resource."
+                ))
+
+            return self.import_documents()
+
         request_data = self._request_data()
 
         if isinstance(request_data, list):
@@ -794,7 +2670,9 @@ class MongoEngineResource(Resource):
 
                 for document in documents:
                     self._save_document(document)
-                    response.append(self.target_serializer.serialize(document))
+                    response.append(self._serialize(
+                        self.target_serializer, document
+                    ))
 
             else:
 
@@ -810,14 +2688,16 @@ class MongoEngineResource(Resource):
                     self.target_list.append(document)
 
                 self._save_document(self.base_document)
-                response = self.target_serializer.serialize(new_documents)
+                response = self._serialize(
+                    self.target_serializer, new_documents
+                )
 
         else:
 
             if self.is_base_document:
                 document = self._process_document(request_data)
                 self._save_document(document)
-                response = self.target_serializer.serialize(document)
+                response = self._serialize(self.target_serializer, document)
             else:
                 document = self.target_document_obj.field.document_type(
                     **self.target_serializer.sub_field.deserialize(
@@ -826,10 +2706,172 @@ class MongoEngineResource(Resource):
                 )
                 self.target_list.append(document)
                 self._save_document(self.base_document)
-                response = self.target_serializer.sub_field.serialize(document)
+                response = self._serialize(
+                    self.target_serializer.sub_field, document
+                )
 
         return self.make_response(response, 201)
 
+    def import_documents(self):
+        """
+        Imports the newline-delimited JSON documents in the request body.
+
+        The body is read line by line, so it's never loaded in memory as
+        a whole. Each line is deserialized and validated like the data
+        of a regular POST request, and the valid documents are inserted
+        in batches of `import_batch_size`.
+
+        Returns a response that streams the result of each line as
+        newline-delimited JSON: an object with the `line` number and the
+        `status` code, with either the serialized document `data`, or a
+        `message` (and `errors`) describing why it wasn't imported.
+        """
+
+        def process_line(line):
+            """
+            Returns the document for the NDJSON `line`. Calls `abort()`
+            if the line is invalid.
+            """
+
+            try:
+                data = self.json_codec.loads(line)
+            except ValueError:
+                abort(400, message="Line is not valid JSON.")
+
+            if not isinstance(data, dict):
+                abort(400, message="Line is not a JSON object.")
+
+            document = self._process_document(
+                self.process_request_data_post(data)
+            )
+            self._init_version(document)
+
+            try:
+                document.validate()
+            except ValidationError, error:
+                self._abort_invalid(error)
+
+            return document
+
+        def error_result(line_number, error):
+
+            result = {'line': line_number, 'status': error.code}
+            result.update(
+                getattr(error, 'data', None) or {'message': error.description}
+            )
+
+            return result
+
+        def generate():
+
+            batch = []
+            line_number = 0
+
+            try:
+
+                for line_number, line in enumerate(
+                    self._request_lines(self.max_import_line_size), 1
+                ):
+
+                    if line is None:
+                        yield self.json_codec.dumps({
+                            'line': line_number,
+                            'status': 413,
+                            'message': (
+                                "Line is larger than {} bytes.".format(
+                                    self.max_import_line_size
+                                )
+                            )
+                        }) + '\n'
+                        continue
+
+                    if not line.strip():
+                        continue
+
+                    try:
+                        batch.append((line_number, process_line(line)))
+                    except HTTPException, error:
+                        yield self.json_codec.dumps(
+                            error_result(line_number, error)
+                        ) + '\n'
+
+                    if len(batch) >= self.import_batch_size:
+                        for result in self._insert_batch(batch):
+                            yield self.json_codec.dumps(result) + '\n'
+                        batch = []
+
+            except zlib.error:
+                # The rest of the body can't be read, but the lines
+                # before it are still imported.
+                yield self.json_codec.dumps({
+                    'line': line_number + 1,
+                    'status': 400,
+                    'message': "Request data could not be decompressed."
+                }) + '\n'
+
+            if batch:
+                for result in self._insert_batch(batch):
+                    yield self.json_codec.dumps(result) + '\n'
+
+        return Response(
+            stream_with_context(
+                self._join_chunks(generate(), self.import_batch_size)
+            ),
+            headers=self.headers,
+            mimetype='application/x-ndjson'
+        )
+
+    def _insert_batch(self, batch):
+        """
+        Inserts the documents in `batch`, a list of `(line_number,
+        document)` tuples, with one unordered bulk operation.
+
+        Returns a list with the result of each line.
+        """
+
+        bulk = self.document._get_collection().initialize_unordered_bulk_op()
+        sons = []
+
+        for line_number, document in batch:
+            son = document.to_mongo()
+            sons.append(son)
+            bulk.insert(son)
+
+        write_errors = {}
+
+        try:
+            bulk.execute()
+        except BulkWriteError, error:
+            for write_error in error.details['writeErrors']:
+                write_errors[write_error['index']] = write_error
+
+        self._invalidate_caches()
+
+        results = []
+
+        for index, (line_number, document) in enumerate(batch):
+
+            if index in write_errors:
+
+                result = {'line': line_number}
+                result.update(self._write_error_result(
+                    write_errors[index], "The document could not be inserted."
+                ))
+                results.append(result)
+
+            else:
+
+                document.pk = sons[index]['_id']
+                document._created = False
+
+                results.append({
+                    'line': line_number,
+                    'status': 201,
+                    'data': self.target_serializer.serialize(document)
+                })
+
+        return results
+
     def put(self, *args, **kwargs):
         """
         Processes a HTTP PUT request.
@@ -837,8 +2879,16 @@ class MongoEngineResource(Resource):
         Will call `put_document()` to retreive the document that should
         be updated. If `put_document()` returns `None` it will create a
         new document instead of updating one.
+
+        A PUT request on the listview at the base of the resource with
+        a list of documents is handled by `put_documents()`.
         """
 
+        if self.is_base_document and self.target_list is not None:
+            return self.put_documents()
+
+        self._check_if_match(self.base_document)
+
         if self.target_document:
             put_document = self.target_document
         elif self.create:
@@ -854,64 +2904,495 @@ class MongoEngineResource(Resource):
                 document=put_document
             )
             self._save_document(document)
-            response = self.target_serializer.serialize(document)
+            response = self._serialize(self.target_serializer, document)
+
+        else:
+
+            document = self.target_document_obj(
+                **self.target_serializer.deserialize(self._request_data())
+            )
+
+            for fieldname in document:
+
+                if getattr(self.target_serializer, fieldname).identifier:
+                    # Ignore the identifier field because we already
+                    # have the values for him.
+                    continue
+
+                put_document[fieldname] = document[fieldname]
+
+            if self.create:
+                # If the document is new we still need to add this
+                # document to the list.
+                self.target_list.append(put_document)
+
+            self._save_document(self.base_document)
+            response = self._serialize(self.target_serializer, put_document)
+
+        if self.create:
+            status_code = 201
+        else:
+            status_code = 200
+
+        if self.etags:
+            self.headers['ETag'] = '"{}"'.format(
+                self.get_document_etag(self.base_document or document)
+            )
+
+        return self.make_response(response, status_code)
+
+    def put_documents(self):
+        """
+        Creates or updates the documents in the list of the request data
+        with one unordered bulk operation. The documents are matched on
+        their identifier, which is required.
+
+        Every document is deserialized and validated like the data of a
+        regular PUT request. Existing documents only get the fields that
+        are in the data updated, with the items of embedded lists matched
+        on their identifier like a regular PUT does, so the readonly
+        fields of the items are kept. New documents are inserted
+        (upserted). Only the documents of `get_base_list()` are updated.
+
+        Returns a list with the result of each document: an object with
+        the `identifier` and the `status` code, 201 if it's created and
+        200 if it's updated, or a `message` (and `errors`) describing
+        why it failed.
+        """
+
+        request_data = self._request_data()
+
+        if not isinstance(request_data, list):
+            abort(400, message="No id provided")
+
+        identifier_fieldname = self._get_identifier_fieldname()
+        existing = self._get_existing_documents(
+            request_data, identifier_fieldname
+        )
+        results = []
+        operations = []
+
+        for index, (item, value) in enumerate(
+            zip(request_data, existing['values'])
+        ):
+
+            identifier = (
+                item.get(identifier_fieldname)
+                if isinstance(item, dict) else None
+            )
+
+            try:
+                operations.append((len(results), self._get_upsert(
+                    item, identifier_fieldname, identifier,
+                    existing['documents'].get(value)
+                )))
+                result = {'identifier': identifier, 'status': None}
+            except HTTPException, error:
+                result = {'identifier': identifier, 'status': error.code}
+                result.update(
+                    getattr(error, 'data', None) or
+                    {'message': error.description}
+                )
+            except ValidationError:
+                # The document doesn't validate on fields the client
+                # can't change.
+                result = {
+                    'identifier': identifier,
+                    'status': 400,
+                    'message': "Item {} did not validate.".format(index)
+                }
+
+            results.append(result)
+
+        if operations:
+
+            bulk = (
+                self.document._get_collection().initialize_unordered_bulk_op()
+            )
+
+            for index, (selector, update) in operations:
+                bulk.find(selector).upsert().update_one(update)
+
+            try:
+                bulk_result = bulk.execute()
+            except BulkWriteError, error:
+                bulk_result = error.details
+
+            self._invalidate_caches(multi=True)
+
+            upserted = set(
+                upsert['index'] for upsert in bulk_result.get('upserted', [])
+            )
+            write_errors = {
+                write_error['index']: write_error
+                for write_error in bulk_result.get('writeErrors', [])
+            }
+
+            for operation_index, (index, operation) in enumerate(operations):
+
+                if operation_index in write_errors:
+                    results[index].update(self._write_error_result(
+                        write_errors[operation_index],
+                        "The document could not be saved."
+                    ))
+                elif operation_index in upserted:
+                    results[index]['status'] = 201
+                else:
+                    results[index]['status'] = 200
+
+        return self.make_response(results)
+
+    def _get_identifier_fieldname(self):
+        """
+        Returns the name of the identifier field of the serializer.
+        """
+
+        for fieldname, field in self.serializer._fields().items():
+            if field.identifier:
+                return fieldname
+
+        return self.create_identifier_field
+
+    def _get_existing_documents(self, request_data, identifier_fieldname):
+        """
+        Returns the existing documents for the items in `request_data`,
+        loaded with one query.
+
+        Returns a dict with the deserialized identifier of every item in
+        `values` (`None` if the item has no valid identifier) and the
+        existing documents of `get_base_list()` by identifier in
+        `documents`.
+        """
+
+        identifier_field = self.serializer._field(identifier_fieldname)
+        values = []
+
+        for item in request_data:
+            try:
+                values.append(
+                    identifier_field.deserialize(item[identifier_fieldname])
+                )
+            except (TypeError, KeyError, SerializerError):
+                values.append(None)
+
+        identifiers = [value for value in values if value is not None]
+        documents = {}
+
+        if identifiers:
+            for document in self._limit_time(self.get_base_list().filter(**{
+                '{}__in'.format(identifier_fieldname): identifiers
+            })):
+                documents[getattr(document, identifier_fieldname)] = document
+
+        return {'values': values, 'documents': documents}
+
+    def _get_upsert(self, data, identifier_fieldname, identifier,
+                    document=None):
+        """
+        Returns a `(selector, update)` tuple for the upsert of the
+        document with `identifier` (the value of the field with
+        `identifier_fieldname`) and the data of a PUT request. The
+        selector only matches documents of `get_base_list()`.
+
+        If the document exists it should be given as `document`. The
+        data is applied to it like a regular PUT, so the items of
+        embedded lists keep their readonly fields. The update only sets
+        the writable fields that are in the data (and unsets the ones
+        that are `null`). The other fields of the document (like defaults
+        of readonly fields) are only set when the document is inserted.
+        Calls `abort()` if the data is invalid, a `ValidationError` is
+        raised if the document doesn't validate on other fields.
+        """
+
+        if not isinstance(data, dict):
+            abort(400, message="Item is not a JSON object.")
+
+        if identifier is None:
+            abort(400, message="No id provided")
+
+        try:
+            if document is None:
+                document = self.document(
+                    **{identifier_fieldname: identifier}
+                )
+
+            document = self._process_document(data, document=document)
+            document.validate()
+            son = document.to_mongo()
+        except ValidationError, error:
+            self._abort_invalid(error)
+        except InvalidId:
+            abort(400, message=(
+                "The formatting for the identifier '{}' is invalid".format(
+                    identifier
+                )
+            ))
+
+        identifier_db_field = (
+            self.document._fields[identifier_fieldname].db_field
+        )
+        provided = [
+            self.document._fields[fieldname].db_field
+            for fieldname, field in self.serializer._fields().items()
+            if not field.readonly and not field.identifier and
+            fieldname in self.document._fields and fieldname in data
+        ]
+        update = {
+            '$set': {
+                db_field: son[db_field]
+                for db_field in provided if db_field in son
+            },
+            '$unset': {
+                db_field: ''
+                for db_field in provided if db_field not in son
+            },
+            '$setOnInsert': {
+                db_field: value for db_field, value in son.items()
+                if db_field not in provided and
+                db_field not in ('_id', identifier_db_field)
+            }
+        }
+
+        if self.etag_field:
+            self._increment_version(update)
+
+        for operator, changes in update.items():
+            if not changes:
+                del update[operator]
+
+        selector = {identifier_db_field: son[identifier_db_field]}
+        base_query = self.get_base_list()._query
+
+        if base_query:
+            selector = {'$and': [base_query, selector]}
+
+        return selector, update
+
+    def _write_error_result(self, write_error, message):
+        """
+        Returns the `status` and `message` for the `write_error` of a
+        bulk operation. Duplicate key errors give a 409, other errors a
+        400 with `message`.
+        """
+
+        if write_error['code'] in (11000, 11001):
+            return {
+                'status': 409,
+                'message': (
+                    "One or more fields are not unique. Please consult "
+                    "the scheme of the resource and ensure that you "
+                    "satisfy unique constraints."
+                )
+            }
+        else:
+            return {'status': 400, 'message': message}
+
+    def put_document(self, *args, **kwargs):
+        """
+        Returns the document that will be updated on HTTP PUT methods.
+
+        It will have the same parameters that are passed to the regular
+        `put()` method.
+
+        The default behaviour is to get the document based on the id
+        supplied in the URL. This assumes that there is a URL endpoint
+        in the form of `path_to_this_resource/<id>/`. If the id is not
+        provided it will `abort()` with an appropriate error message.
+
+        You can overwrite this method to alter the default behaviour.
+        """
+        return self.target_document
+
+    def patch(self, *args, **kwargs):
+        """
+        Processes a HTTP PATCH request.
+
+        Expects a JSON Patch (RFC 6902) or a JSON Merge Patch (RFC 7396)
+        document. The paths in the patch are validated against the
+        serializer and the operations are compiled into one atomic
+        MongoDB update, so the document doesn't have to be loaded and
+        concurrent updates of other fields are not overwritten.
+
+        Returns a 204 response if the document was updated.
+
+        A PATCH request on the listview at the base of the resource is
+        handled by `patch_documents()`.
+        """
+
+        if self.is_base_document and self.target_list is not None:
+            return self.patch_documents()
+
+        if self.target_list is not None:
+            abort(405, message=(
+                "Can't PATCH a list. Use POST to add items to it."
+            ))
+
+        if not self.is_base_document:
+            abort(405, message=(
+                "PATCH is only supported on the documents at the base of "
+                "this resource. Use the paths in the patch to change "
+                "embedded data."
+            ))
+
+        compiler = self._compile_patch()
+
+        if self.target_identifier is not None:
+            queryset = self.get_base_list_by_identifier(self.target_identifier)
+        else:
+            queryset = self.document.objects(pk=self.target_document.pk)
+
+        if self.etags and not self.etag_field and request.if_match:
+            # The hash of the document can't be checked by the update,
+            # so load the document to check it.
+            try:
+                self._check_if_match(
+                    self._limit_time(queryset.clone()).first()
+                )
+            except ValidationError:
+                self._check_if_match(None)
 
-        else:
+        version_condition = self._if_match_condition()
 
-            document = self.target_document_obj(
-                **self.target_serializer.deserialize(self._request_data())
+        if self.etag_field:
+            self._increment_version(compiler.update)
+
+        try:
+            result = self._update_documents(
+                queryset.filter(
+                    __raw__=dict(compiler.conditions, **version_condition)
+                ),
+                compiler.update
             )
+            exists = result['n'] or (
+                self._limit_time(queryset.clone(), 'count').count()
+            )
+        except ValidationError:
+            abort(400, message=(
+                "The formatting for the identifier '{}' is invalid".format(
+                    self.target_identifier
+                )
+            ))
 
-            for fieldname in document:
+        if not exists:
+            abort(404, message=(
+                "The resource specified with identifier '{}' "
+                "could not be found".format(self.target_identifier)
+            ))
 
-                if getattr(self.target_serializer, fieldname).identifier:
-                    # Ignore the identifier field because we already
-                    # have the values for him.
-                    continue
+        if not result['n']:
 
-                put_document[fieldname] = document[fieldname]
+            if (
+                version_condition and
+                not self._limit_time(
+                    queryset.filter(__raw__=version_condition), 'count'
+                ).count()
+            ):
+                self._abort_precondition_failed()
 
-            if self.create:
-                # If the document is new we still need to add this
-                # document to the list.
-                self.target_list.append(put_document)
+            abort(409, message=(
+                "A 'test' operation in the patch failed, the document was "
+                "not changed."
+            ))
 
-            self._save_document(self.base_document)
-            response = self.target_serializer.serialize(put_document)
+        return self.make_response(None, 204)
 
-        if self.create:
-            status_code = 201
-        else:
-            status_code = 200
+    def patch_documents(self):
+        """
+        Applies the patch in the request to all documents that match the
+        filters in the query string, with one MongoDB update, without
+        loading the documents. Like deleting by filters, this requires
+        at least one filter and the `confirm_query_param` set to `true`.
 
-        return self.make_response(response, status_code)
+        The patch is validated against the serializer like the patch of
+        a single document, so only the writable fields can be changed.
+        Documents that don't pass a `test` operation are not changed.
 
-    def put_document(self, *args, **kwargs):
+        Returns the number of `matched` and `modified` documents.
         """
-        Returns the document that will be updated on HTTP PUT methods.
 
-        It will have the same parameters that are passed to the regular
-        `put()` method.
+        documents = self._get_confirmed_documents()
+        compiler = self._compile_patch()
 
-        The default behaviour is to get the document based on the id
-        supplied in the URL. This assumes that there is a URL endpoint
-        in the form of `path_to_this_resource/<id>/`. If the id is not
-        provided it will `abort()` with an appropriate error message.
+        if self.etag_field:
+            self._increment_version(compiler.update)
 
-        You can overwrite this method to alter the default behaviour.
+        result = self._update_documents(
+            documents.filter(__raw__=compiler.conditions),
+            compiler.update,
+            multi=True
+        )
+
+        return self.make_response({
+            'matched': result['n'],
+            # MongoDB versions before 2.6 don't report the number of
+            # modified documents.
+            'modified': result.get('nModified', result['n'])
+        })
+
+    def _compile_patch(self):
         """
-        return self.target_document
+        Returns a `PatchCompiler` with the patch document of the request
+        compiled. Calls `abort(400)` if the patch is invalid.
+        """
+
+        request_data = self._request_data()
+
+        if request.mimetype == self.accepted_content_type:
+            json_patch = isinstance(request_data, list)
+        else:
+            json_patch = request.mimetype == 'application/json-patch+json'
+
+        compiler = PatchCompiler(self.target_serializer, self.document)
+
+        try:
+            if json_patch:
+                compiler.compile_json_patch(request_data)
+            else:
+                compiler.compile_merge_patch(request_data)
+        except InvalidPatch, error:
+            abort(400, message=error.message)
+        except SerializerError, error:
+            abort(400, message=self._deserialize_error_message(error))
+
+        return compiler
 
     def delete(self, *args, **kwargs):
         """
         Processes a HTTP DELETE request.
+
+        A DELETE request on the listview at the base of the resource, or
+        on multiple comma separated identifiers, is handled by
+        `delete_documents()`.
         """
 
+        if self.is_base_document and self.target_list is not None:
+            return self.delete_documents()
+
         if not self.target_document:
             abort(400, message="No id provided")
 
+        self._check_if_match(self.base_document)
+
         if self.is_base_document:
-            self.target_document.delete()
+
+            version_condition = self._if_match_condition()
+
+            if version_condition:
+
+                # Delete the document only if it still has the version
+                # the client expects.
+                deleted = self._delete_documents(
+                    self.document.objects(pk=self.target_document.pk)
+                    .filter(__raw__=version_condition)
+                )
+
+                if not deleted:
+                    self._abort_precondition_failed()
+
+            else:
+                self.target_document.delete()
+                self._invalidate_caches()
+
         else:
 
             if self.target_parent_list:
@@ -925,18 +3406,69 @@ class MongoEngineResource(Resource):
 
         return self.make_response(None, 204)
 
+    def delete_documents(self):
+        """
+        Deletes multiple documents with one MongoDB operation, without
+        loading them, and returns the number of deleted documents.
+
+        The documents are either the documents with the identifiers in
+        the URL, or all documents that match the filters in the query
+        string. To prevent accidents, deleting by filters requires at
+        least one filter and the `confirm_query_param` set to `true`.
+        """
+
+        if self.target_identifiers is not None:
+            documents = self.target_list
+        else:
+
+            documents = self._get_confirmed_documents()
+
+        deleted = self._delete_documents(documents, multi=True)
+
+        return self.make_response({'deleted': deleted})
+
+    def _get_confirmed_documents(self):
+        """
+        Returns the documents that match the filters (and the text
+        search) in the query string of a request that changes all of
+        them.
+
+        Aborts with a 400 if there are no filters or if the request is
+        not confirmed with the `confirm_query_param` set to `true`.
+        """
+
+        filters = self._get_filters(request.args.to_dict())
+
+        if not filters and not self._text_search_requested():
+            abort(400, message="No id or filters provided")
+
+        if request.args.get(self.confirm_query_param) != 'true':
+            abort(400, message=(
+                "Add '{}=true' to the query string to confirm the change "
+                "of all documents that match the filters."
+                .format(self.confirm_query_param)
+            ))
+
+        return self._filter_text_search(
+            self._all_target_documents().filter(**filters)
+        )
+
     def _request_data(self):
         """
         Returns the data in the HTTP request as a Python dict.
 
-        If the data is not provided or is invalid JSON, it will
+        If the data is not provided or can't be decoded, it will
         `abort()` with an appropriate error message.
         """
 
+        codec = self.get_request_codec()
+
         try:
-            data = request.json
-        except BadRequest:
-            abort(400, message="Request data is not valid JSON.")
+            data = codec.loads(self._request_body())
+        except ValueError, error:
+            abort(400, message="Request data is not valid {}: {}".format(
+                codec.name, error
+            ))
 
         if not data:
             abort(400, message="No data provided in request.")
@@ -945,6 +3477,132 @@ class MongoEngineResource(Resource):
             return self.process_request_data_post(data)
         elif request.method == 'PUT':
             return self.process_request_data_put(data)
+        elif request.method == 'PATCH':
+            return self.process_request_data_patch(data)
+
+    def _request_decompressor(self):
+        """
+        Returns a zlib decompressor for the `Content-Encoding` of the
+        request body, or `None` if the body is not compressed.
+
+        Calls `abort(415)` if the encoding is not supported.
+        """
+
+        encoding = request.headers.get('Content-Encoding', 'identity')
+        encoding = encoding.strip().lower()
+
+        if encoding == 'identity':
+            return None
+        elif encoding in ('gzip', 'x-gzip'):
+            # Add 16 to the window size to expect a gzip header
+            return zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif encoding == 'deflate':
+            return zlib.decompressobj()
+        else:
+            abort(415, message=(
+                "Invalid Content-Encoding header '{}'. This resource only "
+                "supports 'gzip' and 'deflate'.".format(encoding)
+            ))
+
+    def _request_body(self):
+        """
+        Returns the body of the request, decompressed if it was
+        compressed.
+
+        Calls `abort(413)` if the decompressed body is larger than
+        `max_decompressed_size`.
+        """
+
+        decompressor = self._request_decompressor()
+
+        if decompressor is None:
+            return request.get_data()
+
+        try:
+            data = decompressor.decompress(
+                request.get_data(), self.max_decompressed_size
+            )
+        except zlib.error:
+            abort(400, message="Request data could not be decompressed.")
+
+        if decompressor.unconsumed_tail:
+            abort(413, message=(
+                "The decompressed request data is larger than {} bytes."
+                .format(self.max_decompressed_size)
+            ))
+
+        return data
+
+    def _request_lines(self, max_line_size=None):
+        """
+        Returns an iterator over the lines of the request body, which is
+        read (and decompressed if it was compressed) in chunks, so it
+        never is in memory as a whole.
+
+        Lines longer than `max_line_size` bytes are skipped without
+        keeping them in memory, and `None` is returned in their place.
+
+        Raises a `zlib.error` if the body can't be decompressed.
+        """
+
+        chunk_size = 64 * 1024
+        decompressor = self._request_decompressor()
+
+        def read_chunks():
+
+            while True:
+
+                chunk = request.stream.read(chunk_size)
+
+                if not chunk:
+                    break
+
+                if decompressor is None:
+                    yield chunk
+                    continue
+
+                # Decompress at most a chunk at a time, so a highly
+                # compressed line is skipped before it fills the memory.
+                yield decompressor.decompress(chunk, chunk_size)
+
+                while decompressor.unconsumed_tail:
+                    yield decompressor.decompress(
+                        decompressor.unconsumed_tail, chunk_size
+                    )
+
+            if decompressor is not None:
+                yield decompressor.flush()
+
+        def too_long(line):
+            return max_line_size is not None and len(line) > max_line_size
+
+        buffer = b''
+        skipping = False
+
+        for chunk in read_chunks():
+
+            lines = (buffer + chunk).split(b'\n')
+            buffer = lines.pop()
+
+            for line in lines:
+                if skipping:
+                    # The end of a line that is too long
+                    skipping = False
+                elif too_long(line):
+                    yield None
+                else:
+                    yield line
+
+            if too_long(buffer):
+
+                if not skipping:
+                    yield None
+                    skipping = True
+
+                buffer = b''
+
+        if buffer and not skipping:
+            yield buffer
 
     def process_request_data_post(self, data):
         """
@@ -972,6 +3630,20 @@ class MongoEngineResource(Resource):
         """
         return self.process_request_data(data)
 
+    def process_request_data_patch(self, data):
+        """
+        Processes the JSON decoded patch document send by a PATCH
+        request.
+
+        By default nothing happens with the data and it is returned as
+        is. You can however overwrite this method and add validation or
+        change the data before returning it.
+
+        If you add validation you should manually call `abort()` if the
+        validation fails.
+        """
+        return data
+
     def process_request_data(self, data):
         """
         Processes the JSON decoded data send by a POST or PUT request.
@@ -1019,6 +3691,17 @@ class MongoEngineResource(Resource):
         `abort` with an appropriate error message.
         """
 
+        try:
+            return self.target_serializer.deserialize(data, allow_readonly)
+        except SerializerError, error:
+            abort(400, message=self._deserialize_error_message(error))
+
+    def _deserialize_error_message(self, error):
+        """
+        Returns a user friendly message for the `SerializerError`
+        exception `error` that occurred during deserialization.
+        """
+
         def parent_traceback(parents):
             """
             Returns a traceback of the parents of the field, so it's
@@ -1039,20 +3722,14 @@ class MongoEngineResource(Resource):
             else:
                 return ''
 
-        try:
-
-            return self.target_serializer.deserialize(data, allow_readonly)
-
-        except UnknownField, error:
+        if isinstance(error, UnknownField):
 
             message = (
                 "There is no field '{}'{} on this resource."
                 .format(error.fieldname, parent_traceback(error.parents))
             )
 
-            abort(400, message=message)
-
-        except ValueInvalidType, error:
+        elif isinstance(error, ValueInvalidType):
 
             message = (
                 "The value for field '{}'{} is of type '{}' but should be of "
@@ -1065,9 +3742,7 @@ class MongoEngineResource(Resource):
                 )
             )
 
-            abort(400, message=message)
-
-        except ValueInvalidFormat, error:
+        elif isinstance(error, ValueInvalidFormat):
 
             message = (
                 "The value '{}' for field '{}'{} could not be parsed. "
@@ -1080,9 +3755,7 @@ class MongoEngineResource(Resource):
                 )
             )
 
-            abort(400, message=message)
-
-        except DataInvalidType, error:
+        elif isinstance(error, DataInvalidType):
 
             if error.parents:
 
@@ -1102,7 +3775,10 @@ class MongoEngineResource(Resource):
             else:
                 message = "Invalid JSON."
 
-            abort(400, message=message)
+        else:
+            message = "The data could not be deserialized."
+
+        return message
 
     def _create_document(self, data):
         """
@@ -1309,41 +3985,238 @@ class MongoEngineResource(Resource):
         successfully saved.
         """
 
+        if (
+            self.etag_field and isinstance(document, self.document) and
+            not document._created
+        ):
+            self._save_versioned_document(document)
+            return
+
+        self._init_version(document)
+
         try:
             document.save()
+            self._invalidate_caches()
         except NotUniqueError, error:
+            self._abort_not_unique(error)
+        except ValidationError, error:
+            self._abort_invalid(error)
 
-            if self.allow_not_unique_error(error):
+    def _init_version(self, document):
+        """
+        Sets the `etag_field` of the new `document` to 1 if it has no
+        version yet.
+        """
 
-                abort(409, message=(
-                    "One or more fields are not unique. Please consult "
-                    "the scheme of the resource and ensure that you "
-                    "satisfy unique constraints."),
-                    error=unicode(error.message)
-                )
+        if self.etag_field and isinstance(document, self.document):
+            if document[self.etag_field] is None:
+                document[self.etag_field] = 1
 
-            else:
-                abort(409, message=(
-                    "One or more fields are not unique. Please consult "
-                    "the scheme of the resource and ensure that you "
-                    "satisfy unique constraints."
-                ))
+    def _save_versioned_document(self, document):
+        """
+        Saves the changes of the existing `document` with one atomic
+        update that also increments its `etag_field`.
+
+        If the request has an `If-Match` header, the update is a
+        compare-and-swap: it's only executed if the document still has
+        the version from the header. Otherwise `abort(412)` is called.
+        """
 
+        try:
+            document.validate()
         except ValidationError, error:
+            self._abort_invalid(error)
+
+        updates, removals = document._delta()
+        update = {}
+
+        if updates:
+            update['$set'] = updates
+        if removals:
+            update['$unset'] = removals
+
+        self._increment_version(update)
+
+        queryset = self.document.objects(pk=document.pk).filter(
+            __raw__=self._if_match_condition()
+        )
+        db_field = self.document._fields[self.etag_field].db_field
+
+        try:
+            result = queryset._collection.find_and_modify(
+                queryset._query, update, new=True, fields={db_field: True}
+            )
+        except DuplicateKeyError, error:
+            self._abort_not_unique(error)
+        except OperationFailure:
+            abort(400, message=(
+                "The update could not be applied to the document."
+            ))
+
+        if result is None:
+            self._abort_precondition_failed()
 
-            resource_errors = self._filter_validation_errors(error.errors)
+        document[self.etag_field] = (
+            self.document._fields[self.etag_field].to_python(result[db_field])
+        )
+        document._clear_changed_fields()
+        self._invalidate_caches()
+
+    def _increment_version(self, update):
+        """
+        Adds the increment of the `etag_field` to the MongoDB `update`
+        document, and removes other changes of the field from it.
+        """
+
+        db_field = self.document._fields[self.etag_field].db_field
+
+        for operator in update.values():
+            operator.pop(db_field, None)
+
+        for operator, changes in update.items():
+            if not changes:
+                del update[operator]
+
+        update.setdefault('$inc', {})[db_field] = 1
+
+    def _if_match_condition(self):
+        """
+        Returns the query condition (a dict) for the versions the
+        `If-Match` header of the request allows. The dict is empty if
+        `etag_field` is not set or if any version is allowed.
+
+        Weak ETags never match, as required for `If-Match`.
+        """
+
+        if (
+            not self.etags or not self.etag_field or not request.if_match or
+            request.if_match.star_tag
+        ):
+            return {}
+
+        field = self.document._fields[self.etag_field]
 
-            if resource_errors:
-                abort(
-                    400,
-                    message="The data did not validate.",
-                    errors=resource_errors
+        return {
+            field.db_field: {'$in': [
+                field.to_mongo(
+                    field.to_python(self._strip_etag_encoding(etag))
                 )
-            else:
-                # If there were no errors on resource fields, it means
-                # the user of the resource can't help it, so it's a
-                # server error, so we reraise the exception.
-                raise
+                for etag in request.if_match.as_set()
+            ]}
+        }
+
+    def _check_if_match(self, document):
+        """
+        Calls `abort(412)` if the request has an `If-Match` header and
+        the base `document` doesn't exist (is `None`) or doesn't have
+        a matching ETag.
+
+        If `etag_field` is set the ETag is checked by the atomic
+        operation that changes the document instead.
+        """
+
+        if not self.etags or not request.if_match:
+            return
+
+        if document is None:
+            self._abort_precondition_failed()
+
+        if not self.etag_field and not self._etag_matches(
+            request.if_match, self.get_document_etag(document)
+        ):
+            self._abort_precondition_failed()
+
+    def _abort_precondition_failed(self):
+        """
+        Aborts with a 412 response because the document was changed
+        since the client fetched it.
+        """
+        abort(412, message=(
+            "The resource was changed since you fetched it. Fetch it "
+            "again and retry your request with its current ETag in the "
+            "If-Match header."
+        ))
+
+    def _abort_invalid(self, error):
+        """
+        Aborts with a 400 response for the validation `error` of a
+        document.
+        """
+
+        resource_errors = self._filter_validation_errors(error.errors)
+
+        if resource_errors:
+            abort(
+                400,
+                message="The data did not validate.",
+                errors=resource_errors
+            )
+        else:
+            # If there were no errors on resource fields, it means
+            # the user of the resource can't help it, so it's a
+            # server error, so we reraise the exception.
+            raise
+
+    def _update_documents(self, queryset, update, multi=False):
+        """
+        Executes the MongoDB `update` document as one atomic operation
+        on the documents that match `queryset`, without loading them.
+
+        Returns the result of the update as returned by PyMongo.
+
+        Will call `abort(409)` if the update violates a unique
+        constraint and `abort(400)` if MongoDB rejects the update.
+        """
+
+        try:
+            result = queryset._collection.update(
+                queryset._query, update, multi=multi
+            )
+        except DuplicateKeyError, error:
+            self._abort_not_unique(error)
+        except OperationFailure:
+            abort(400, message=(
+                "The update could not be applied to the document."
+            ))
+
+        self._invalidate_caches(multi)
+
+        return result
+
+    def _delete_documents(self, queryset, multi=False):
+        """
+        Deletes the documents that match `queryset` with one MongoDB
+        operation, without loading them.
+
+        Returns the number of deleted documents.
+        """
+
+        result = queryset._collection.remove(queryset._query)
+        self._invalidate_caches(multi)
+
+        return result['n']
+
+    def _abort_not_unique(self, error):
+        """
+        Aborts with a 409 response for the `error` that was raised
+        because one or more fields are not unique.
+        """
+
+        if self.allow_not_unique_error(error):
+
+            abort(409, message=(
+                "One or more fields are not unique. Please consult "
+                "the scheme of the resource and ensure that you "
+                "satisfy unique constraints."),
+                error=unicode(error.message)
+            )
+
+        else:
+            abort(409, message=(
+                "One or more fields are not unique. Please consult "
+                "the scheme of the resource and ensure that you "
+                "satisfy unique constraints."
+            ))
 
     def _filter_validation_errors(self, errors):
         """
@@ -1438,8 +4311,9 @@ class MongoEngineResource(Resource):
 
     def allow_not_unique_error(self, error):
         """
-        This method receives `NotUniqueError` exceptions. It is called
-        by `_save_document()`. This method decides if the MongoDB error
+        This method receives `NotUniqueError` exceptions (or PyMongo's
+        `DuplicateKeyError` for atomic updates). It is called by
+        `_abort_not_unique()`. This method decides if the MongoDB error
         message that was raised can be shown in the response of the
         resource.
 
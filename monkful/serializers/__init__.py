@@ -43,6 +43,18 @@ class Serializer(object):
             if not field.writeonly
         }
 
+    def serialize_native(self, document):
+        """
+        Returns serialized data for the provided document, for a format
+        that supports values like ObjectIds and datetimes natively (like
+        BSON), so they are not converted.
+        """
+        return {
+            fieldname: field.serialize_native(getattr(document, fieldname))
+            for fieldname, field in self._fields().items()
+            if not field.writeonly
+        }
+
     def deserialize(self, data, allow_readonly=False):
         """
         Returns the given data deserialized.
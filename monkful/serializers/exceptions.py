@@ -91,8 +91,8 @@ class ValueInvalidType(FieldError):
 
 class ValueInvalidFormat(FieldError):
     """
-    Raised when an invalid ISO date format is provided for a
-    `DateTimeField`.
+    Raised when a value is provided that can't be parsed in the format
+    of the field, like an invalid ISO date for a `DateTimeField`.
     """
 
     def __init__(self, field, format_name, value, *args, **kwargs):
@@ -108,8 +108,8 @@ class ValueInvalidFormat(FieldError):
 
         message = (
             "The value '{}' for field '{}' could not be parsed. "
-            "Note that it should be in ISO 8601 format."
-            .format(value, field.name)
+            "Note that it should be in {} format."
+            .format(value, field.name, format_name)
         )
 
         super(ValueInvalidFormat, self).__init__(
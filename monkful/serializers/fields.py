@@ -1,6 +1,8 @@
 import inspect
 import dateutil.parser
+from datetime import datetime
 from bson.objectid import ObjectId
+from bson.errors import InvalidId
 from .exceptions import (
     FieldError, ValueInvalidType, ValueInvalidFormat,
     SerializeWriteonlyField, InvalidFieldSerializer
@@ -25,6 +27,12 @@ class Field(object):
     # FloatField should accept `int` types and typecast them to `float`.
     allowed_typecasts = []
 
+    # The Python type of the value of the field, if formats like BSON
+    # and MessagePack can represent it natively while JSON can't. Values
+    # of this type are not converted when serializing to or
+    # deserializing from these formats.
+    native_type = None
+
     def __init__(self, **kwargs):
 
         # Name of the field
@@ -79,6 +87,31 @@ class Field(object):
         else:
             return self._serialize(value)
 
+    def serialize_native(self, value):
+        """
+        Returns the serialized value of the field for a format that
+        supports the `native_type` of the field, like BSON.
+        """
+
+        if self.writeonly:
+            raise SerializeWriteonlyField(self)
+
+        if value is None:
+            return None
+        else:
+            return self._serialize_native(value)
+
+    def _serialize_native(self, value):
+        """
+        Returns the given `value` as is if it's of the `native_type` of
+        the field, otherwise serializes it with `_serialize()`.
+        """
+
+        if self.native_type and isinstance(value, self.native_type):
+            return value
+        else:
+            return self._serialize(value)
+
     def _serialize(self, value):
         """
         By default returns the given `value` as is, but if a field needs
@@ -94,6 +127,10 @@ class Field(object):
 
         if value is None:
             return None
+        elif self.native_type and isinstance(value, self.native_type):
+            # The value was decoded from a format that supports the
+            # type natively, so it's already deserialized.
+            return value
         else:
             return self._deserialize(
                 self.decode_value(value),
@@ -197,6 +234,7 @@ class DateTimeField(Field):
     """
 
     deserialize_type = unicode
+    native_type = datetime
 
     def _serialize(self, value):
         return value.isoformat()
@@ -234,6 +272,9 @@ class DocumentField(Field):
     def _serialize(self, data):
         return self.sub_serializer.serialize(data)
 
+    def _serialize_native(self, data):
+        return self.sub_serializer.serialize_native(data)
+
     def _deserialize(self, data, allow_readonly=False, **kwargs):
 
         try:
@@ -278,12 +319,30 @@ class ListField(Field):
 
         self.sub_field = sub_field
 
+        # The maximum number of items of the list in the listview of a
+        # resource. The list is sliced by MongoDB and the total number of
+        # items is added to the documents as `<fieldname>_count`.
+        self.max_items_in_list = kwargs.get('max_items_in_list')
+
+        # If the 'first' or the 'last' items of the list are kept when
+        # it's sliced.
+        self.max_items_direction = kwargs.get('max_items_direction', 'first')
+
+        if self.max_items_direction not in ('first', 'last'):
+            raise ValueError(
+                "max_items_direction should be 'first' or 'last', not "
+                "'{}'.".format(self.max_items_direction)
+            )
+
         super(ListField, self).__init__(*args, **kwargs)
 
     def _serialize(self, field_list):
         # Uses the `sub_field` to serialize the items in the list
         return [self.sub_field.serialize(item) for item in field_list]
 
+    def _serialize_native(self, field_list):
+        return [self.sub_field.serialize_native(item) for item in field_list]
+
     def _deserialize(self, field_list, allow_readonly=False, **kwargs):
         # Uses the `sub_serializer` to deserialize the items in the list
         return [
@@ -301,12 +360,17 @@ class ObjectIdField(Field):
 
     readonly = True
     deserialize_type = unicode
+    native_type = ObjectId
 
     def _serialize(self, value):
         return unicode(value)
 
     def _deserialize(self, value, **kwargs):
-        return ObjectId(value)
+
+        try:
+            return ObjectId(value)
+        except InvalidId:
+            raise ValueInvalidFormat(self, 'ObjectId', value)
 
 
 class DynamicField(Field):
@@ -324,6 +388,7 @@ class ReferenceField(Field):
     """
 
     deserialize_type = unicode
+    native_type = ObjectId
 
     def _serialize(self, value):
         return unicode(value)
@@ -1,8 +1,94 @@
 from monkful.resources import MongoEngineResource
+from monkful.cache import LRUCache
 from documents import Article
-from serializers import ArticleSerializer
+from serializers import (
+    ArticleSerializer, RawArticleSerializer, ArticleListSerializer,
+    SlicedArticleListSerializer
+)
 
 
 class ArticleResource(MongoEngineResource):
     document = Article
     serializer = ArticleSerializer
+    allow_export = True
+    allow_import = True
+    allow_aggregate = True
+    allow_text_search = True
+    text_score_field = 'score'
+
+
+class CachedArticleResource(MongoEngineResource):
+    document = Article
+    serializer = ArticleSerializer
+    list_cache = LRUCache()
+    document_cache = LRUCache(max_size=100)
+
+
+class VersionedArticleResource(MongoEngineResource):
+    document = Article
+    serializer = ArticleSerializer
+    etags = True
+    etag_field = 'version'
+    compress = True
+    compress_min_size = 0
+
+
+class StreamedArticleResource(MongoEngineResource):
+    document = Article
+    serializer = ArticleSerializer
+    stream_lists = True
+    stream_batch_size = 2
+    compress = True
+
+
+class RawArticleResource(MongoEngineResource):
+    document = Article
+    serializer = RawArticleSerializer
+    raw_bson_passthrough = True
+
+
+class ArticleListResource(MongoEngineResource):
+    document = Article
+    serializer = ArticleSerializer
+    list_serializer = ArticleListSerializer
+
+
+class SlicedArticleListResource(MongoEngineResource):
+    document = Article
+    serializer = ArticleSerializer
+    list_serializer = SlicedArticleListSerializer
+
+
+class DeepPagingArticleResource(MongoEngineResource):
+    document = Article
+    serializer = ArticleSerializer
+    allow_export = True
+    max_offset = 200
+
+
+class SlowArticleResource(MongoEngineResource):
+    document = Article
+    serializer = ArticleSerializer
+    max_time_ms = 10
+
+    def get_base_list(self):
+        # Every document takes 100ms to match
+        return self.document.objects(
+            __raw__={'$where': 'sleep(100) || true'}
+        )
+
+
+class BrokenArticleResource(MongoEngineResource):
+    document = Article
+    serializer = ArticleSerializer
+
+    def get_base_list(self):
+        raise RuntimeError("Broken resource")
+
+
+class PublishedArticleResource(MongoEngineResource):
+    document = Article
+    serializer = ArticleSerializer
+
+    def get_base_list(self):
+        return self.document.objects(publish=True)
@@ -27,3 +27,29 @@ class ArticleSerializer(Serializer):
     version = fields.FloatField()
     order = fields.IntField()
     serial_number = fields.LongField()
+
+
+class RawArticleSerializer(Serializer):
+    id = fields.ObjectIdField(identifier=True)
+    title = fields.StringField()
+    text = fields.StringField(writeonly=True)
+    tags = fields.ListField(fields.StringField())
+    publish = fields.BooleanField()
+    publish_date = fields.DateTimeField()
+
+
+class ArticleListSerializer(Serializer):
+    id = fields.ObjectIdField(identifier=True)
+    title = fields.StringField()
+    publish_date = fields.DateTimeField()
+
+
+class SlicedArticleListSerializer(Serializer):
+    id = fields.ObjectIdField(identifier=True)
+    title = fields.StringField()
+    comments = fields.ListField(
+        fields.DocumentField(CommentSerializer),
+        max_items_in_list=2,
+        max_items_direction='last'
+    )
+    tags = fields.ListField(fields.StringField(), max_items_in_list=1)
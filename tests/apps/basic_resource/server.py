@@ -2,7 +2,13 @@ import sys
 from flask import Flask
 from flask.ext import restful
 from mongoengine import connect
-from resources import ArticleResource
+from monkful.batch import BatchResource
+from resources import (
+    ArticleResource, CachedArticleResource, VersionedArticleResource,
+    StreamedArticleResource, RawArticleResource, ArticleListResource,
+    SlicedArticleListResource, DeepPagingArticleResource, SlowArticleResource,
+    BrokenArticleResource, PublishedArticleResource
+)
 
 
 connect('unittest_monkful')
@@ -13,6 +19,57 @@ api.add_resource(
     '/articles/',
     '/articles/<path:path>'
 )
+api.add_resource(
+    CachedArticleResource,
+    '/cached_articles/',
+    '/cached_articles/<path:path>'
+)
+api.add_resource(
+    VersionedArticleResource,
+    '/versioned_articles/',
+    '/versioned_articles/<path:path>'
+)
+api.add_resource(
+    StreamedArticleResource,
+    '/streamed_articles/',
+    '/streamed_articles/<path:path>'
+)
+api.add_resource(
+    RawArticleResource,
+    '/raw_articles/',
+    '/raw_articles/<path:path>'
+)
+api.add_resource(
+    ArticleListResource,
+    '/article_list/',
+    '/article_list/<path:path>'
+)
+api.add_resource(
+    SlicedArticleListResource,
+    '/sliced_articles/',
+    '/sliced_articles/<path:path>'
+)
+api.add_resource(
+    DeepPagingArticleResource,
+    '/deep_paging_articles/',
+    '/deep_paging_articles/<path:path>'
+)
+api.add_resource(
+    SlowArticleResource,
+    '/slow_articles/',
+    '/slow_articles/<path:path>'
+)
+api.add_resource(
+    BrokenArticleResource,
+    '/broken_articles/',
+    '/broken_articles/<path:path>'
+)
+api.add_resource(
+    PublishedArticleResource,
+    '/published_articles/',
+    '/published_articles/<path:path>'
+)
+api.add_resource(BatchResource, '/batch/')
 
 if __name__ == '__main__':
     if 'shell' in sys.argv:
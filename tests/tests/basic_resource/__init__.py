@@ -1,18 +1,51 @@
+from batch import *
 from delete import *
+from delete_bulk import *
+from delete_if_match import *
 from delete_invalid_documentfield import *
 from delete_listfield_item import *
 from delete_listfield_item_listfield_item import *
+from export import *
+from get_aggregate import *
+from get_distinct import *
 from get_item import *
+from get_item_bson import *
+from get_item_cache import *
 from get_item_documentfield import *
+from get_item_etag import *
+from get_item_etag_gzip import *
 from get_item_field import *
+from get_item_json_codec import *
 from get_item_listfield import *
 from get_item_listfield_item import *
 from get_item_listfield_item_field import *
 from get_item_listfield_item_listfield import *
+from get_item_listfield_item_multiple import *
+from get_item_multiple import *
 from get_list import *
+from get_list_bson_raw import *
+from get_list_cache import *
+from get_list_etag import *
 from get_list_filters import *
+from get_list_filters_invalid import *
+from get_list_list_serializer import *
+from get_list_max_items import *
+from get_list_max_offset import *
+from get_list_max_time import *
 from get_list_paging import *
+from get_list_paging_per_page import *
+from get_list_stream import *
+from get_list_stream_gzip import *
+from get_list_text_search import *
+from get_list_text_search_views import *
+from patch import *
+from patch_bulk import *
+from patch_listfield_item import *
+from patch_merge import *
 from post import *
+from post_bson import *
+from post_bson_multiple import *
+from post_gzip import *
 from post_duplicate_value import *
 from post_invalid_item import *
 from post_invalid_json import *
@@ -21,6 +54,8 @@ from post_invalid_value_type_bool import *
 from post_invalid_value_type_int import *
 from post_invalid_value_type_obj import *
 from post_invalid_value_type_str import *
+from post_import import *
+from post_import_long_line import *
 from post_listfield import *
 from post_listfield_item_listfield import *
 from post_listfield_multiple import *
@@ -32,9 +67,13 @@ from post_multiple_unknown_field_in_embedded_document_in_list import *
 from post_unknown_field import *
 from post_unknown_field_in_embedded_document import *
 from post_unknown_field_in_embedded_document_in_list import *
+from put_bulk import *
+from put_bulk_existing import *
+from put_bulk_scoped import *
 from put_create import *
 from put_create_listfield_item import *
 from put_identifier_field import *
+from put_if_match import *
 from put_invalid_id import *
 from put_invalid_listfield import *
 from put_invalid_no_id import *
@@ -0,0 +1,91 @@
+import unittest
+import json
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article
+
+
+class ResourceBatch(unittest.TestCase):
+    """
+    Test if a batch request executes the sub-requests and returns their
+    results in order.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        cls.article_id = "528a5250aa2649ffd8ce8a90"
+        Article(id=cls.article_id, title="Test title").save()
+
+        cls.response = cls.app.post(
+            '/batch/',
+            data=json.dumps([
+                {'method': 'GET', 'path': '/articles/{}/'.format(cls.article_id)},
+                {'method': 'GET', 'path': '/articles/?title=Test%20title'},
+                {'method': 'POST', 'path': '/articles/', 'body': {
+                    'title': "Test title 2"
+                }},
+                {'method': 'GET', 'path': '/articles/'},
+                {'method': 'GET', 'path': '/articles/528a5250aa2649ffd8ce8a99/'},
+                {'method': 'GET', 'path': '/batch/'},
+                {'method': 'GET', 'path': '/broken_articles/'}
+            ]),
+            content_type='application/json'
+        )
+        cls.results = json.loads(cls.response.data)
+
+        cls.invalid_response = cls.app.post(
+            '/batch/',
+            data=json.dumps({'method': 'GET', 'path': '/articles/'}),
+            content_type='application/json'
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_code(self):
+        """
+        Test if the response status code is 200.
+        """
+        self.assertEqual(self.response.status_code, 200)
+
+    def test_statuses(self):
+        """
+        Test if the statuses of the sub-requests are returned in order.
+        """
+        self.assertEqual(
+            [result['status'] for result in self.results],
+            [200, 200, 201, 200, 404, 400, 500]
+        )
+
+    def test_bodies(self):
+        """
+        Test if the bodies of the sub-requests are returned as JSON.
+        """
+
+        self.assertEqual(self.results[0]['body']['id'], self.article_id)
+        self.assertEqual(len(self.results[1]['body']), 1)
+        self.assertEqual(self.results[2]['body']['title'], "Test title 2")
+
+        # The GET after the POST should see the new document
+        self.assertEqual(len(self.results[3]['body']), 2)
+
+    def test_exception(self):
+        """
+        Test if an exception in a sub-request gives a result with a 500
+        status, without failing the other sub-requests.
+        """
+        self.assertEqual(
+            self.results[6]['body']['message'],
+            "Internal Server Error"
+        )
+
+    def test_invalid(self):
+        """
+        Test if a batch request that isn't an array gives a 400.
+        """
+        self.assertEqual(self.invalid_response.status_code, 400)
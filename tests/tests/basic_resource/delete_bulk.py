@@ -0,0 +1,79 @@
+import unittest
+import json
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article
+
+
+class ResourceDeleteBulk(unittest.TestCase):
+    """
+    Test if HTTP DELETE requests on the listview delete the documents
+    that match the filters, or the documents with the identifiers.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        cls.article_ids = [
+            "528a5250aa2649ffd8ce8a90",
+            "528a5250aa2649ffd8ce8a91",
+            "528a5250aa2649ffd8ce8a92",
+            "528a5250aa2649ffd8ce8a93"
+        ]
+
+        for i, article_id in enumerate(cls.article_ids):
+            Article(
+                id=article_id,
+                title="Test title {}".format(i),
+                order=i % 2
+            ).save()
+
+        cls.unconfirmed_response = cls.app.delete(
+            '/articles/?order=1',
+            content_type='application/json'
+        )
+        cls.filter_response = cls.app.delete(
+            '/articles/?order=1&confirm=true',
+            content_type='application/json'
+        )
+        cls.identifiers_response = cls.app.delete(
+            '/articles/{},{}/'.format(cls.article_ids[0], cls.article_ids[1]),
+            content_type='application/json'
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_codes(self):
+        """
+        Test if the status codes are 400 without confirmation and 200
+        otherwise.
+        """
+        self.assertEqual(self.unconfirmed_response.status_code, 400)
+        self.assertEqual(self.filter_response.status_code, 200)
+        self.assertEqual(self.identifiers_response.status_code, 200)
+
+    def test_deleted_counts(self):
+        """
+        Test if the responses contain the number of deleted documents.
+        """
+        self.assertEqual(
+            json.loads(self.filter_response.data), {'deleted': 2}
+        )
+        # The second identifier was already deleted by the filter
+        self.assertEqual(
+            json.loads(self.identifiers_response.data), {'deleted': 1}
+        )
+
+    def test_remaining(self):
+        """
+        Test if only the document that didn't match remains.
+        """
+        self.assertEqual(
+            [unicode(article.id) for article in Article.objects],
+            [self.article_ids[2]]
+        )
@@ -0,0 +1,47 @@
+import unittest
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article
+
+
+class ResourceDeleteIfMatch(unittest.TestCase):
+    """
+    Test if a DELETE request with an `If-Match` header only deletes the
+    document if it still has the expected version.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        article = Article(title="Test title", version=2.0).save()
+        url = '/versioned_articles/{}/'.format(article.id)
+
+        cls.stale_response = cls.app.delete(
+            url, headers={'If-Match': '"1.0"'}
+        )
+        cls.stale_count = Article.objects.count()
+
+        cls.response = cls.app.delete(url, headers={'If-Match': '"2.0"'})
+        cls.count = Article.objects.count()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_codes(self):
+        """
+        Test if the stale delete fails with a 412 and the other one
+        succeeds.
+        """
+        self.assertEqual(self.stale_response.status_code, 412)
+        self.assertEqual(self.response.status_code, 204)
+
+    def test_deleted(self):
+        """
+        Test if the document was only deleted by the second request.
+        """
+        self.assertEqual(self.stale_count, 1)
+        self.assertEqual(self.count, 0)
@@ -0,0 +1,75 @@
+import unittest
+import json
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article
+
+
+class ResourceExport(unittest.TestCase):
+    """
+    Test if all filtered documents can be exported as newline-delimited
+    JSON, without paging.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        # More documents than fit on one page
+        for i in range(150):
+            Article(title="Test title", publish=i % 2 == 0).save()
+
+        cls.response = cls.app.get('/articles/!!export')
+        cls.filtered_response = cls.app.get('/articles/!!export?publish=1')
+        cls.accept_response = cls.app.get(
+            '/articles/',
+            headers={'Accept': 'application/x-ndjson'}
+        )
+        cls.not_allowed_response = cls.app.get('/cached_articles/!!export')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_codes(self):
+        """
+        Test if the response status codes are correct.
+        """
+        self.assertEqual(self.response.status_code, 200)
+        self.assertEqual(self.filtered_response.status_code, 200)
+        self.assertEqual(self.accept_response.status_code, 200)
+        self.assertEqual(self.not_allowed_response.status_code, 404)
+
+    def test_content_type(self):
+        """
+        Test if the content type is NDJSON.
+        """
+        self.assertEqual(
+            self.response.headers['content-type'],
+            'application/x-ndjson'
+        )
+
+    def test_all_documents(self):
+        """
+        Test if all documents are exported, one per line.
+        """
+
+        lines = self.response.data.splitlines()
+
+        self.assertEqual(len(lines), 150)
+        self.assertEqual(json.loads(lines[0])['title'], "Test title")
+        self.assertEqual(len(self.accept_response.data.splitlines()), 150)
+
+    def test_filtered(self):
+        """
+        Test if the filters are applied.
+        """
+
+        lines = self.filtered_response.data.splitlines()
+
+        self.assertEqual(len(lines), 75)
+
+        for line in lines:
+            self.assertTrue(json.loads(line)['publish'])
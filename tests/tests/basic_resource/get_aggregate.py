@@ -0,0 +1,86 @@
+import unittest
+import json
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article
+
+
+class ResourceGetAggregate(unittest.TestCase):
+    """
+    Test if the `!!aggregate` path returns the counts per value of a
+    field and the metrics of the documents that match the filters.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        Article(
+            title="Test title 1", tags=['tag1', 'tag2'], version=1.0,
+            order=1, publish=True
+        ).save()
+        Article(
+            title="Test title 2", tags=['tag2'], version=2.0, order=3,
+            publish=True
+        ).save()
+        Article(
+            title="Test title 3", tags=['tag3'], version=6.0, order=8,
+            publish=False
+        ).save()
+
+        cls.grouped_response = cls.app.get(
+            '/articles/!!aggregate?group_by=tags&metrics=avg:version,'
+            'max:order&publish=1',
+            content_type='application/json'
+        )
+        cls.total_response = cls.app.get(
+            '/articles/!!aggregate?metrics=sum:order,min:version',
+            content_type='application/json'
+        )
+        cls.invalid_response = cls.app.get(
+            '/articles/!!aggregate?metrics=avg:title',
+            content_type='application/json'
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_codes(self):
+        """
+        Test if the status codes are 200, and 400 for a metric on a
+        field that isn't numeric.
+        """
+        self.assertEqual(self.grouped_response.status_code, 200)
+        self.assertEqual(self.total_response.status_code, 200)
+        self.assertEqual(self.invalid_response.status_code, 400)
+
+    def test_groups(self):
+        """
+        Test if the groups are returned with their counts and metrics,
+        the largest group first.
+        """
+
+        groups = json.loads(self.grouped_response.data)
+
+        self.assertEqual(
+            groups[0],
+            {'value': 'tag2', 'count': 2, 'avg_version': 1.5, 'max_order': 3}
+        )
+        self.assertEqual(
+            groups[1],
+            {'value': 'tag1', 'count': 1, 'avg_version': 1.0, 'max_order': 1}
+        )
+        self.assertEqual(len(groups), 2)
+
+    def test_total(self):
+        """
+        Test if the metrics of all documents are returned without a
+        `group_by`.
+        """
+        self.assertEqual(
+            json.loads(self.total_response.data),
+            {'count': 3, 'sum_order': 12, 'min_version': 1.0}
+        )
@@ -0,0 +1,91 @@
+import unittest
+import json
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article, Comment
+
+
+class ResourceGetDistinct(unittest.TestCase):
+    """
+    Test if the `!!distinct` path returns the distinct values of a
+    field in the documents that match the filters.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        Article(
+            title="Test title 1",
+            tags=['tag1', 'tag2'],
+            publish=True,
+            comments=[Comment(text="Comment 1"), Comment(text="Comment 2")]
+        ).save()
+        Article(
+            title="Test title 2",
+            tags=['tag2', 'tag3'],
+            publish=True,
+            comments=[Comment(text="Comment 1")]
+        ).save()
+        Article(title="Test title 3", tags=['tag4'], publish=False).save()
+
+        cls.tags_response = cls.app.get(
+            '/articles/!!distinct/tags',
+            content_type='application/json'
+        )
+        cls.filtered_response = cls.app.get(
+            '/articles/!!distinct/tags?publish=1',
+            content_type='application/json'
+        )
+        cls.embedded_response = cls.app.get(
+            '/articles/!!distinct/comments/text',
+            content_type='application/json'
+        )
+        cls.writeonly_response = cls.app.get(
+            '/articles/!!distinct/comments/email',
+            content_type='application/json'
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_codes(self):
+        """
+        Test if the status codes are 200, and 404 for a writeonly
+        field.
+        """
+        self.assertEqual(self.tags_response.status_code, 200)
+        self.assertEqual(self.filtered_response.status_code, 200)
+        self.assertEqual(self.embedded_response.status_code, 200)
+        self.assertEqual(self.writeonly_response.status_code, 404)
+
+    def test_distinct(self):
+        """
+        Test if the distinct items of the lists are returned.
+        """
+        self.assertEqual(
+            sorted(json.loads(self.tags_response.data)),
+            ['tag1', 'tag2', 'tag3', 'tag4']
+        )
+
+    def test_filtered(self):
+        """
+        Test if only the values of the matching documents are returned.
+        """
+        self.assertEqual(
+            sorted(json.loads(self.filtered_response.data)),
+            ['tag1', 'tag2', 'tag3']
+        )
+
+    def test_embedded(self):
+        """
+        Test if the values of a field in embedded documents are
+        returned.
+        """
+        self.assertEqual(
+            sorted(json.loads(self.embedded_response.data)),
+            ['Comment 1', 'Comment 2']
+        )
@@ -0,0 +1,63 @@
+import unittest
+from datetime import datetime
+from bson import BSON, ObjectId
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article
+
+
+class ResourceGetItemBSON(unittest.TestCase):
+    """
+    Test if a document can be fetched as BSON, with a native ObjectId
+    and datetime.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        cls.article = Article(
+            title="Test title",
+            publish_date=datetime(2014, 1, 2, 3, 4, 5)
+        ).save()
+
+        cls.response = cls.app.get(
+            '/articles/{}/'.format(cls.article.id),
+            headers={'Accept': 'application/bson'}
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_code(self):
+        """
+        Test if the response status code is 200.
+        """
+        self.assertEqual(self.response.status_code, 200)
+
+    def test_content_type(self):
+        """
+        Test if the content type is BSON.
+        """
+        self.assertEqual(
+            self.response.headers['content-type'],
+            'application/bson'
+        )
+
+    def test_native_values(self):
+        """
+        Test if the ObjectId and datetime are not converted to strings.
+        """
+
+        data = BSON(self.response.data).decode()
+
+        self.assertEqual(data['title'], "Test title")
+        self.assertIsInstance(data['id'], ObjectId)
+        self.assertEqual(data['id'], self.article.id)
+        self.assertEqual(
+            data['publish_date'].replace(tzinfo=None),
+            datetime(2014, 1, 2, 3, 4, 5)
+        )
@@ -0,0 +1,74 @@
+import unittest
+import json
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article
+from apps.basic_resource.resources import CachedArticleResource
+
+
+class ResourceGetItemCache(unittest.TestCase):
+    """
+    Test if documents fetched by identifier are cached and invalidated
+    when the resource changes them.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+        CachedArticleResource.document_cache.clear()
+
+        article = Article(title="Test title", top_comment={}).save()
+        url = '/cached_articles/{}/'.format(article.id)
+
+        cls.first_response = cls.app.get(url)
+        cls.misses = CachedArticleResource.document_cache.misses
+
+        # Changes outside of the resource don't invalidate the cache
+        Article.objects(id=article.id).update(set__title="Changed title")
+
+        cls.cached_response = cls.app.get(url)
+        cls.hits = CachedArticleResource.document_cache.hits
+
+        cls.put_response = cls.app.put(
+            url,
+            headers={'content-type': 'application/json'},
+            data=json.dumps({'text': "Updated text"})
+        )
+
+        cls.invalidated_response = cls.app.get(url)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_codes(self):
+        """
+        Test if the response status codes are 200.
+        """
+        self.assertEqual(self.first_response.status_code, 200)
+        self.assertEqual(self.cached_response.status_code, 200)
+        self.assertEqual(self.put_response.status_code, 200)
+        self.assertEqual(self.invalidated_response.status_code, 200)
+
+    def test_cached(self):
+        """
+        Test if the second request is served from the cache.
+        """
+        self.assertEqual(self.misses, 1)
+        self.assertEqual(self.hits, 1)
+        self.assertEqual(
+            json.loads(self.cached_response.data)['title'],
+            "Test title"
+        )
+
+    def test_invalidated(self):
+        """
+        Test if a PUT on the document invalidates the cached document.
+        """
+
+        response_data = json.loads(self.invalidated_response.data)
+
+        self.assertEqual(response_data['text'], "Updated text")
+        self.assertEqual(response_data['title'], "Changed title")
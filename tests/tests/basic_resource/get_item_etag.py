@@ -0,0 +1,60 @@
+import unittest
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article
+
+
+class ResourceGetItemEtag(unittest.TestCase):
+    """
+    Test if a document gets an ETag based on its version field, and if a
+    request with a matching `If-None-Match` header gets a 304 response.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        article = Article(title="Test title", version=1.0).save()
+        cls.url = '/versioned_articles/{}/'.format(article.id)
+
+        cls.response = cls.app.get(cls.url)
+
+        cls.not_modified_response = cls.app.get(
+            cls.url,
+            headers={'If-None-Match': cls.response.headers['ETag']}
+        )
+
+        Article.objects(id=article.id).update(set__version=2.0)
+
+        cls.modified_response = cls.app.get(
+            cls.url,
+            headers={'If-None-Match': cls.response.headers['ETag']}
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_codes(self):
+        """
+        Test if the response status codes are correct.
+        """
+        self.assertEqual(self.response.status_code, 200)
+        self.assertEqual(self.not_modified_response.status_code, 304)
+        self.assertEqual(self.modified_response.status_code, 200)
+
+    def test_etags(self):
+        """
+        Test if the ETags are based on the version field.
+        """
+        self.assertEqual(self.response.headers['ETag'], '"1.0"')
+        self.assertEqual(self.not_modified_response.headers['ETag'], '"1.0"')
+        self.assertEqual(self.modified_response.headers['ETag'], '"2.0"')
+
+    def test_not_modified_body(self):
+        """
+        Test if the 304 response has no body.
+        """
+        self.assertEqual(self.not_modified_response.data, '')
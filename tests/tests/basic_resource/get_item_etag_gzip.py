@@ -0,0 +1,64 @@
+import unittest
+import json
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article
+
+
+class ResourceGetItemEtagGzip(unittest.TestCase):
+    """
+    Test if a compressed response gets the encoding in its ETag, and if
+    that ETag can be used in the `If-None-Match` and `If-Match` headers.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        article = Article(title="Test title", version=1.0).save()
+        cls.url = '/versioned_articles/{}/'.format(article.id)
+
+        cls.response = cls.app.get(
+            cls.url,
+            headers={'Accept-Encoding': 'gzip'}
+        )
+        cls.uncompressed_response = cls.app.get(cls.url)
+
+        cls.not_modified_response = cls.app.get(
+            cls.url,
+            headers={
+                'Accept-Encoding': 'gzip',
+                'If-None-Match': cls.response.headers['ETag']
+            }
+        )
+
+        cls.put_response = cls.app.put(
+            cls.url,
+            headers={
+                'content-type': 'application/json',
+                'If-Match': cls.response.headers['ETag']
+            },
+            data=json.dumps({'title': "Updated title"})
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_codes(self):
+        """
+        Test if the response status codes are correct.
+        """
+        self.assertEqual(self.response.status_code, 200)
+        self.assertEqual(self.not_modified_response.status_code, 304)
+        self.assertEqual(self.put_response.status_code, 200)
+
+    def test_etags(self):
+        """
+        Test if only the ETag of the compressed response has the
+        encoding.
+        """
+        self.assertEqual(self.response.headers['ETag'], '"1.0-gzip"')
+        self.assertEqual(self.uncompressed_response.headers['ETag'], '"1.0"')
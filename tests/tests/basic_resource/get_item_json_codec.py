@@ -0,0 +1,78 @@
+import unittest
+import json
+from datetime import datetime
+from bson import ObjectId
+from pymongo import MongoClient
+from apps.basic_resource.monkful.codecs import fast_json_codec
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article, Comment
+
+
+class ResourceGetItemJSONCodec(unittest.TestCase):
+    """
+    Test if ObjectIds and datetimes are encoded by the JSON codec, as
+    strings in the same format the serializer fields use.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        cls.article = Article(
+            title="Test title",
+            publish_date=datetime(2013, 10, 9, 8, 7, 8),
+            comments=[
+                Comment(text="Test comment", date=datetime(2013, 10, 10))
+            ]
+        ).save()
+
+        cls.response = cls.app.get('/articles/{}/'.format(cls.article.id))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_codec(self):
+        """
+        Test if `fast_json_codec()` encodes ObjectIds and datetimes as
+        strings.
+        """
+
+        object_id = ObjectId()
+
+        self.assertEqual(
+            json.loads(fast_json_codec().dumps({
+                'id': object_id,
+                'date': datetime(2013, 10, 9, 8, 7, 8),
+                'items': [object_id]
+            })),
+            {
+                'id': str(object_id),
+                'date': '2013-10-09T08:07:08',
+                'items': [str(object_id)]
+            }
+        )
+
+    def test_codec_unknown_type(self):
+        """
+        Test if values that can't be encoded still raise a `TypeError`.
+        """
+        self.assertRaises(TypeError, fast_json_codec().dumps, object())
+
+    def test_response(self):
+        """
+        Test if the ObjectIds and datetimes of the document, also in
+        embedded documents, are strings in the response.
+        """
+
+        data = json.loads(self.response.data)
+
+        self.assertEqual(self.response.status_code, 200)
+        self.assertEqual(data['id'], str(self.article.id))
+        self.assertEqual(data['publish_date'], '2013-10-09T08:07:08')
+        self.assertEqual(
+            data['comments'][0]['id'], str(self.article.comments[0].id)
+        )
+        self.assertEqual(data['comments'][0]['date'], '2013-10-10T00:00:00')
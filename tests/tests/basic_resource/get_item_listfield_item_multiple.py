@@ -0,0 +1,61 @@
+import unittest
+import json
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article
+
+
+class ResourceGetItemListFieldItemMultiple(unittest.TestCase):
+    """
+    Test if a HTTP GET request on multiple comma separated identifiers
+    of items in a listfield returns the items in the requested order.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+        article_id = "528a5250aa2649ffd8ce8a90"
+        cls.comment_ids = [
+            "528a5250aa2649ffd8ce8a91",
+            "528a5250aa2649ffd8ce8a92",
+            "528a5250aa2649ffd8ce8a93"
+        ]
+        cls.missing_id = "528a5250aa2649ffd8ce8a99"
+
+        Article(
+            id=article_id,
+            title="Test title",
+            comments=[
+                {'id': comment_id, 'text': "Test comment"}
+                for comment_id in cls.comment_ids
+            ]
+        ).save()
+
+        cls.response = cls.app.get('/articles/{}/comments/{},{},{}/'.format(
+            article_id, cls.comment_ids[2], cls.missing_id, cls.comment_ids[0]
+        ))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_code(self):
+        """
+        Test if the response status code is 200.
+        """
+        self.assertEqual(self.response.status_code, 200)
+
+    def test_content(self):
+        """
+        Test if the items are returned in the requested order, with the
+        missing item reported in its place.
+        """
+
+        data = json.loads(self.response.data)
+
+        self.assertEqual(data[0]['id'], self.comment_ids[2])
+        self.assertEqual(data[1]['identifier'], self.missing_id)
+        self.assertEqual(data[1]['status'], 404)
+        self.assertEqual(data[2]['id'], self.comment_ids[0])
@@ -0,0 +1,84 @@
+import unittest
+import json
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article
+
+
+class ResourceGetItemMultiple(unittest.TestCase):
+    """
+    Test if a HTTP GET request on multiple comma separated identifiers
+    returns the documents in the requested order, with the missing ones
+    reported inline.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        cls.article_ids = [
+            "528a5250aa2649ffd8ce8a90",
+            "528a5250aa2649ffd8ce8a91",
+            "528a5250aa2649ffd8ce8a92"
+        ]
+        cls.missing_id = "528a5250aa2649ffd8ce8a99"
+
+        for i, article_id in enumerate(cls.article_ids):
+            Article(id=article_id, title="Test title {}".format(i)).save()
+
+        cls.response = cls.app.get('/articles/{},{},{},{}/'.format(
+            cls.article_ids[2], cls.missing_id,
+            cls.article_ids[0], cls.article_ids[1]
+        ))
+        cls.filter_response = cls.app.get('/articles/?id__in={},{}'.format(
+            cls.article_ids[2], cls.article_ids[0]
+        ))
+        cls.invalid_response = cls.app.get(
+            '/articles/{},invalid/'.format(cls.article_ids[0])
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_codes(self):
+        """
+        Test if the response status codes are 200, and 400 for an
+        invalid identifier.
+        """
+        self.assertEqual(self.response.status_code, 200)
+        self.assertEqual(self.filter_response.status_code, 200)
+        self.assertEqual(self.invalid_response.status_code, 400)
+
+    def test_order(self):
+        """
+        Test if the documents are returned in the requested order.
+        """
+
+        data = json.loads(self.response.data)
+
+        self.assertEqual(
+            [data[0]['id'], data[2]['id'], data[3]['id']],
+            [self.article_ids[2], self.article_ids[0], self.article_ids[1]]
+        )
+
+    def test_missing(self):
+        """
+        Test if the missing document is reported in its place.
+        """
+        self.assertEqual(
+            json.loads(self.response.data)[1]['identifier'],
+            self.missing_id
+        )
+        self.assertEqual(json.loads(self.response.data)[1]['status'], 404)
+
+    def test_filter(self):
+        """
+        Test if the `id__in` filter returns the matching documents.
+        """
+        self.assertEqual(
+            sorted(item['id'] for item in json.loads(self.filter_response.data)),
+            [self.article_ids[0], self.article_ids[2]]
+        )
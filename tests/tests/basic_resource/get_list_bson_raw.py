@@ -0,0 +1,67 @@
+import unittest
+from bson import decode_all
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article, Comment
+
+
+class ResourceGetListBSONRaw(unittest.TestCase):
+    """
+    Test if a page of the listview of a resource with an identity
+    serializer is sent as the raw BSON documents, with only the fields
+    of the serializer.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        for i in range(3):
+            Article(
+                title="Test title {}".format(i),
+                text="Test text",
+                tags=['a', 'b'],
+                comments=[
+                    Comment(text="Test comment", email="test@example.com")
+                ]
+            ).save()
+
+        cls.response = cls.app.get(
+            '/raw_articles/',
+            headers={'Accept': 'application/bson'}
+        )
+
+        cls.documents = decode_all(cls.response.data)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_code(self):
+        """
+        Test if the response status code is 200.
+        """
+        self.assertEqual(self.response.status_code, 200)
+
+    def test_documents(self):
+        """
+        Test if all documents are sent as stored, with only the fields
+        of the serializer.
+        """
+
+        self.assertEqual(len(self.documents), 3)
+
+        for i, document in enumerate(self.documents):
+            self.assertEqual(document['title'], "Test title {}".format(i))
+            self.assertEqual(document['tags'], ['a', 'b'])
+            self.assertIn('_id', document)
+            self.assertNotIn('comments', document)
+
+    def test_writeonly_field(self):
+        """
+        Test if the writeonly field of the serializer is not sent.
+        """
+        for document in self.documents:
+            self.assertNotIn('text', document)
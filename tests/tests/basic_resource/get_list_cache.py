@@ -0,0 +1,82 @@
+import unittest
+import json
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article
+from apps.basic_resource.resources import CachedArticleResource
+
+
+class ResourceGetListCache(unittest.TestCase):
+    """
+    Test if the pages of a listview are cached and invalidated when the
+    resource changes a document.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+        CachedArticleResource.list_cache.clear()
+
+        Article(title="Article 1", publish=True, top_comment={}).save()
+        Article(title="Article 2", publish=False, top_comment={}).save()
+
+        cls.first_response = cls.app.get('/cached_articles/')
+
+        # Changes outside of the resource don't invalidate the cache
+        Article(title="Article 3", publish=True, top_comment={}).save()
+
+        cls.cached_response = cls.app.get('/cached_articles/')
+        cls.filtered_response = cls.app.get('/cached_articles/?publish=true')
+
+        cls.post_response = cls.app.post(
+            '/cached_articles/',
+            headers={'content-type': 'application/json'},
+            data=json.dumps({'title': "Article 4", 'top_comment': {}})
+        )
+
+        cls.invalidated_response = cls.app.get('/cached_articles/')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_codes(self):
+        """
+        Test if the response status codes are correct.
+        """
+        self.assertEqual(self.first_response.status_code, 200)
+        self.assertEqual(self.cached_response.status_code, 200)
+        self.assertEqual(self.filtered_response.status_code, 200)
+        self.assertEqual(self.post_response.status_code, 201)
+        self.assertEqual(self.invalidated_response.status_code, 200)
+
+    def test_cached(self):
+        """
+        Test if the second request is served from the cache.
+        """
+        self.assertEqual(len(json.loads(self.first_response.data)), 2)
+        self.assertEqual(
+            json.loads(self.cached_response.data),
+            json.loads(self.first_response.data)
+        )
+
+    def test_filters_in_key(self):
+        """
+        Test if a request with other filters is not served from the
+        cache of the first request.
+        """
+        self.assertEqual(len(json.loads(self.filtered_response.data)), 2)
+
+    def test_invalidated(self):
+        """
+        Test if a POST on the resource invalidates the cached pages.
+        """
+        self.assertEqual(len(json.loads(self.invalidated_response.data)), 4)
+
+    def test_stats(self):
+        """
+        Test if the cache counted the hit.
+        """
+        self.assertTrue(CachedArticleResource.list_cache.hits >= 1)
@@ -0,0 +1,56 @@
+import unittest
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article
+
+
+class ResourceGetListEtag(unittest.TestCase):
+    """
+    Test if a page of the listview gets a weak ETag that changes when a
+    document on the page changes.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        article = Article(title="Test title 1", version=1.0).save()
+        Article(title="Test title 2", version=1.0).save()
+
+        cls.response = cls.app.get('/versioned_articles/')
+
+        cls.not_modified_response = cls.app.get(
+            '/versioned_articles/',
+            headers={'If-None-Match': cls.response.headers['ETag']}
+        )
+
+        Article.objects(id=article.id).update(set__version=2.0)
+
+        cls.modified_response = cls.app.get(
+            '/versioned_articles/',
+            headers={'If-None-Match': cls.response.headers['ETag']}
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_codes(self):
+        """
+        Test if the response status codes are correct.
+        """
+        self.assertEqual(self.response.status_code, 200)
+        self.assertEqual(self.not_modified_response.status_code, 304)
+        self.assertEqual(self.modified_response.status_code, 200)
+
+    def test_weak_etags(self):
+        """
+        Test if the ETags are weak and change when a document changes.
+        """
+        self.assertTrue(self.response.headers['ETag'].startswith('W/"'))
+        self.assertNotEqual(
+            self.response.headers['ETag'],
+            self.modified_response.headers['ETag']
+        )
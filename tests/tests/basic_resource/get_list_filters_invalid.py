@@ -0,0 +1,50 @@
+import unittest
+import json
+from pymongo import MongoClient
+from apps.basic_resource import server
+
+
+class ResourceGetListFiltersInvalid(unittest.TestCase):
+    """
+    Test if an HTTP GET request on a listview with filter values that
+    can't be deserialized by their field gives a 400 response.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        cls.id_in_response = cls.app.get('/articles/?id__in=bad')
+        cls.id_response = cls.app.get('/articles/?id=bad')
+        cls.order_response = cls.app.get('/articles/?order=bad')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_codes(self):
+        """
+        Test if all the invalid filter values give a 400.
+        """
+        self.assertEqual(self.id_in_response.status_code, 400)
+        self.assertEqual(self.id_response.status_code, 400)
+        self.assertEqual(self.order_response.status_code, 400)
+
+    def test_messages(self):
+        """
+        Test if the messages mention the invalid value and field.
+        """
+
+        self.assertEqual(
+            json.loads(self.id_in_response.data)['message'],
+            "The value 'bad' for field 'id' could not be parsed. Note "
+            "that it should be in ObjectId format."
+        )
+
+        self.assertEqual(
+            json.loads(self.order_response.data)['message'],
+            "The value for field 'order' is of type 'string' but should "
+            "be of type 'number'."
+        )
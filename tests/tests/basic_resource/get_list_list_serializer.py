@@ -0,0 +1,59 @@
+import unittest
+import json
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article, Comment
+
+
+class ResourceGetListListSerializer(unittest.TestCase):
+    """
+    Test if the listview uses the list serializer and single documents
+    use the full serializer.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        article = Article(
+            title="Test title",
+            text="Test text",
+            comments=[Comment(text="Test comment")]
+        ).save()
+
+        cls.list_response = cls.app.get('/article_list/')
+        cls.item_response = cls.app.get(
+            '/article_list/{}/'.format(article.id)
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_codes(self):
+        """
+        Test if the response status codes are 200.
+        """
+        self.assertEqual(self.list_response.status_code, 200)
+        self.assertEqual(self.item_response.status_code, 200)
+
+    def test_list_fields(self):
+        """
+        Test if the listview only has the fields of the list serializer.
+        """
+        self.assertEqual(
+            sorted(json.loads(self.list_response.data)[0].keys()),
+            ['id', 'publish_date', 'title']
+        )
+
+    def test_item_fields(self):
+        """
+        Test if a single document has all fields.
+        """
+
+        data = json.loads(self.item_response.data)
+
+        self.assertEqual(data['text'], "Test text")
+        self.assertEqual(data['comments'][0]['text'], "Test comment")
@@ -0,0 +1,80 @@
+import unittest
+import json
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article, Comment
+
+
+class ResourceGetListMaxItems(unittest.TestCase):
+    """
+    Test if the lists with a `max_items_in_list` are sliced in the
+    listview and the total number of items is added.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        article = Article(
+            title="Test title",
+            text="Test text",
+            comments=[
+                Comment(text="Test comment 1"),
+                Comment(text="Test comment 2"),
+                Comment(text="Test comment 3")
+            ],
+            tags=['tag1', 'tag2']
+        ).save()
+
+        Article(title="Test title 2").save()
+
+        cls.list_response = cls.app.get('/sliced_articles/')
+        cls.item_response = cls.app.get(
+            '/sliced_articles/{}/'.format(article.id)
+        )
+        cls.list_data = json.loads(cls.list_response.data)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_codes(self):
+        """
+        Test if the response status codes are 200.
+        """
+        self.assertEqual(self.list_response.status_code, 200)
+        self.assertEqual(self.item_response.status_code, 200)
+
+    def test_last_items(self):
+        """
+        Test if only the last comments are in the listview.
+        """
+        self.assertEqual(
+            [comment['text'] for comment in self.list_data[0]['comments']],
+            ["Test comment 2", "Test comment 3"]
+        )
+
+    def test_first_items(self):
+        """
+        Test if only the first tag is in the listview.
+        """
+        self.assertEqual(self.list_data[0]['tags'], ['tag1'])
+
+    def test_counts(self):
+        """
+        Test if the total number of items of the lists are added.
+        """
+        self.assertEqual(self.list_data[0]['comments_count'], 3)
+        self.assertEqual(self.list_data[0]['tags_count'], 2)
+        self.assertEqual(self.list_data[1]['comments_count'], 0)
+        self.assertEqual(self.list_data[1]['tags_count'], 0)
+
+    def test_item_not_sliced(self):
+        """
+        Test if a single document has the whole list.
+        """
+        data = json.loads(self.item_response.data)
+        self.assertEqual(len(data['comments']), 3)
+        self.assertNotIn('comments_count', data)
@@ -0,0 +1,72 @@
+import unittest
+import json
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article
+
+
+class ResourceGetListMaxOffset(unittest.TestCase):
+    """
+    Test if pages beyond the `max_offset` of a resource are refused and
+    not linked to.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        for i in range(450):
+            Article(title="title #{}".format(i)).save()
+
+        cls.first_response = cls.app.get('/deep_paging_articles/')
+        cls.max_response = cls.app.get('/deep_paging_articles/?page=3')
+        cls.beyond_response = cls.app.get('/deep_paging_articles/?page=4')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_codes(self):
+        """
+        Test if the pages within the maximum offset give a 200 and the
+        pages beyond it a 400.
+        """
+        self.assertEqual(self.first_response.status_code, 200)
+        self.assertEqual(self.max_response.status_code, 200)
+        self.assertEqual(self.beyond_response.status_code, 400)
+
+    def test_num_docs(self):
+        """
+        Test if the last page within the maximum offset is complete.
+        """
+        self.assertEqual(len(json.loads(self.max_response.data)), 100)
+
+    def test_link_headers(self):
+        """
+        Test if the `last` link is omitted because the last page is
+        beyond the maximum offset.
+        """
+
+        self.assertEqual(
+            self.first_response.headers['Link'],
+            '<http://localhost/deep_paging_articles/?page=2>; rel="next", '
+            '<http://localhost/deep_paging_articles/?page=1>; rel="first"'
+        )
+
+        self.assertEqual(
+            self.max_response.headers['Link'],
+            '<http://localhost/deep_paging_articles/?page=2>; rel="prev", '
+            '<http://localhost/deep_paging_articles/?page=4>; rel="next", '
+            '<http://localhost/deep_paging_articles/?page=1>; rel="first"'
+        )
+
+    def test_message(self):
+        """
+        Test if the error message points to the export.
+        """
+        self.assertIn(
+            "http://localhost/deep_paging_articles/!!export",
+            json.loads(self.beyond_response.data)['message']
+        )
@@ -0,0 +1,42 @@
+import unittest
+import json
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article
+
+
+class ResourceGetListMaxTime(unittest.TestCase):
+    """
+    Test if a query that takes longer than the `max_time_ms` of the
+    resource gives a 503 response.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        for i in range(3):
+            Article(title="Test title {}".format(i)).save()
+
+        cls.response = cls.app.get(
+            '/slow_articles/',
+            content_type='application/json'
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_code(self):
+        """
+        Test if the response status code is 503.
+        """
+        self.assertEqual(self.response.status_code, 503)
+
+    def test_content(self):
+        """
+        Test if the response has an error message.
+        """
+        self.assertIn('message', json.loads(self.response.data))
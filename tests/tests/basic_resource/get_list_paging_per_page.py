@@ -0,0 +1,64 @@
+import unittest
+import json
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article
+
+
+class ResourceGetListPagingPerPage(unittest.TestCase):
+    """
+    Test if the client can choose the number of items per page with the
+    `per_page` query param.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        for i in range(450):
+            Article(title="title #{}".format(i)).save()
+
+        cls.response = cls.app.get('/articles/?page=2&per_page=200')
+        cls.invalid_responses = [
+            cls.app.get('/articles/?per_page=0'),
+            cls.app.get('/articles/?per_page=1001'),
+            cls.app.get('/articles/?per_page=abc'),
+        ]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_code(self):
+        """
+        Test if the response status code is 200.
+        """
+        self.assertEqual(self.response.status_code, 200)
+
+    def test_num_docs(self):
+        """
+        Test if the page has the requested number of documents.
+        """
+        self.assertEqual(len(json.loads(self.response.data)), 200)
+
+    def test_link_header(self):
+        """
+        Test if the `Link` header keeps the number of items per page.
+        """
+        self.assertEqual(
+            self.response.headers['Link'],
+            '<http://localhost/articles/?page=1&per_page=200>; rel="prev", '
+            '<http://localhost/articles/?page=3&per_page=200>; rel="next", '
+            '<http://localhost/articles/?page=1&per_page=200>; rel="first", '
+            '<http://localhost/articles/?page=3&per_page=200>; rel="last"'
+        )
+
+    def test_invalid_per_page(self):
+        """
+        Test if a number of items per page that is not between 1 and the
+        `max_items_per_page` of the resource gives a 400 response.
+        """
+        for response in self.invalid_responses:
+            self.assertEqual(response.status_code, 400)
@@ -0,0 +1,58 @@
+import unittest
+import json
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article
+
+
+class ResourceGetListStream(unittest.TestCase):
+    """
+    Test if a streamed page of the listview contains the same data as a
+    regular page.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        for i in range(5):
+            Article(title="Test title {}".format(i)).save()
+
+        cls.response = cls.app.get('/streamed_articles/')
+        cls.regular_response = cls.app.get('/articles/')
+
+        cls.mongo_client.unittest_monkful.article.remove()
+
+        cls.empty_response = cls.app.get('/streamed_articles/')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_codes(self):
+        """
+        Test if the response status codes are 200.
+        """
+        self.assertEqual(self.response.status_code, 200)
+        self.assertEqual(self.empty_response.status_code, 200)
+
+    def test_content_type(self):
+        """
+        Test if the streamed response is JSON.
+        """
+        self.assertEqual(
+            self.response.headers['content-type'],
+            'application/json'
+        )
+
+    def test_data(self):
+        """
+        Test if the streamed data is the same as the regular data.
+        """
+        self.assertEqual(
+            json.loads(self.response.data),
+            json.loads(self.regular_response.data)
+        )
+        self.assertEqual(json.loads(self.empty_response.data), [])
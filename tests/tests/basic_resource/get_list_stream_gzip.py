@@ -0,0 +1,78 @@
+import unittest
+import json
+import zlib
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article
+
+
+class ResourceGetListStreamGzip(unittest.TestCase):
+    """
+    Test if a streamed page of the listview is compressed with gzip when
+    the client accepts it.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        for i in range(5):
+            Article(title="Test title {}".format(i)).save()
+
+        cls.response = cls.app.get(
+            '/streamed_articles/',
+            headers={'Accept-Encoding': 'gzip'}
+        )
+        cls.uncompressed_response = cls.app.get('/streamed_articles/')
+
+        cls.chunks = list(cls.app.get(
+            '/streamed_articles/',
+            headers={'Accept-Encoding': 'gzip'},
+            buffered=False
+        ).response)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_codes(self):
+        """
+        Test if the response status codes are 200.
+        """
+        self.assertEqual(self.response.status_code, 200)
+        self.assertEqual(self.uncompressed_response.status_code, 200)
+
+    def test_headers(self):
+        """
+        Test if only the response for the client that accepts gzip is
+        compressed.
+        """
+        self.assertEqual(self.response.headers['Content-Encoding'], 'gzip')
+        self.assertNotIn('Content-Encoding', self.uncompressed_response.headers)
+        self.assertEqual(self.response.headers['Vary'], 'Accept-Encoding')
+
+    def test_data(self):
+        """
+        Test if the decompressed data is the same as the uncompressed
+        data.
+        """
+        self.assertEqual(
+            json.loads(
+                zlib.decompress(self.response.data, 16 + zlib.MAX_WBITS)
+            ),
+            json.loads(self.uncompressed_response.data)
+        )
+
+    def test_chunks_flushed(self):
+        """
+        Test if every batch of documents is sent as a chunk that can be
+        decompressed right away.
+        """
+
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        first_batch = decompressor.decompress(self.chunks[0])
+
+        self.assertTrue(len(self.chunks) > 2)
+        self.assertEqual(len(json.loads(first_batch + ']')), 2)
@@ -0,0 +1,72 @@
+import unittest
+import json
+from pymongo import MongoClient, TEXT
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article
+
+
+class ResourceGetListTextSearch(unittest.TestCase):
+    """
+    Test if the listview can be searched with the `q` query param,
+    combined with filters, and sorted by relevance.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        cls.mongo_client.unittest_monkful.article.create_index(
+            [('title', TEXT), ('text', TEXT)], name='text_search'
+        )
+
+        Article(
+            title="Monkey business",
+            text="A story about a monkey and another monkey",
+            publish=True
+        ).save()
+        Article(
+            title="Bananas",
+            text="What monkeys like to eat",
+            publish=True
+        ).save()
+        Article(
+            title="Monkey see, monkey do",
+            text="An unpublished monkey story",
+            publish=False
+        ).save()
+        Article(title="Elephants", text="Big animals", publish=True).save()
+
+        cls.response = cls.app.get(
+            '/articles/?q=monkey&publish=1',
+            content_type='application/json'
+        )
+        cls.data = json.loads(cls.response.data)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+        cls.mongo_client.unittest_monkful.article.drop_index('text_search')
+
+    def test_status_code(self):
+        """
+        Test if the response status code is 200.
+        """
+        self.assertEqual(self.response.status_code, 200)
+
+    def test_results(self):
+        """
+        Test if only the published matching documents are returned, the
+        most relevant first.
+        """
+        self.assertEqual(
+            [item['title'] for item in self.data],
+            ["Monkey business", "Bananas"]
+        )
+
+    def test_score(self):
+        """
+        Test if the text search score is added to the documents.
+        """
+        self.assertTrue(self.data[0]['score'] > self.data[1]['score'])
@@ -0,0 +1,89 @@
+import unittest
+import json
+from pymongo import MongoClient, TEXT
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article
+
+
+class ResourceGetListTextSearchViews(unittest.TestCase):
+    """
+    Test if the `q` query param also limits the documents of the export,
+    the distinct values and the aggregation of the listview.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        cls.mongo_client.unittest_monkful.article.create_index(
+            [('title', TEXT), ('text', TEXT)], name='text_search'
+        )
+
+        Article(
+            title="Monkey business",
+            text="A story about a monkey",
+            tags=['monkey', 'story']
+        ).save()
+        Article(
+            title="Bananas",
+            text="What monkeys like to eat",
+            tags=['food']
+        ).save()
+        Article(
+            title="Elephants",
+            text="Big animals",
+            tags=['elephant', 'story']
+        ).save()
+
+        cls.export_response = cls.app.get('/articles/!!export?q=monkey')
+        cls.distinct_response = cls.app.get(
+            '/articles/!!distinct/tags?q=monkey',
+            content_type='application/json'
+        )
+        cls.aggregate_response = cls.app.get(
+            '/articles/!!aggregate?q=monkey',
+            content_type='application/json'
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+        cls.mongo_client.unittest_monkful.article.drop_index('text_search')
+
+    def test_status_codes(self):
+        """
+        Test if the response status codes are 200.
+        """
+        self.assertEqual(self.export_response.status_code, 200)
+        self.assertEqual(self.distinct_response.status_code, 200)
+        self.assertEqual(self.aggregate_response.status_code, 200)
+
+    def test_export(self):
+        """
+        Test if only the matching documents are exported, the most
+        relevant first.
+        """
+        self.assertEqual(
+            [
+                json.loads(line)['title']
+                for line in self.export_response.data.splitlines()
+            ],
+            ["Monkey business", "Bananas"]
+        )
+
+    def test_distinct(self):
+        """
+        Test if only the values of the matching documents are returned.
+        """
+        self.assertEqual(
+            sorted(json.loads(self.distinct_response.data)),
+            ['food', 'monkey', 'story']
+        )
+
+    def test_aggregate(self):
+        """
+        Test if only the matching documents are aggregated.
+        """
+        self.assertEqual(json.loads(self.aggregate_response.data)['count'], 2)
@@ -0,0 +1,107 @@
+import unittest
+import json
+from datetime import datetime
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article, Comment
+
+
+class ResourcePatch(unittest.TestCase):
+    """
+    Test if a HTTP PATCH with a JSON Patch document gives the right
+    response and updates the data in the database.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        cls.article = Article(
+            title="Test title",
+            text="Test text",
+            publish=False,
+            publish_date=datetime(2013, 10, 9, 8, 7, 8),
+            comments=[
+                Comment(text="Test comment"),
+                Comment(text="Test comment 2")
+            ],
+            top_comment=Comment(text="Top comment"),
+            tags=['tag1', 'tag2'],
+            version=1.0
+        ).save()
+
+        cls.patch = [
+            {'op': 'test', 'path': '/version', 'value': 1.0},
+            {'op': 'replace', 'path': '/publish', 'value': True},
+            {'op': 'remove', 'path': '/text'},
+            {'op': 'add', 'path': '/tags/-', 'value': 'tag3'},
+            {
+                'op': 'replace',
+                'path': '/comments/{}/text'.format(
+                    cls.article.comments[1].id
+                ),
+                'value': "Updated comment 2"
+            }
+        ]
+
+        cls.response = cls.app.open(
+            '/articles/{}/'.format(cls.article.id),
+            method='PATCH',
+            headers={'content-type': 'application/json-patch+json'},
+            data=json.dumps(cls.patch)
+        )
+
+        cls.failed_test_response = cls.app.open(
+            '/articles/{}/'.format(cls.article.id),
+            method='PATCH',
+            headers={'content-type': 'application/json-patch+json'},
+            data=json.dumps([
+                {'op': 'test', 'path': '/version', 'value': 0.5},
+                {'op': 'replace', 'path': '/title', 'value': "Changed"}
+            ])
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_code(self):
+        """
+        Test if the response status code is 204.
+        """
+        self.assertEqual(self.response.status_code, 204)
+
+    def test_empty_response(self):
+        """
+        If the status code is 204, there should be nothing in the
+        response.
+        """
+        self.assertFalse(self.response.data)
+
+    def test_patched(self):
+        """
+        Test if the operations in the patch are applied to the document.
+        """
+
+        article = Article.objects.get(id=self.article.id)
+
+        self.assertEqual(article.title, "Test title")
+        self.assertEqual(article.text, None)
+        self.assertEqual(article.publish, True)
+        self.assertEqual(article.tags, ['tag1', 'tag2', 'tag3'])
+        self.assertEqual(article.comments[0].text, "Test comment")
+        self.assertEqual(article.comments[1].text, "Updated comment 2")
+
+    def test_failed_test_operation(self):
+        """
+        Test if a patch with a failing `test` operation responds with a
+        409 and doesn't change the document.
+        """
+
+        self.assertEqual(self.failed_test_response.status_code, 409)
+        self.assertEqual(
+            Article.objects.get(id=self.article.id).title,
+            "Test title"
+        )
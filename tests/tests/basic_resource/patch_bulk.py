@@ -0,0 +1,74 @@
+import unittest
+import json
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article
+
+
+class ResourcePatchBulk(unittest.TestCase):
+    """
+    Test if a HTTP PATCH request on the listview updates all documents
+    that match the filters.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        for i in range(4):
+            Article(
+                title="Test title {}".format(i),
+                tags=['tag1'] if i < 3 else ['tag2'],
+                publish=i != 0
+            ).save()
+
+        cls.unconfirmed_response = cls.app.patch(
+            '/articles/?tags=tag1',
+            data=json.dumps({'publish': False}),
+            content_type='application/merge-patch+json'
+        )
+        cls.response = cls.app.patch(
+            '/articles/?tags=tag1&confirm=true',
+            data=json.dumps({'publish': False}),
+            content_type='application/merge-patch+json'
+        )
+        cls.readonly_response = cls.app.patch(
+            '/articles/?tags=tag2&confirm=true',
+            data=json.dumps([
+                {'op': 'replace', 'path': '/id', 'value': "528a5250aa2649ffd8ce8a90"}
+            ]),
+            content_type='application/json-patch+json'
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_codes(self):
+        """
+        Test if the status codes are 400 without confirmation or with a
+        readonly field, and 200 otherwise.
+        """
+        self.assertEqual(self.unconfirmed_response.status_code, 400)
+        self.assertEqual(self.response.status_code, 200)
+        self.assertEqual(self.readonly_response.status_code, 400)
+
+    def test_counts(self):
+        """
+        Test if the matched and modified counts are returned.
+        """
+        self.assertEqual(
+            json.loads(self.response.data),
+            {'matched': 3, 'modified': 2}
+        )
+
+    def test_updated(self):
+        """
+        Test if only the matching documents are updated.
+        """
+        self.assertEqual(Article.objects(publish=False).count(), 3)
+        self.assertEqual(
+            Article.objects(tags='tag2').first().publish, True
+        )
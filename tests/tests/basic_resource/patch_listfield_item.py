@@ -0,0 +1,122 @@
+import unittest
+import json
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article, Comment
+
+
+class ResourcePatchListFieldItem(unittest.TestCase):
+    """
+    Test if a HTTP PATCH that changes list items keeps the identity of
+    replaced items, combines adds to one position of a list and refuses
+    conflicting operations.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        cls.article = Article(
+            title="Test title",
+            comments=[
+                Comment(text="Test comment", email="test@example.com"),
+                Comment(text="Test comment 2")
+            ],
+            tags=['tag1', 'tag2']
+        ).save()
+
+        cls.comment = cls.article.comments[0]
+
+        cls.response = cls.patch([
+            {
+                'op': 'replace',
+                'path': '/comments/{}'.format(cls.comment.id),
+                'value': {'text': "Replaced comment"}
+            },
+            {'op': 'add', 'path': '/tags/1', 'value': 'tag3'},
+            {'op': 'add', 'path': '/tags/2', 'value': 'tag4'}
+        ])
+
+        cls.position_response = cls.patch([
+            {'op': 'add', 'path': '/tags/0', 'value': 'tag5'},
+            {'op': 'add', 'path': '/tags/-', 'value': 'tag6'}
+        ])
+
+        cls.conflict_response = cls.patch([
+            {
+                'op': 'replace',
+                'path': '/comments/{}/text'.format(cls.comment.id),
+                'value': "Changed comment"
+            },
+            {'op': 'remove', 'path': '/comments/{}'.format(cls.comment.id)}
+        ])
+
+        cls.list_response = cls.patch([
+            {'op': 'replace', 'path': '/comments', 'value': []}
+        ])
+
+        cls.path_response = cls.patch([{'op': 'remove', 'path': 5}])
+
+    @classmethod
+    def patch(cls, operations):
+        return cls.app.open(
+            '/articles/{}/'.format(cls.article.id),
+            method='PATCH',
+            headers={'content-type': 'application/json-patch+json'},
+            data=json.dumps(operations)
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_code(self):
+        """
+        Test if the response status code is 204.
+        """
+        self.assertEqual(self.response.status_code, 204)
+
+    def test_replaced_item(self):
+        """
+        Test if the replaced comment kept its id and date, and if its
+        other fields are replaced.
+        """
+
+        comment = Article.objects.get(id=self.article.id).comments[0]
+
+        self.assertEqual(comment.id, self.comment.id)
+        self.assertEqual(
+            comment.date.replace(microsecond=0),
+            self.comment.date.replace(microsecond=0)
+        )
+        self.assertEqual(comment.text, "Replaced comment")
+        self.assertIsNone(comment.email)
+
+    def test_added_items(self):
+        """
+        Test if the items added at consecutive positions are all added.
+        """
+        self.assertEqual(
+            Article.objects.get(id=self.article.id).tags,
+            ['tag1', 'tag3', 'tag4', 'tag2']
+        )
+
+    def test_invalid_patches(self):
+        """
+        Test if adds at different positions of a list, conflicting
+        operations, replacing a list of documents with identifiers and a
+        path that isn't a string give a 400 response with a message.
+        """
+
+        for response in (
+            self.position_response, self.conflict_response,
+            self.list_response, self.path_response
+        ):
+            self.assertEqual(response.status_code, 400)
+            self.assertIn('message', json.loads(response.data))
+
+        self.assertIn(
+            "conflict", json.loads(self.conflict_response.data)['message']
+        )
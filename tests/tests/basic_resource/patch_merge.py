@@ -0,0 +1,98 @@
+import unittest
+import json
+from datetime import datetime
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article, Comment
+
+
+class ResourcePatchMerge(unittest.TestCase):
+    """
+    Test if a HTTP PATCH with a JSON Merge Patch document gives the
+    right response and updates the data in the database.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        cls.article = Article(
+            title="Test title",
+            text="Test text",
+            publish=False,
+            publish_date=datetime(2013, 10, 9, 8, 7, 8),
+            comments=[Comment(text="Test comment")],
+            top_comment=Comment(text="Top comment", email="test@example.com"),
+            tags=['tag1', 'tag2']
+        ).save()
+
+        cls.response = cls.app.open(
+            '/articles/{}/'.format(cls.article.id),
+            method='PATCH',
+            headers={'content-type': 'application/merge-patch+json'},
+            data=json.dumps({
+                'publish': True,
+                'publish_date': None,
+                'top_comment': {'text': "Updated top comment"}
+            })
+        )
+
+        cls.invalid_value_response = cls.app.open(
+            '/articles/{}/'.format(cls.article.id),
+            method='PATCH',
+            headers={'content-type': 'application/merge-patch+json'},
+            data=json.dumps({'order': "not a number"})
+        )
+
+        cls.not_found_response = cls.app.open(
+            '/articles/528a5250aa2649ffd8ce8a90/',
+            method='PATCH',
+            headers={'content-type': 'application/merge-patch+json'},
+            data=json.dumps({'publish': True})
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_code(self):
+        """
+        Test if the response status code is 204.
+        """
+        self.assertEqual(self.response.status_code, 204)
+
+    def test_patched(self):
+        """
+        Test if the patch is merged into the document.
+        """
+
+        article = Article.objects.get(id=self.article.id)
+
+        self.assertEqual(article.title, "Test title")
+        self.assertEqual(article.publish, True)
+        self.assertEqual(article.publish_date, None)
+        self.assertEqual(article.tags, ['tag1', 'tag2'])
+        self.assertEqual(article.top_comment.text, "Updated top comment")
+        self.assertEqual(article.top_comment.email, "test@example.com")
+
+    def test_invalid_value(self):
+        """
+        Test if a value of the wrong type gives a 400 with a message.
+        """
+
+        self.assertEqual(self.invalid_value_response.status_code, 400)
+        self.assertEqual(
+            json.loads(self.invalid_value_response.data),
+            {'message': (
+                "The value for field 'order' is of type 'string' but should "
+                "be of type 'number'."
+            )}
+        )
+
+    def test_not_found(self):
+        """
+        Test if a PATCH on a non existing document gives a 404.
+        """
+        self.assertEqual(self.not_found_response.status_code, 404)
@@ -0,0 +1,47 @@
+import unittest
+from datetime import datetime
+from bson import BSON
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article
+
+
+class ResourcePostBSON(unittest.TestCase):
+    """
+    Test if a document can be created with a BSON request body.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        cls.response = cls.app.post(
+            '/articles/',
+            headers={'content-type': 'application/bson'},
+            data=BSON.encode({
+                'title': "Test title",
+                'publish_date': datetime(2014, 1, 2, 3, 4, 5)
+            })
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_code(self):
+        """
+        Test if the response status code is 201.
+        """
+        self.assertEqual(self.response.status_code, 201)
+
+    def test_document_created(self):
+        """
+        Test if the document was created with the native datetime.
+        """
+
+        article = Article.objects.get()
+
+        self.assertEqual(article.title, "Test title")
+        self.assertEqual(article.publish_date, datetime(2014, 1, 2, 3, 4, 5))
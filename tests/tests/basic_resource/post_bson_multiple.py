@@ -0,0 +1,67 @@
+import unittest
+import json
+from bson import BSON
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article
+
+
+class ResourcePostBSONMultiple(unittest.TestCase):
+    """
+    Test if a list of documents in a BSON request body should be wrapped
+    in a document with an `items` key, also if it has one document, and
+    if concatenated documents are refused.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        cls.response = cls.app.post(
+            '/articles/',
+            headers={'content-type': 'application/bson'},
+            data=BSON.encode({'items': [{'title': "Test title"}]})
+        )
+
+        cls.concatenated_response = cls.app.post(
+            '/articles/',
+            headers={'content-type': 'application/bson'},
+            data=(
+                BSON.encode({'title': "Test title 2"}) +
+                BSON.encode({'title': "Test title 3"})
+            )
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_codes(self):
+        """
+        Test if the wrapped list gives a 201 and the concatenated
+        documents a 400.
+        """
+        self.assertEqual(self.response.status_code, 201)
+        self.assertEqual(self.concatenated_response.status_code, 400)
+
+    def test_response(self):
+        """
+        Test if the wrapped list is handled as a list, with a list of
+        one created document in the response.
+        """
+
+        data = json.loads(self.response.data)
+
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]['title'], "Test title")
+
+    def test_documents_created(self):
+        """
+        Test if only the document of the wrapped list was created.
+        """
+        self.assertEqual(
+            [article.title for article in Article.objects],
+            ["Test title"]
+        )
@@ -0,0 +1,64 @@
+import unittest
+import json
+import gzip
+from io import BytesIO
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article
+
+
+class ResourcePostGzip(unittest.TestCase):
+    """
+    Test if documents can be created with a gzip compressed request
+    body.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        body = BytesIO()
+        gzip_file = gzip.GzipFile(fileobj=body, mode='wb')
+        gzip_file.write(json.dumps([
+            {'title': "Test title 1"},
+            {'title': "Test title 2"}
+        ]))
+        gzip_file.close()
+
+        cls.response = cls.app.post(
+            '/articles/',
+            headers={
+                'content-type': 'application/json',
+                'Content-Encoding': 'gzip'
+            },
+            data=body.getvalue()
+        )
+
+        cls.invalid_response = cls.app.post(
+            '/articles/',
+            headers={
+                'content-type': 'application/json',
+                'Content-Encoding': 'gzip'
+            },
+            data="not gzip"
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_codes(self):
+        """
+        Test if the documents are created and the invalid body is
+        rejected.
+        """
+        self.assertEqual(self.response.status_code, 201)
+        self.assertEqual(self.invalid_response.status_code, 400)
+
+    def test_documents_created(self):
+        """
+        Test if both documents were created.
+        """
+        self.assertEqual(Article.objects.count(), 2)
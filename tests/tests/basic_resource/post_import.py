@@ -0,0 +1,78 @@
+import unittest
+import json
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article
+
+
+class ResourcePostImport(unittest.TestCase):
+    """
+    Test if newline-delimited JSON documents can be imported with a POST
+    request, and if the result of each line is returned.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        lines = [
+            json.dumps({'title': "Test title 1"}),
+            json.dumps({'title': "Test title 2"}),
+            '',
+            '{"title": ',
+            json.dumps({'title': "Test title 3", 'text': 123}),
+            json.dumps({'title': "Test title 4"}),
+        ]
+
+        cls.response = cls.app.post(
+            '/articles/',
+            headers={'content-type': 'application/x-ndjson'},
+            data='\n'.join(lines)
+        )
+
+        cls.results = [
+            json.loads(line) for line in cls.response.data.splitlines()
+        ]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_code(self):
+        """
+        Test if the response status code is 200.
+        """
+        self.assertEqual(self.response.status_code, 200)
+
+    def test_results(self):
+        """
+        Test if each non-empty line has a result with the right status.
+        """
+
+        statuses = {
+            result['line']: result['status'] for result in self.results
+        }
+
+        self.assertEqual(statuses, {1: 201, 2: 201, 4: 400, 5: 400, 6: 201})
+
+    def test_documents_inserted(self):
+        """
+        Test if the valid documents were inserted and returned.
+        """
+
+        titles = sorted(
+            result['data']['title']
+            for result in self.results if result['status'] == 201
+        )
+
+        self.assertEqual(
+            titles,
+            ["Test title 1", "Test title 2", "Test title 4"]
+        )
+        self.assertEqual(Article.objects.count(), 3)
+
+        for result in self.results:
+            if result['status'] == 201:
+                self.assertTrue(Article.objects(id=result['data']['id']))
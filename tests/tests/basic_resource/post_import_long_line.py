@@ -0,0 +1,63 @@
+import unittest
+import json
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article
+from apps.basic_resource.resources import ArticleResource
+
+
+class ResourcePostImportLongLine(unittest.TestCase):
+    """
+    Test if a line of an import that is larger than the
+    `max_import_line_size` of the resource gets a 413 result, and if the
+    lines after it are still imported.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        lines = [
+            json.dumps({'title': "Test title 1"}),
+            json.dumps({
+                'title': "Test title 2",
+                'text': 'x' * ArticleResource.max_import_line_size
+            }),
+            json.dumps({'title': "Test title 3"}),
+        ]
+
+        cls.response = cls.app.post(
+            '/articles/',
+            headers={'content-type': 'application/x-ndjson'},
+            data='\n'.join(lines)
+        )
+
+        cls.results = [
+            json.loads(line) for line in cls.response.data.splitlines()
+        ]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_results(self):
+        """
+        Test if the long line has a 413 result and the other lines a 201.
+        """
+
+        statuses = {
+            result['line']: result['status'] for result in self.results
+        }
+
+        self.assertEqual(statuses, {1: 201, 2: 413, 3: 201})
+
+    def test_documents_inserted(self):
+        """
+        Test if only the documents of the other lines were inserted.
+        """
+        self.assertEqual(
+            sorted(article.title for article in Article.objects),
+            ["Test title 1", "Test title 3"]
+        )
@@ -0,0 +1,83 @@
+import unittest
+import json
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article
+
+
+class ResourcePutBulk(unittest.TestCase):
+    """
+    Test if a HTTP PUT request with a list of documents on the listview
+    creates and updates the documents, with a result per document.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        cls.existing_id = "528a5250aa2649ffd8ce8a90"
+        cls.new_id = "528a5250aa2649ffd8ce8a91"
+
+        Article(
+            id=cls.existing_id,
+            title="Test title",
+            text="Test text",
+            tags=['tag1']
+        ).save()
+        Article(title="Unique title").save()
+
+        cls.response = cls.app.put(
+            '/articles/',
+            data=json.dumps([
+                {'id': cls.existing_id, 'title': "Updated title"},
+                {'id': cls.new_id, 'title': "New title", 'tags': ['tag2']},
+                {'title': "No identifier"},
+                {'id': "528a5250aa2649ffd8ce8a92", 'title': "Unique title"}
+            ]),
+            content_type='application/json'
+        )
+        cls.results = json.loads(cls.response.data)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_code(self):
+        """
+        Test if the response status code is 200.
+        """
+        self.assertEqual(self.response.status_code, 200)
+
+    def test_results(self):
+        """
+        Test if every document has its status in the results.
+        """
+        self.assertEqual(
+            [result['status'] for result in self.results],
+            [200, 201, 400, 409]
+        )
+        self.assertEqual(self.results[1]['identifier'], self.new_id)
+
+    def test_updated(self):
+        """
+        Test if the existing document is updated, with the fields that
+        are not in the data kept.
+        """
+
+        article = Article.objects.get(id=self.existing_id)
+
+        self.assertEqual(article.title, "Updated title")
+        self.assertEqual(article.text, "Test text")
+        self.assertEqual(article.tags, ['tag1'])
+
+    def test_created(self):
+        """
+        Test if the new document is created.
+        """
+
+        article = Article.objects.get(id=self.new_id)
+
+        self.assertEqual(article.title, "New title")
+        self.assertEqual(article.tags, ['tag2'])
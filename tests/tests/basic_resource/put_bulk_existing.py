@@ -0,0 +1,107 @@
+import unittest
+import json
+from datetime import datetime
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article, Comment
+
+
+class ResourcePutBulkExisting(unittest.TestCase):
+    """
+    Test if a HTTP PUT request with a list of documents on the listview
+    updates the comments of an existing document like a regular PUT,
+    keeping the readonly and writeonly fields of the comments.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        cls.article_id = "528a5250aa2649ffd8ce8a90"
+        cls.comment_id = "528a5250aa2649ffd8ce8a95"
+        cls.comment_date = datetime(2010, 10, 5)
+
+        Article(
+            id=cls.article_id,
+            title="Test title",
+            text="Test text",
+            comments=[
+                Comment(
+                    id=cls.comment_id,
+                    text="Test comment",
+                    date=cls.comment_date,
+                    email="test@example.com"
+                ),
+                Comment(text="Removed comment")
+            ]
+        ).save()
+
+        cls.response = cls.app.put(
+            '/articles/',
+            data=json.dumps([
+                {
+                    'id': cls.article_id,
+                    'comments': [
+                        {'id': cls.comment_id, 'text': "Updated comment"},
+                        {'text': "New comment"}
+                    ]
+                }
+            ]),
+            content_type='application/json'
+        )
+        cls.results = json.loads(cls.response.data)
+        cls.article = Article.objects.get(id=cls.article_id)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_results(self):
+        """
+        Test if the document is updated.
+        """
+        self.assertEqual(self.response.status_code, 200)
+        self.assertEqual(
+            [result['status'] for result in self.results],
+            [200]
+        )
+
+    def test_fields_kept(self):
+        """
+        Test if the fields that are not in the data are kept.
+        """
+        self.assertEqual(self.article.title, "Test title")
+        self.assertEqual(self.article.text, "Test text")
+
+    def test_comments(self):
+        """
+        Test if the comments are replaced by the comments in the data.
+        """
+        self.assertEqual(
+            [comment.text for comment in self.article.comments],
+            ["Updated comment", "New comment"]
+        )
+
+    def test_existing_comment(self):
+        """
+        Test if the existing comment keeps its id, its readonly date and
+        its writeonly email.
+        """
+
+        comment = self.article.comments[0]
+
+        self.assertEqual(str(comment.id), self.comment_id)
+        self.assertEqual(comment.date, self.comment_date)
+        self.assertEqual(comment.email, "test@example.com")
+
+    def test_new_comment(self):
+        """
+        Test if the new comment gets a new id and the default date.
+        """
+
+        comment = self.article.comments[1]
+
+        self.assertNotEqual(str(comment.id), self.comment_id)
+        self.assertNotEqual(comment.date, None)
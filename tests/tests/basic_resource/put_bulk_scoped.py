@@ -0,0 +1,66 @@
+import unittest
+import json
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article
+
+
+class ResourcePutBulkScoped(unittest.TestCase):
+    """
+    Test if a HTTP PUT request with a list of documents on the listview
+    only updates the documents of the base list of the resource.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        cls.hidden_id = "528a5250aa2649ffd8ce8a90"
+        cls.new_id = "528a5250aa2649ffd8ce8a91"
+
+        Article(id=cls.hidden_id, title="Hidden title", publish=False).save()
+
+        cls.response = cls.app.put(
+            '/published_articles/',
+            data=json.dumps([
+                {'id': cls.hidden_id, 'title': "Changed title"},
+                {'id': cls.new_id, 'title': "New title"}
+            ]),
+            content_type='application/json'
+        )
+        cls.results = json.loads(cls.response.data)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_results(self):
+        """
+        Test if the document outside the base list is refused and the
+        new document is created.
+        """
+        self.assertEqual(
+            [result['status'] for result in self.results],
+            [409, 201]
+        )
+
+    def test_hidden_unchanged(self):
+        """
+        Test if the document outside the base list is not changed.
+        """
+        self.assertEqual(
+            Article.objects.get(id=self.hidden_id).title,
+            "Hidden title"
+        )
+
+    def test_created(self):
+        """
+        Test if the new document is created in the base list.
+        """
+
+        article = Article.objects.get(id=self.new_id)
+
+        self.assertEqual(article.title, "New title")
+        self.assertTrue(article.publish)
@@ -0,0 +1,68 @@
+import unittest
+import json
+from pymongo import MongoClient
+from apps.basic_resource import server
+from apps.basic_resource.documents import Article
+
+
+class ResourcePutIfMatch(unittest.TestCase):
+    """
+    Test if a PUT request with an `If-Match` header only updates the
+    document if it still has the expected version, and if the version is
+    incremented.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.app = server.app.test_client()
+        cls.mongo_client = MongoClient()
+
+        article = Article(title="Test title", version=1.0).save()
+        url = '/versioned_articles/{}/'.format(article.id)
+
+        cls.response = cls.app.put(
+            url,
+            headers={
+                'content-type': 'application/json',
+                'If-Match': '"1.0"'
+            },
+            data=json.dumps({'title': "First update"})
+        )
+
+        cls.conflict_response = cls.app.put(
+            url,
+            headers={
+                'content-type': 'application/json',
+                'If-Match': '"1.0"'
+            },
+            data=json.dumps({'title': "Second update"})
+        )
+
+        cls.article = Article.objects.get(id=article.id)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.unittest_monkful.article.remove()
+
+    def test_status_codes(self):
+        """
+        Test if the first update succeeds and the second fails with a
+        412.
+        """
+        self.assertEqual(self.response.status_code, 200)
+        self.assertEqual(self.conflict_response.status_code, 412)
+
+    def test_version_incremented(self):
+        """
+        Test if the version is incremented and returned as ETag.
+        """
+        self.assertEqual(self.article.version, 2.0)
+        self.assertEqual(self.response.headers['ETag'], '"2.0"')
+        self.assertEqual(json.loads(self.response.data)['version'], 2.0)
+
+    def test_not_overwritten(self):
+        """
+        Test if the second update didn't overwrite the first.
+        """
+        self.assertEqual(self.article.title, "First update")